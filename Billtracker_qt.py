@@ -9,24 +9,37 @@ import os
 import json
 import base64
 try:
-    from cryptography.fernet import Fernet
+    from cryptography.fernet import Fernet, InvalidToken
 except ImportError:
     print("Critical Error: 'cryptography' module not found.")
     print("Please install it using: pip install cryptography")
     sys.exit(1)
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from datetime import datetime, date, timedelta
 import threading
 import webbrowser
 import urllib.request
+import urllib.parse
+import http.client
+import socket
 import ssl
 import ctypes
 import hashlib
+import hmac
+import zlib
 import shutil
+import sqlite3
+import struct
+from array import array
+import bisect
+import operator
+import copy
+import uuid
+from collections.abc import Mapping, MutableMapping
 import csv
 import platform  # For cross-platform detection
 import re  # For input sanitization and validation
+import importlib
+import importlib.util
 
 # Platform-specific imports
 if platform.system() == 'Windows':
@@ -34,6 +47,7 @@ if platform.system() == 'Windows':
     import winsound # For audio notifications
 
 import logging
+import time
 
 # Configure logging
 log_dir = os.path.join(os.path.expanduser('~'), '.bill_tracker')
@@ -45,718 +59,108 @@ logging.basicConfig(
     encoding='utf-8'
 )
 
-# ReportLab Imports
-try:
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import A4
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+# Startup timings (v6.7.0): logged at INFO to app.log even though the app logs WARNING+
+STARTUP_T0 = time.perf_counter()
+startup_log = logging.getLogger('billtracker.startup')
+startup_log.setLevel(logging.INFO)
+
+# Verbose diagnostics (v6.7.0): per-record/per-paint tracing, off unless
+# BILLTRACKER_DIAGNOSTICS=1. Hot paths check the flag before formatting anything.
+DIAGNOSTICS = os.environ.get('BILLTRACKER_DIAGNOSTICS', '') not in ('', '0')
+diag_log = logging.getLogger('billtracker.diagnostics')
+diag_log.setLevel(logging.DEBUG if DIAGNOSTICS else logging.WARNING)
+
+# Heavy or rarely used modules (reportlab, QtNetwork, the KDF, numpy) are
+# imported inside the functions that need them, keeping them out of startup (v6.7.0)
+
+# ReportLab (imported by PDFReportGenerator on the first PDF export)
+REPORTLAB_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+
+# NumPy (optional): vectorized currency conversion, falls back to the array module
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox,
     QMessageBox, QDialog, QFormLayout, QDateEdit, QFileDialog, QProgressBar, QScrollArea, QListWidget,
     QListWidgetItem, QGroupBox, QGridLayout, QDoubleSpinBox, QInputDialog, QListWidgetItem as ListItem,
     QMenu, QAbstractItemView, QGraphicsDropShadowEffect, QGraphicsBlurEffect, QSystemTrayIcon, QTabWidget,
-    QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox, QCalendarWidget, QSpinBox, QDialogButtonBox,
+    QTableWidget, QTableWidgetItem, QTableView, QHeaderView, QCheckBox, QCalendarWidget, QSpinBox, QDialogButtonBox,
     QFrame, QStyle, QAbstractButton
 )
 from PyQt6.QtCore import (
     Qt, QTimer, QSize, QPropertyAnimation, QEasingCurve, QUrl, QDate, QPoint, QRect, QEvent,
-    QThread, pyqtSignal, QRectF
+    QThread, pyqtSignal, QRectF, QObject, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel
 )
-from PyQt6.QtGui import QFont, QColor, QAction, QIcon, QPalette, QPainter, QPen, QBrush, QTextDocument, QShortcut, QKeySequence, QPainterPath
-from PyQt6.QtPrintSupport import QPrinter, QPrintDialog
-from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+from PyQt6.QtGui import QFont, QColor, QAction, QIcon, QPalette, QPainter, QPixmap, QPen, QBrush, QTextDocument, QShortcut, QKeySequence, QPainterPath
 from PyQt6.QtWidgets import QComboBox as _QComboBox
 
-TRANSLATIONS = {
-    'English': {
-        "app_title": "Bill & Savings Tracker",
-        "budget_group_title": "Set Your Budget",
-        "budget_row_title": "Budget Amount",
-        "set_budget_button": "Set Budget",
-        "add_bill_group_title": "Add a New Bill",
-        "bill_name_row": "Bill Name",
-        "amount_row": "Amount",
-        "due_date_row": "Due Date",
-        "add_bill_button": "Add Bill",
-        "summarize_in_label": "Summarize in:",
-        "total_unpaid_label": "Total of Unpaid Bills:",
-        "budget_after_paying_label": "Budget After Paying Bills:",
-        "actions_group_title": "Actions",
-        "converter_button": "Converter",
-        "clear_data_button": "Clear Data",
-        "btn_contact": "Contact",
-        "btn_donate": "Donate",
-        "refresh_rates_button": "Refresh Rates",
-        "settings_button": "Settings",
-        "unpaid_bills_title": "Unpaid Bills",
-        "sort_name_button": "Search Currency",
-        "sort_date_button": "Date",
-        "sort_amount_button": "Amount",
-        "paid_bills_title": "Paid Bills",
-        "credits_label": "made with <3 by Grouvya!",
-        "pay_button": "Pay",
-        "due_on_label": "Due:",
-        "no_date_label": "No Date",
-        "edit_bill_title": "Edit Bill",
-        "bill_name_label": "Bill Name",
-        "amount_label": "Amount",
-        "currency_label": "Currency",
-        "due_date_label": "Due Date",
-        "save_changes_button": "Save Changes",
-        "converter_title": "Currency Converter",
-        "from_label": "From",
-        "to_label": "To",
-        "convert_button": "Convert",
-        "settings_title": "Settings",
-        "data_file_group_title": "Data File Location",
-        "browse_button": "Browse...",
-        "dialog_input_error": "Input Error",
-        "error_enter_name_amount": "Please enter both name and amount.",
-        "error_positive_amount": "Please enter a valid positive amount.",
-        "error_no_exchange_rate": "Could not find exchange rate.",
-        "error_valid_number": "Please enter a valid number for the budget.",
-        "info_budget_set": "Budget Set",
-        "info_budget_set_to": "Budget set to {}",
-        "info_path_saved": "Path Saved",
-        "info_path_saved_msg": "Data file path has been updated.",
-        "info_data_cleared": "Data Cleared",
-        "info_data_cleared_msg": "All data has been cleared.",
-        "dialog_confirm_payment": "Confirm Payment",
-        "confirm_payment_msg": "Are you sure you want to pay '{}'?",
-        "dialog_confirm_delete": "Confirm Delete",
-        "confirm_delete_msg": "Are you sure you want to delete '{}'?",
-        "dialog_clear_data": "Clear All Data",
-        "confirm_clear_data_msg": "Are you sure you want to delete all bills and reset your budget?",
-        "invalid_input": "Invalid Input",
-        "api_error": "API error. Using cached rates.",
-        "network_error": "Network error. Using cached rates.",
-        "rates_updated_at": "Live rates updated: {}",
-        "category_label": "Category",
-        "repeat_label": "Repeat",
-        "frequency_none": "No Repeat",
-        "frequency_weekly": "Weekly",
-        "frequency_monthly": "Monthly",
-        "frequency_yearly": "Yearly",
-        "tab_bills": "Bills",
-        "tab_charts": "Charts",
-        "tab_dashboard": "Dashboard",
-        "tab_unpaid": "Unpaid Bills",
-        "tab_paid": "Paid History",
-        "chart_budget_title": "Budget vs Expenses",
-        "chart_category_title": "Spending by Category",
-        "lbl_yearly": "Yearly",
-        "title_invalid_path": "Invalid Path",
-        "msg_invalid_path_security": "For security reasons, data files must be stored in your user directory.\nSystem directories are not allowed.",
-        "msg_csv_read_failed": "Failed to read CSV: {}",
-        "title_permission_denied": "Permission Denied",
-        "msg_admin_rights_required": "Administrator rights required to modify startup settings.",
-        "notification_title": "Bills Due Soon",
-        "notification_msg": "You have {} bills due today or tomorrow!",
-        "lang_restart_msg": "Language changed. Please restart the application to apply changes.",
-        "lang_group_title": "Language",
-        "btn_mark_paid": "Mark Paid",
-        "btn_view_details": "View Details",
-        # New Translations
-        "chk_start_windows": "Start with Windows",
-        "chk_minimize_tray": "Minimize to Tray on Close",
-        "btn_minimize_tray": "Minimize to Tray",
-        "label_notify_me": "Notify me:",
-        "suffix_days_advance": " days in advance",
-        "btn_save_settings": "Save Settings",
-        "group_backup_restore": "Backup & Restore",
-        "btn_create_backup": "Create Backup",
-        "btn_restore_selected": "Restore Selected",
-        "group_danger_zone": "Danger Zone",
-        "btn_clear_all_data": "Clear All Data",
-        "title_backup_created": "Backup Created",
-        "msg_backup_created": "Manual backup created successfully.",
-        "title_error": "Error",
-        "msg_backup_failed": "Failed to create backup: {}",
-        "title_selection_required": "Selection Required",
-        "msg_select_backup": "Please select a backup to restore.",
-        "title_confirm_restore": "Confirm Restore",
-        "msg_confirm_restore": "Are you sure you want to restore '{}'?\nCurrent data will be overwritten.",
-        "title_restored": "Restored",
-        "msg_restored": "Data restored successfully.",
-        "title_restore_failed": "Restore Failed",
-        "msg_restore_error": "Error restoring backup: {}",
-        "btn_delete_selected": "Delete Selected",
-        "title_confirm_delete_backup": "Confirm Delete",
-        "msg_confirm_delete_backup": "Are you sure you want to delete the backup '{}'?",
-        "msg_backup_deleted": "Backup deleted successfully.",
-        "title_clear_all_data": "Clear All Data",
-        "msg_confirm_clear_1": "Are you sure you want to delete ALL data?\nThis action cannot be undone!",
-        "title_double_confirm": "Double Confirmation",
-        "msg_confirm_clear_2": "Really delete everything? All bills, budget, and settings will be lost.",
-        "title_data_cleared": "Data Cleared",
-        "msg_data_cleared_restart": "All data has been cleared.",
-        "title_restart_required": "Restart Required",
-        "btn_copy_result": "Copy Result",
-        "title_copied": "Copied",
-        "msg_copied": "Result copied to clipboard!",
-        "msg_running_background": "App is running in the background.",
-        "label_monthly_history": "Monthly Spending History",
-        "tab_trends": "Trends",
-        "tab_calendar": "Calendar",
-        "tab_about": "ℹ️ About",
-        "title_quick_status": "Quick Status",
-        "btn_export_csv": "Export CSV",
-        "btn_export_pdf": "Export PDF",
-        "title_save_report": "Save PDF Report",
-        "msg_report_generated": "PDF Report generated successfully!",
-        "msg_report_created": "Report saved to {}",
-        "msg_report_failed": "Failed to generate PDF report. Check logs.",
-        "group_support_data": "Support & Data",
-        "group_quick_status": "Quick Status",
-        "label_filter_category": "Filter by Category:",
-        "item_all_categories": "All Categories",
-        "header_name": "Name",
-        "header_amount": "Amount",
-        "header_category": "Category",
-        "header_due_date": "Due Date",
-        "header_frequency": "Frequency",
-        "header_paid_date": "Paid Date",
-        "label_calendar_hint": "Select a date to see bills.",
-        "msg_no_backups": "No backups found.",
-        "msg_bill_name_long": "Bill name is too long (max 100 chars).",
-        "msg_amount_large": "Amount is too large.",
-        "msg_invalid_format": "Invalid input format.",
-        "msg_data_restored_reload": "Data restored successfully. Reloading...",
-        "msg_data_tampered": "Data Integrity Violation!\n\nThe data file has been modified externally.\nThis could be due to tampering or corruption.\n\nDo you want to restore from the last automatic backup?",
-        "title_invalid_pin": "Invalid PIN",
-        "msg_pin_too_short": "PIN must be at least 4 digits.",
-        "msg_pin_set_enabled": "PIN has been set and enabled.",
-        "title_recurring_created": "Recurring Bill Created",
-        "msg_recurring_created": "Next {} due on {}",
-        "title_export_success": "Export Successful",
-        "msg_export_success": "Data exported to {}",
-        "title_export_failed": "Export Failed",
-        "label_first_run_title": "Welcome to BillTracker!",
-        "label_select_language": "Please select your preferred language:",
-        "btn_start_app": "Start Application",
-        "legend_save_image": "Save Chart as Image",
-        "title_save_chart": "Save Chart",
-        "title_saved": "Saved",
-        "msg_chart_saved": "Chart saved to {}",
-        "btn_search": "Search",
-        "title_select_currency": "Select Currency",
-        "label_search_currency": "Search currency (code, symbol, or name):",
-        "btn_ok": "OK",
-        "btn_cancel": "Cancel",
-        "label_remaining": "Remaining",
-        "label_unpaid_bills_chart": "Unpaid Bills",
-        "label_due_on": "Due on {}: {}",
-        "label_no_bills_due": "No bills due on {}",
-        "filter_csv": "CSV Files (*.csv)",
-        "title_export_data": "Export Data",
-        "categories_list": ["Housing", "Utilities", "Food", "Transport", "Subscription", "Debt", "Healthcare", "Personal", "Other"],
-        "frequencies_list": ["No Repeat", "Weekly", "Monthly", "Yearly"],
-        "label_filter_category": "Filter by Category:",
-        "item_all_categories": "All Categories",
-        "label_total_paid": "Total Paid",
-        "menu_pay_bill": "Pay Bill",
-        "menu_edit_bill": "Edit Bill",
-        "menu_delete_bill": "Delete Bill",
-        "menu_restore_unpaid": "Restore to Unpaid",
-        "menu_delete_permanently": "Delete Permanently",
-        "title_confirm_delete_history": "Confirm Delete",
-        "msg_confirm_delete_history": "Are you sure you want to delete '{}' from history?",
-        "title_no_history": "No History",
-        "msg_no_history": "No paid bills found.",
-        "btn_contact": "📩 Contact",
-        "btn_donate": "💳 Donate",
-        "credits_link": "Created by Grouvya!",
-        "btn_search": "Search Bills",
-        "title_search": "Search Bills",
-        "label_search_hint": "Search by name, amount, category, or date...",
-        "header_status": "Status",
-        "status_unpaid": "Unpaid",
-        "status_paid": "Paid",
-        "menu_view_details": "View Details",
-        "msg_no_results": "No bills found matching your search.",
-        "label_shortcut_search": "Press Ctrl+F to Search",
-        "label_shortcut_add": "Press Ctrl+N to Add Bill",
-        "title_success": "Success",
-        "msg_bill_added": "Bill '{}' added successfully!",
-        "title_manage_categories": "Manage Categories",
-        "label_manage_categories_hint": "Manage your custom categories:",
-        "placeholder_new_category": "New Category Name",
-        "btn_add": "Add",
-        "btn_remove": "Remove",
-        "label_pin_unlock": "Enter PIN to unlock:",
-        "label_pin_set_new": "Set new 4-6 digit PIN:",
-        "btn_unlock": "Unlock",
-        "label_confirm_pin": "Confirm PIN:",
-        "placeholder_confirm_pin": "****",
-        "label_pin_hint_setup": "PIN Hint (optional):",
-        "placeholder_hint": "e.g., birthday, year...",
-        "msg_pins_dont_match": "PINs do not match. Please try again.",
-        "msg_pin_hint_prefix": "Hint: {}",
-        "msg_confirm_disable_pin": "Enter current PIN to disable protection:",
-        "btn_save_pin": "Save PIN",
-        "group_security_pin": "Security (PIN Protection)",
-        "chk_enable_pin": "Enable PIN Protection",
-        "btn_set_change_pin": "Set/Change PIN",
-        # Auto-lock
-        "chk_auto_lock": "Auto-lock on idle",
-        "chk_lock_on_minimize": "Lock when minimized",
-        "label_idle_timeout": "Lock after",
-        "title_exit_min": "Exit or Minimize?",
-        "msg_exit_min": "Do you want to minimize to tray or close the application?",
-        "btn_minimize": "Minimize",
-        "btn_exit": "Close App",
-        "suffix_minutes": " minutes",
-        "msg_app_locked": "Application Locked",
-        "msg_enter_pin_unlock": "Enter your PIN to unlock",
-        # Brute-force protection
-        "msg_too_many_attempts": "Too many failed attempts!",
-        "msg_locked_out_until": "Locked out until: {time}",
-        "msg_attempts_remaining": "Attempts remaining: {count}",
-        "btn_reset_app": "Reset App",
-        "title_reset_app": "Reset Application",
-        "msg_reset_warning": "⚠️ Factory Reset\n\nThis will DELETE ALL your bills, settings, and PIN.\n\nAre you sure?",
-        "title_final_warning": "FINAL WARNING",
-        "msg_final_warning": "This action cannot be undone.\n\nALL DATA WILL BE LOST PERMANENTLY.\n\nProceed?",
-        "title_reset_complete": "Reset Complete",
-        "msg_reset_complete": "Application has been reset.\nPlease restart the app.",
-        "msg_reset_error": "Failed to reset: {}",
-        "btn_factory_reset_full": "Factory Reset (Delete All Data & Configs)",
-        "title_factory_reset": "Factory Reset",
-        "title_confirm_reset": "Confirm Reset",
-        "msg_reset_success_close": "Application reset successful.\nThe application will now close.",
-        "msg_factory_reset_warning": "⚠️ You are about to DELETE ALL DATA.\n\nThis will remove:\n- All Bills\n- All Settings\n- PIN & Security\n- Backups\n\nThis cannot be undone.",
-        "msg_type_delete": "Type 'DELETE' to confirm:",
-        "title_export_error": "Export Error",
-        "title_access_denied": "Access Denied",
-        "msg_pin_fail_exit": "Incorrect PIN. Attempts remaining: {count}. App will close.",
-        
-        # Backup & Restore strings
-        "group_backups": "Backups & Recovery",
-        "lbl_backup_location": "Archive Location",
-        "btn_backup_config": "Backup Config",
-        "btn_backup_data": "Backup Data",
-        "btn_restore_config": "Restore Config",
-        "btn_restore_data": "Restore Data",
-        "btn_reset_default": "Default",
-        "msg_restore_warning": "Warning: This will overwrite your current data/settings. Continue?",
-        "msg_restart_required": "Application restart required to apply changes.",
-        "msg_backup_success": "Backup created successfully!",
-        "title_backup_config": "Save Config Backup",
-        "title_backup_data": "Save Data Backup",
-        "title_restore_config": "Select Config to Restore",
-        "title_restore_data": "Select Data to Restore",
-        "msg_select_single_restore": "Please select only one backup to restore.",
-        "msg_batch_delete_success": "{} backup(s) deleted successfully.",
-        "msg_confirm_delete_backup_batch": "Are you sure you want to delete {} backups?",
-        
-        # Categories
-        "msg_lockout_wait": "Account locked due to too many failed PIN attempts.\n\nLocked out until: {time}\n\nPlease try again later.",
-        "msg_lockout_new": "Too many failed PIN attempts!\n\nAccount locked for 5 minutes.\n\nLocked out until: {time}",
-        "msg_loading_config": "Loading configuration...",
-        "msg_init_security": "Initializing security...",
-        "msg_loading_rates": "Loading exchange rates...",
-        "msg_prep_interface": "Preparing interface...",
-        "msg_finalizing": "Finalizing...",
-        "title_secure_access": "BillTracker - Secure Access",
-        # v6.2.0 Strings
-        "tab_notifications": "Notifications",
-        "lbl_webhook_url": "Webhook URL (Discord/Slack/Telegram)",
-        "lbl_reminder_time": "Daily Reminder Time",
-        "btn_test_webhook": "Test Webhook",
-        "msg_webhook_test_sent": "Test notification sent to webhook!",
-        "msg_webhook_error": "Webhook failed: {}",
-        "btn_switch_mini": "Mini Mode",
-        "title_mini_mode": "Mini Tracker",
-        "lbl_budget_rem": "Remaining Budget:",
-        "lbl_due_today": "Due Today:",
-        "lbl_overdue": "Overdue",
-        "lbl_total_saved": "Total Saved:",
-        "lbl_no_file_selected": "No file selected",
-        "lbl_preview_top_5": "Preview (Top 5 lines):",
-        "lbl_cloud_sync_desc": "App will automatically save an encrypted copy for syncing.",
-        "btn_pick_color": "Pick Custom Color",
-        "group_column_mapping": "Column Mapping",
-        "group_general_settings": "General Settings",
-        "group_aesthetics": "Aesthetics",
-        "group_cloud_sync": "Cloud Sync",
-        "title_language_selection": "Language Selection",
-        "title_security_alert": "Security Alert",
-        "btn_full_mode": "Full App",
-        "group_notif_settings": "Notification Settings",
-        "chk_enable_webhooks": "Enable Webhook Notifications",
-        # v6.3.0 Strings
-        "tab_subscriptions": "Subscriptions",
-        "btn_import_csv": "Import Bank Statement",
-        "lbl_burn_rate": "Monthly Burn Rate",
-        "lbl_trend_30d": "30-Day Trend",
-        "title_csv_import": "Import CSV",
-        "msg_csv_mapped": "Mapped {} bills from CSV.",
-        "msg_csv_invalid": "No valid transactions found in CSV.",
-        "btn_select_csv": "Select CSV",
-        "lbl_map_name": "Name Column",
-        "lbl_map_amount": "Amount Column",
-        "lbl_map_date": "Date Column",
-        "chk_is_subscription": "Mark as Subscription",
-        "tab_savings": "Savings",
-        "lbl_yearly_burn": "Yearly Burn Rate",
-        "lbl_days_until": "Days until payment",
-        "lbl_savings_goals": "Savings Goals",
-        "btn_add_goal": "Add Goal",
-        "btn_add_savings": "Add Savings",
-        "lbl_goal_name": "Goal Name",
-        "lbl_target_amount": "Target Amount",
-        "lbl_current_amount": "Current Amount",
-        "tab_about": "ℹ️ About",
-    },
-    'Georgian': {
-        "app_title": "ხარჯების და გადასახადების ტრეკერი",
-        "budget_group_title": "ბიუჯეტის განსაზღვრა",
-        "budget_row_title": "ბიუჯეტის რაოდენობა",
-        "set_budget_button": "ბიუჯეტის შენახვა",
-        "add_bill_group_title": "ახალი გადასახადის დამატება",
-        "bill_name_row": "დასახელება",
-        "amount_row": "თანხა",
-        "due_date_row": "გადახდის თარიღი",
-        "add_bill_button": "დამატება",
-        "summarize_in_label": "ჯამური ვალუტა:",
-        "total_unpaid_label": "სულ გადასახდელი:",
-        "budget_after_paying_label": "დარჩენილი ბიუჯეტი:",
-        "actions_group_title": "მოქმედებები",
-        "converter_button": "კონვერტერი",
-        "clear_data_button": "მონაცემების წაშლა",
-        "btn_contact": "კონტაქტი",
-        "btn_donate": "დონაცია",
-        "refresh_rates_button": "კურსების განახლება",
-        "settings_button": "პარამეტრები",
-        "unpaid_bills_title": "გადასახდელი ბილეთები",
-        "sort_name_button": "ვალუტის ძებნა",
-        "sort_date_button": "თარიღი",
-        "sort_amount_button": "თანხა",
-        "paid_bills_title": "გადახდილი ისტორია",
-        "credits_label": "შექმნილია <3 Grouvya-ს მიერ!",
-        "pay_button": "გადახდა",
-        "due_on_label": "ვადა:",
-        "no_date_label": "უვადო",
-        "edit_bill_title": "რედაქტირება",
-        "bill_name_label": "დასახელება",
-        "amount_label": "თანხა",
-        "currency_label": "ვალუტა",
-        "due_date_label": "ვადა",
-        "save_changes_button": "შენახვა",
-        "converter_title": "ვალუტის კონვერტერი",
-        "from_label": "დან",
-        "to_label": "ში",
-        "convert_button": "კონვერტაცია",
-        "settings_title": "პარამეტრები",
-        "data_file_group_title": "მონაცემთა ფაილი",
-        "browse_button": "არჩევა...",
-        "dialog_input_error": "შეცდომა",
-        "error_enter_name_amount": "გთხოვთ შეიყვანოთ სახელი და თანხა.",
-        "error_positive_amount": "გთხოვთ შეიყვანოთ დადებითი თანხა.",
-        "error_no_exchange_rate": "კურსი ვერ მოიძებნა.",
-        "error_valid_number": "ბიუჯეტი უნდა იყოს რიცხვი.",
-        "info_budget_set": "ბიუჯეტი შენახულია",
-        "info_budget_set_to": "ბიუჯეტი განისაზღვრა: {}",
-        "info_path_saved": "გზა შენახულია",
-        "info_path_saved_msg": "მონაცემთა ფაილის მისამართი განახლდა.",
-        "info_data_cleared": "მონაცემები წაიშალა",
-        "info_data_cleared_msg": "ყველა მონაცემი წაშლილია.",
-        "dialog_confirm_payment": "გადახდის დადასტურება",
-        "confirm_payment_msg": "ნამდვილად გსურთ გადაიხადოთ '{}'?",
-        "dialog_confirm_delete": "წაშლის დადასტურება",
-        "confirm_delete_msg": "ნამდვილად გსურთ წაშალოთ '{}'?",
-        "dialog_clear_data": "ყველაფრის წაშლა",
-        "confirm_clear_data_msg": "ნამდვილად გსურთ წაშალოთ ყველა მონაცემი?",
-        "invalid_input": "არასწორი მონაცემი",
-        "api_error": "API შეცდომა. კურსები ქეშიდან.",
-        "network_error": "ქსელის შეცდომა. კურსები ქეშიდან.",
-        "rates_updated_at": "განახლდა: {}",
-        "category_label": "კატეგორია",
-        "repeat_label": "გამეორება",
-        "frequency_none": "არ განმეორდეს",
-        "frequency_weekly": "კვირაში ერთხელ",
-        "frequency_monthly": "თვეში ერთხელ",
-        "frequency_yearly": "წელიწადში ერთხელ",
-        "tab_bills": "გადასახადები",
-        "tab_charts": "გრაფიკები",
-        "tab_dashboard": "დაფა",
-        "tab_unpaid": "გადასახდელი",
-        "tab_paid": "ისტორია",
-        "chart_budget_title": "ბიუჯეტი vs ხარჯები",
-        "chart_category_title": "ხარჯები კატეგორიების მიხედვით",
-        "lbl_yearly": "წლიური",
-        "title_invalid_path": "არასწორი მისამართი",
-        "msg_invalid_path_security": "უსაფრთხოების მიზნით, ფაილები უნდა შეინახოს მომხმარებლის საქაღალდეში.\nსისტემური საქაღალდეები აკრძალულია.",
-        "msg_csv_read_failed": "CSV-ს ჩატვირთვა ვერ მოხერხდა: {}",
-        "title_permission_denied": "წვდომა აკრძალულია",
-        "msg_admin_rights_required": "საჭიროა ადმინისტრატორის უფლებები პარამეტრების შესაცვლელად.",
-        "notification_title": "მოახლოებული გადასახადები",
-        "notification_msg": "თქვენ გაქვთ {} გადასახადი დღეს ან ხვალ!",
-        "lang_restart_msg": "ენა შეიცვალა. ცვლილებების ასახვისთვის გთხოვთ გადატვირთოთ პროგრამა.",
-        "lang_group_title": "ენა",
-        # New Translations (Georgian)
-        "chk_start_windows": "Windows-თან ერთად ჩართვა",
-        "chk_minimize_tray": "ჩაკეცვა დახურვისას",
-        "btn_minimize_tray": "სისტემურ ზონაში ჩაკეცვა",
-        "label_notify_me": "შემატყობინე:",
-        "suffix_days_advance": " დღით ადრე",
-        "btn_save_settings": "პარამეტრების შენახვა",
-        "group_backup_restore": "მონაცემთა არქივი",
-        "btn_create_backup": "არქივის შექმნა",
-        "btn_restore_selected": "არქივიდან აღდგენა",
-        "group_danger_zone": "საშიში ზონა",
-        "btn_clear_all_data": "ყველაფრის წაშლა",
-        "title_backup_created": "არქივი შეიქმნა",
-        "msg_backup_created": "მონაცემთა არქივი წარმატებით შეიქმნა.",
-        "title_error": "შეცდომა",
-        "msg_backup_failed": "არქივის შექმნა ვერ მოხერხდა: {}",
-        "title_selection_required": "აირჩიეთ ფაილი",
-        "msg_select_backup": "გთხოვთ აირჩიოთ სარეზერვო ფაილი აღსადგენად.",
-        "title_confirm_restore": "აღდგენის დადასტურება",
-        "msg_confirm_restore": "ნამდვილად გსურთ აღადგინოთ '{}'?\nმიმდინარე მონაცემები გადაიწერება.",
-        "title_restored": "აღდგენილია",
-        "msg_restored": "მონაცემები წარმატებით აღდგა.",
-        "title_restore_failed": "აღდგენა ვერ მოხერხდა",
-        "msg_restore_error": "შეცდომა აღდგენისას: {}",
-        "btn_delete_selected": "არჩეულის წაშლა",
-        "title_confirm_delete_backup": "წაშლის დადასტურება",
-        "msg_confirm_delete_backup": "ნამდვილად გსურთ წაშალოთ არქივი '{}'?",
-        "msg_confirm_delete_backup_batch": "ნამდვილად გსურთ წაშალოთ {} არქივი?",
-        "msg_backup_deleted": "არქივი წარმატებით წაიშალა.",
-        "title_clear_all_data": "მონაცემების წაშლა",
-        "msg_confirm_clear_1": "ნამდვილად გსურთ წაშალოთ ყველა მონაცემი?\nამ მოქმედების გაუქმება შეუძლებელია!",
-        "title_double_confirm": "ორმაგი დადასტურება",
-        "msg_confirm_clear_2": "ნამდვილად შლით ყველაფერს? ყველა მონაცემი დაიკარგება.",
-        "title_data_cleared": "მონაცემები წაიშალა",
-        "msg_data_cleared_restart": "ყველა მონაცემი წაშლილია.",
-        "title_restart_required": "საჭიროა გადატვირთვა",
-        "btn_copy_result": "შედეგის კოპირება",
-        "title_copied": "კოპირებულია",
-        "msg_copied": "შედეგი დაკოპირდა ბუფერში!",
-        "msg_running_background": "პროგრამა აგრძელებს მუშაობას ფონურ რეჟიმში.",
-        "label_monthly_history": "თვის ხარჯების ისტორია",
-        "tab_trends": "ტრენდები",
-        "tab_calendar": "კალენდარი",
-        "tab_about": "პროგრამის შესახებ",
-        "title_quick_status": "სწრაფი სტატუსი",
-        "btn_export_csv": "CSV ექსპორტი",
-        "btn_export_pdf": "PDF ექსპორტი",
-        "title_save_report": "PDF რეპორტის შენახვა",
-        "msg_report_generated": "PDF რეპორტი წარმატებით შეიქმნა!",
-        "msg_report_created": "რეპორტი შეინახა: {}",
-        "msg_report_failed": "PDF რეპორტის შექმნა ვერ მოხერხდა.",
-        "group_support_data": "მხარდაჭერა და მონაცემები",
-        "group_quick_status": "სწრაფი სტატუსი",
-        "label_filter_category": "ფილტრი კატეგორიით:",
-        "item_all_categories": "ყველა კატეგორია",
-        "header_name": "სახელი",
-        "header_amount": "თანხა",
-        "header_category": "კატეგორია",
-        "header_due_date": "ვადა",
-        "header_frequency": "სიხშირე",
-        "header_paid_date": "გადახდის თარიღი",
-        "label_calendar_hint": "აირჩიეთ თარიღი გადასახადების სანახავად.",
-        "msg_no_backups": "არქივები ვერ მოიძებნა.",
-        "msg_bill_name_long": "დასახელება ძალიან გრძელია (მაქს. 100 სიმბოლო).",
-        "msg_amount_large": "თანხა ძალიან დიდია.",
-        "msg_invalid_format": "არასწორი ფორმატი.",
-        "msg_data_restored_reload": "მონაცემები აღდგენილია. ჩატვირთვა...",
-        "msg_data_tampered": "მონაცემების ვერიფიკაცია ვერ მოხერხდა!\n\nფაილი გარედან არის შეცვლილი.\nგსურთ ბოლო არქივის აღდგენა?",
-        "title_invalid_pin": "არასწორი PIN",
-        "msg_pin_too_short": "PIN უნდა იყოს მინიმუმ 4 ციფრიანი.",
-        "msg_pin_set_enabled": "PIN დაყენებული და გააქტიურებულია.",
-        "title_recurring_created": "განმეორებადი გადასახადი შეიქმნა",
-        "msg_recurring_created": "შემდეგი გადასახადი {} იქნება {} -ში",
-        "title_export_success": "ექსპორტი წარმატებულია",
-        "msg_export_success": "მონაცემები ექსპორტირებულია: {}",
-        "title_export_failed": "ექსპორტი ვერ მოხერხდა",
-        "label_first_run_title": "მოგესალმებათ BillTracker-ში!",
-        "label_select_language": "გთხოვთ აირჩიოთ სასურველი ენა:",
-        "btn_start_app": "პროგრამის გაშვება",
-        "legend_save_image": "შენახვა სურათად",
-        "title_save_chart": "გრაფიკის შენახვა",
-        "title_saved": "შენახულია",
-        "msg_chart_saved": "გრაფიკი შენახულია: {}",
-        "btn_search": "ძებნა",
-        "title_select_currency": "აირჩიეთ ვალუტა",
-        "label_search_currency": "მოძებნეთ ვალუტა (კოდი, სიმბოლო ან სახელი):",
-        "btn_ok": "OK",
-        "btn_cancel": "გაუქმება",
-        "label_remaining": "დარჩენილი",
-        "label_unpaid_bills_chart": "გადასახდელი",
-        "label_due_on": "გადასახდელია {}: {}",
-        "label_no_bills_due": "არ არის გადასახდელი {}-ში",
-        "filter_csv": "CSV ფაილები (*.csv)",
-        "title_export_data": "მონაცემების ექსპორტი",
-        "categories_list": ["ბინა", "კომუნალურები", "საკვები", "ტრანსპორტი", "გამოწერები", "ვალები", "ჯანდაცვა", "პირადი", "სხვა"],
-        "frequencies_list": ["არ განმეორდეს", "კვირეული", "თვიური", "წლიური"],
-        "label_filter_category": "კატეგორიის ფილტრი:",
-        "item_all_categories": "ყველა კატეგორია",
-        "label_total_paid": "სულ გადახდილი",
-        "menu_pay_bill": "გადახდა",
-        "menu_edit_bill": "რედაქტირება",
-        "menu_delete_bill": "წაშლა",
-        "menu_restore_unpaid": "გადატანა გადასახდელში",
-        "menu_delete_permanently": "სამუდამოდ წაშლა",
-        "title_confirm_delete_history": "წაშლის დადასტურება",
-        "msg_confirm_delete_history": "ნამდვილად გსურთ '{}'-ს წაშლა ისტორიიდან?",
-        "title_no_history": "ისტორია ცარიელია",
-        "msg_no_history": "გადახდილი გადასახადები ვერ მოიძებნა.",
-        "btn_contact": "📩 კონტაქტი",
-        "btn_donate": "💳 დონაცია",
-        "credits_link": "შექმნილია Grouvya-ს მიერ!",
-        "btn_search": "ძებნა",
-        "title_search": "გადასახადების ძებნა",
-        "label_search_hint": "მოძებნეთ სახელით, თანხით, კატეგორიით ან თარიღით...",
-        "header_status": "სტატუსი",
-        "status_unpaid": "გადასახდელი",
-        "status_paid": "გადახდილი",
-        "menu_view_details": "დეტალები",
-        "msg_no_results": "არ მოიძებნა შესაბამისი გადასახადი.",
-        "label_shortcut_search": "დააჭირეთ Ctrl+F ძებნისთვის",
-        "label_shortcut_add": "დააჭირეთ Ctrl+N დასამატებლად",
-        "title_success": "წარმატება",
-        "msg_bill_added": "გადასახადი '{}' წარმატებით დაემატა!",
-        "title_manage_categories": "კატეგორიების მართვა",
-        "label_manage_categories_hint": "მართეთ თქვენი პერსონალური კატეგორიები:",
-        "placeholder_new_category": "ახალი კატეგორიის სახელი",
-        "btn_add": "დამატება",
-        "btn_remove": "წაშლა",
-        "label_pin_unlock": "PIN კოდის შეყვანა:",
-        "label_pin_set_new": "შეიყვანეთ ახალი 4-6 ციფრიანი PIN:",
-        "label_confirm_pin": "დაადასტურეთ PIN:",
-        "placeholder_confirm_pin": "****",
-        "label_pin_hint_setup": "PIN მინიშნება (არასავალდებულო):",
-        "placeholder_hint": "მაგ: დაბადების წელი...",
-        "msg_pins_dont_match": "PIN კოდები არ ემთხვევა. სცადეთ თავიდან.",
-        "msg_pin_hint_prefix": "მინიშნება: {}",
-        "msg_confirm_disable_pin": "შეიყვანეთ მიმდინარე PIN-კოდი დაცვის გამოსართავად:",
-        "btn_unlock": "განბლოკვა",
-        "btn_save_pin": "PIN-ის შენახვა",
-        "group_security_pin": "უსაფრთხოება (PIN დაცვა)",
-        "chk_enable_pin": "PIN დაცვის ჩართვა",
-        "btn_set_change_pin": "PIN-ის დაყენება/შეცვლა",
-        # Auto-lock
-        "chk_auto_lock": "ავტომატური ბლოკირება უმოქმედობისას",
-        "chk_lock_on_minimize": "დაბლოკვა ჩაკეცვისას",
-        "label_idle_timeout": "დაბლოკვა შემდეგ",
-        "title_exit_min": "გასვლა თუ ჩაკეცვა?",
-        "msg_exit_min": "გსურთ აპლიკაციის ჩაკეცვა თუ დახურვა?",
-        "btn_minimize": "ჩაკეცვა",
-        "btn_exit": "დახურვა",
-        "suffix_minutes": " წუთის შემდეგ",
-        "msg_app_locked": "აპლიკაცია დაბლოკილია",
-        "msg_enter_pin_unlock": "შეიყვანეთ PIN განსაბლოკად",
-        # Brute-force protection
-        "msg_too_many_attempts": "ძალიან ბევრი წარუმატებელი მცდელობა!",
-        "msg_locked_out_until": "დაბლოკილია შემდეგ დრომდე: {time}",
-        "msg_attempts_remaining": "დარჩენილი მცდელობები: {count}",
-        "btn_reset_app": "აპლიკაციის განულება",
-        "title_reset_app": "აპლიკაციის განულება",
-        "msg_reset_warning": "⚠️ ქარხნული პარამეტრები\n\nეს წაშლის ყველა გადასახადს, პარამეტრს და PIN კოდს.\n\nდარწმუნებული ხართ?",
-        "title_final_warning": "საბოლოო გაფრთხილება",
-        "msg_final_warning": "ამ მოქმედების გაუქმება შეუძლებელია.\n\nყველა მონაცემი სამუდამოდ დაიკარგება.\n\nგსურთ გაგრძელება?",
-        "title_reset_complete": "განულება დასრულდა",
-        "msg_reset_complete": "აპლიკაცია განულდა.\nგთხოვთ გადატვირთოთ პროგრამა.",
-        "msg_reset_error": "განულება ვერ მოხერხდა: {}",
-        "btn_factory_reset_full": "ქარხნული პარამეტრები (ყველა მონაცემის წაშლა)",
-        "btn_mark_paid": "გადახდა",
-        "btn_view_details": "დეტალები",
-        "title_factory_reset": "ქარხნული პარამეტრები",
-        "title_confirm_reset": "განულების დადასტურება",
-        "msg_reset_success_close": "განულება წარმატებით დასრულდა.\nაპლიკაცია დაიხურება.",
-        "msg_factory_reset_warning": "⚠️ თქვენ აპირებთ ყველა მონაცემის წაშლას.\n\nწაიშლება:\n- ყველა გადასახადი\n- ყველა პარამეტრი\n- PIN და დაცვა\n- არქივები\n\nამ მოქმედების გაუქმება შეუძლებელია.",
-        "msg_type_delete": "აკრიფეთ 'DELETE' დასადასტურებლად:",
-        "title_export_error": "ექსპორტის შეცდომა",
-        "title_access_denied": "წვდომა აკრძალულია",
-        "msg_pin_fail_exit": "PIN არასწორია. დარჩენილი ცდები: {count}. აპლიკაცია დაიხურება.",
-
-        # Backup & Restore strings
-        "group_backups": "სარეზერვო ასლები & აღდგენა",
-        "lbl_backup_location": "არქივის მდებარეობა",
-        "btn_backup_config": "პარამეტრების შენახვა",
-        "btn_backup_data": "მონაცემების შენახვა",
-        "btn_restore_config": "პარამეტრების აღდგენა",
-        "btn_restore_data": "მონაცემების აღდგენა",
-        "btn_reset_default": "ნაგულისხმევი",
-        "msg_restore_warning": "გაფრთხილება: ეს მოქმედება წაშლის მიმდინარე მონაცემებს. გსურთ გაგრძელება?",
-        "msg_restart_required": "ცვლილებების ასახვისთვის საჭიროა პროგრამის გადატვირთვა.",
-        "msg_backup_success": "სარეზერვო ასლი წარმატებით შეიქმნა!",
-        "title_backup_config": "პარამეტრების ასლის შენახვა",
-        "title_backup_data": "მონაცემების ასლის შენახვა",
-        "title_restore_config": "აირჩიეთ აღსადგენი ფაილი",
-        "title_restore_data": "აირჩიეთ აღსადგენი მონაცემები",
-
-        # Categories
-        "msg_lockout_wait": "ანგარიში დაბლოკილია.\n\nდაბლოკილია: {time}-მდე.\n\nგთხოვთ სცადოთ მოგვიანებით.",
-        "msg_lockout_new": "ძალიან ბევრი წარუმატებელი მცდელობა!\n\nანგარიში დაბლოკილია 5 წუთით.\n\nდაბლოკილია: {time}-მდე.",
-        "msg_loading_config": "კონფიგურაციის ჩატვირთვა...",
-        "msg_init_security": "უსაფრთხოების ინიციალიზაცია...",
-        "msg_loading_rates": "გაცვლითი კურსების ჩატვირთვა...",
-        "msg_prep_interface": "ინტერფეისის მომზადება...",
-        "msg_finalizing": "დასრულება...",
-        "title_secure_access": "BillTracker - უსაფრთხო წვდომა",
-        "msg_select_single_restore": "გთხოვთ აირჩიოთ მხოლოდ ერთი არქივი.",
-        "msg_batch_delete_success": "{} არქივი წარმატებით წაიშალა.",
-        "msg_confirm_batch_delete": "დარწმუნებული ხართ რომ გსურთ {} არქივის წაშლა?",
-        # v6.2.0 Strings
-        "tab_notifications": "შეტყობინებები",
-        "lbl_webhook_url": "Webhook-ის მისამართი (Discord/Slack/Telegram)",
-        "lbl_reminder_time": "ყოველდღიური შეხსენება",
-        "btn_test_webhook": "ტესტირება",
-        "msg_webhook_test_sent": "სატესტო შეტყობინება გაიგზავნა!",
-        "msg_webhook_error": "შეტყობინება ვერ გაიგზავნ: {}",
-        "btn_switch_mini": "მინი რეჟიმი",
-        "title_mini_mode": "მინი ტრეკერი",
-        "lbl_budget_rem": "დარჩენილი ბიუჯეტი:",
-        "lbl_due_today": "დღეს გადასახდელი:",
-        "lbl_overdue": "ვადაგადაცილებული",
-        "lbl_total_saved": "სულ დაზოგილი:",
-        "lbl_no_file_selected": "ფაილი არ არის არჩეული",
-        "lbl_preview_top_5": "გადახედვა (ზედა 5 ხაზი):",
-        "lbl_cloud_sync_desc": "აპლიკაცია ავტომატურად შეინახავს დაშიფრულ ასლს სინქრონიზაციისთვის.",
-        "btn_pick_color": "ფერის არჩევა",
-        "group_column_mapping": "სვეტების შესაბამისობა",
-        "group_general_settings": "ზოგადი პარამეტრები",
-        "group_aesthetics": "ვიზუალი",
-        "group_cloud_sync": "ღრუბლოვანი სინქრონიზაცია",
-        "title_language_selection": "ენის არჩევა",
-        "title_security_alert": "უსაფრთხოების გაფრთხილება",
-        "btn_full_mode": "აპლიკაცია",
-        "group_notif_settings": "შეტყობინებების პარამეტრები",
-        "chk_enable_webhooks": "Webhook შეტყობინებების ჩართვა",
-        # v6.3.0 Strings (Georgian)
-        "tab_subscriptions": "გამოწერები",
-        "btn_import_csv": "ბანკის ამონაწერის იმპორტი",
-        "lbl_burn_rate": "ყოველთვიური დახარჯვა",
-        "lbl_trend_30d": "30-დღიანი ტრენდი",
-        "title_csv_import": "CSV იმპორტი",
-        "msg_csv_mapped": "იმპორტირებულია {} გადასახადი.",
-        "msg_csv_invalid": "CSV-ში ვალიდური მონაცემები ვერ მოიძებნა.",
-        "btn_select_csv": "აირჩიეთ CSV",
-        "lbl_map_name": "სახელის სვეტი",
-        "lbl_map_amount": "თანხის სვეტი",
-        "lbl_map_date": "თარიღის სვეტი",
-        "chk_is_subscription": "მონიშნე როგორც გამოწერა",
-        "tab_savings": "დანაზოგები",
-        "lbl_yearly_burn": "წლიური ხარჯი",
-        "lbl_days_until": "გადახდამდე დარჩენილია",
-        "lbl_savings_goals": "დაგროვების მიზნები",
-        "btn_add_goal": "მიზნის დამატება",
-        "btn_add_savings": "შენატანი",
-        "lbl_goal_name": "მიზნის სახელი",
-        "lbl_target_amount": "გეგმა",
-        "lbl_current_amount": "ამჟამად",
-        "tab_about": "ℹ️ შესახებ",
-    }
-}
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    try:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        base_path = sys._MEIPASS
+    except Exception:
+        # Robust fallback: use script directory
+        base_path = os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals() else os.path.abspath(".")
+
+    return os.path.join(base_path, relative_path)
+
+
+class TranslationCatalogs(Mapping):
+    """Language name -> strings, read from translations/<language>.json on first use (v6.7.0).
+
+    Only the active language (plus English, which holds the canonical keys) is
+    ever parsed. Reverse indexes (display text -> canonical key) for the list
+    entries are built once per language so canonicalization is a dict lookup.
+    """
+    LANGUAGES = ('English', 'Georgian')
+
+    def __init__(self, directory='translations'):
+        self.directory = directory
+        self._catalogs = {}
+        self._reverse = {}
+
+    def __getitem__(self, language):
+        if language not in self.LANGUAGES:
+            raise KeyError(language)
+        catalog = self._catalogs.get(language)
+        if catalog is None:
+            path = resource_path(os.path.join(self.directory, f'{language}.json'))
+            with open(path, 'r', encoding='utf-8') as f:
+                catalog = json.load(f)
+            self._catalogs[language] = catalog
+        return catalog
+
+    def __iter__(self):
+        return iter(self.LANGUAGES)
+
+    def __len__(self):
+        return len(self.LANGUAGES)
+
+    def __contains__(self, language):
+        return language in self.LANGUAGES
+
+    def canonical(self, list_key, display_text):
+        """Canonical English entry for display_text from any language's list_key, or None."""
+        canonical = self['English'].get(list_key, [])
+        for language in self.LANGUAGES:
+            index = self._reverse.get((language, list_key))
+            if index is None:
+                try:
+                    entries = self[language].get(list_key, [])
+                except (OSError, ValueError) as e:
+                    logging.error(f"Could not load '{language}' translations: {e}")
+                    entries = []
+                index = {}
+                for entry, key in zip(entries, canonical):
+                    index.setdefault(entry, key)
+                self._reverse[(language, list_key)] = index
+            if display_text in index:
+                return index[display_text]
+        return None
+
+TRANSLATIONS = TranslationCatalogs()
 
 class SafeStrings:
     """Wrapper for translation dictionary that prevents KeyError crashes."""
@@ -809,52 +213,32 @@ FREQUENCIES = STRINGS["frequencies_list"]
 CANONICAL_CATEGORIES = TRANSLATIONS['English']['categories_list']
 CANONICAL_FREQUENCIES = TRANSLATIONS['English']['frequencies_list']
 
+# Position of each canonical key in the *_list entries, for O(1) display lookups
+CATEGORY_INDEX = {key: i for i, key in enumerate(CANONICAL_CATEGORIES)}
+FREQUENCY_INDEX = {key: i for i, key in enumerate(CANONICAL_FREQUENCIES)}
+
 def get_canonical_category(display_text):
     """Convert display text (any language) to canonical English key."""
-    # Check if already canonical
-    if display_text in CANONICAL_CATEGORIES:
-        return display_text
-    
-    # Check all languages
-    for lang_code, strings in TRANSLATIONS.items():
-        if 'categories_list' in strings:
-            try:
-                idx = strings['categories_list'].index(display_text)
-                return CANONICAL_CATEGORIES[idx]
-            except ValueError:
-                continue
-    return display_text # Fallback
+    canonical = TRANSLATIONS.canonical('categories_list', display_text)
+    return display_text if canonical is None else canonical
 
 def get_canonical_frequency(display_text):
     """Convert display text (any language) to canonical English key."""
-    # Check if already canonical
-    if display_text in CANONICAL_FREQUENCIES:
-        return display_text
-        
-    # Check all languages
-    for lang_code, strings in TRANSLATIONS.items():
-        if 'frequencies_list' in strings:
-            try:
-                idx = strings['frequencies_list'].index(display_text)
-                return CANONICAL_FREQUENCIES[idx]
-            except ValueError:
-                continue
-    return display_text # Fallback
+    canonical = TRANSLATIONS.canonical('frequencies_list', display_text)
+    return display_text if canonical is None else canonical
 
 def get_display_category(canonical_key):
     """Convert canonical key to current language display text."""
     try:
-        idx = CANONICAL_CATEGORIES.index(canonical_key)
-        return STRINGS["categories_list"][idx]
-    except (ValueError, IndexError):
+        return STRINGS["categories_list"][CATEGORY_INDEX[canonical_key]]
+    except (KeyError, IndexError, TypeError):
         return canonical_key
 
 def get_display_frequency(canonical_key):
     """Convert canonical key to current language display text."""
     try:
-        idx = CANONICAL_FREQUENCIES.index(canonical_key)
-        return STRINGS["frequencies_list"][idx]
-    except (ValueError, IndexError):
+        return STRINGS["frequencies_list"][FREQUENCY_INDEX[canonical_key]]
+    except (KeyError, IndexError, TypeError):
         return canonical_key
 
 CURRENCY_FULL_NAMES = {
@@ -901,18 +285,6 @@ CURRENCY_FULL_NAMES = {
 
 
 
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        # Robust fallback: use script directory
-        base_path = os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals() else os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
-
-
 def get_icon_path():
     """Get platform-appropriate main window icon path."""
     if platform.system() == 'Windows':
@@ -983,13 +355,1697 @@ def validate_file_path(path):
         return False
 
 
+class SQLiteStore:
+    """Indexed SQLite storage engine with per-record writes.
+
+    Used instead of the single JSON file when config['storage_backend'] is
+    'sqlite'. Every save is diffed against what is already on disk, so adding,
+    paying or editing a bill only touches the rows that changed instead of
+    rewriting the whole history. Payloads are Fernet-encrypted when a PIN is
+    active; only status, ordering and due date are kept in clear so the
+    indexes stay usable.
+    """
+    SCHEMA_VERSION = 1
+
+    # table -> (status groups, has due_date column)
+    TABLES = {
+        'bills': (('unpaid', 'paid'), True),
+        'savings_goals': (('',), False),
+        'categories': (('',), False),
+    }
+    LIST_KEYS = {'unpaid_bills', 'paid_bills', 'savings_goals', 'custom_categories'}
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._conn = None
+        self._lock = threading.RLock()
+        self._entries = {table: {} for table in self.TABLES}
+        self._meta_digests = {}
+        self._primed = False
+        self._key_token = None
+
+    def exists(self):
+        return os.path.exists(self.db_path)
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value BLOB NOT NULL);
+                CREATE TABLE IF NOT EXISTS bills (
+                    id INTEGER PRIMARY KEY, status TEXT NOT NULL, position REAL NOT NULL,
+                    due_date TEXT, payload BLOB NOT NULL);
+                CREATE INDEX IF NOT EXISTS idx_bills_order ON bills(status, position);
+                CREATE INDEX IF NOT EXISTS idx_bills_due ON bills(status, due_date);
+                CREATE TABLE IF NOT EXISTS savings_goals (
+                    id INTEGER PRIMARY KEY, status TEXT NOT NULL DEFAULT '', position REAL NOT NULL,
+                    payload BLOB NOT NULL);
+                CREATE INDEX IF NOT EXISTS idx_goals_order ON savings_goals(position);
+                CREATE TABLE IF NOT EXISTS categories (
+                    id INTEGER PRIMARY KEY, status TEXT NOT NULL DEFAULT '', position REAL NOT NULL,
+                    payload BLOB NOT NULL);
+                CREATE INDEX IF NOT EXISTS idx_categories_order ON categories(position);
+            """)
+            with self._conn:
+                self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                                   (str(self.SCHEMA_VERSION).encode('utf-8'),))
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._entries = {table: {} for table in self.TABLES}
+            self._meta_digests = {}
+            self._primed = False
+            self._key_token = None
+
+    @staticmethod
+    def _encode(record):
+        return json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    @staticmethod
+    def _stamp(record):
+        """(keys, values) of a flat record, or None when it must always be re-encoded.
+
+        SaveScheduler hands over the same copy of a Bill while its rev is
+        unchanged, so an unchanged record is the same object with the same
+        keys and value objects as at the last sync.
+        """
+        if isinstance(record, dict):
+            values = tuple(record.values())
+            if all(isinstance(v, (str, int, float, bool, type(None))) for v in values):
+                return (tuple(record), values)
+        return None
+
+    @staticmethod
+    def _unchanged(entry, record):
+        if entry is None or entry[4] is not record or entry[5] is None:
+            return False
+        keys, values = entry[5]
+        return keys == tuple(record) and all(map(operator.is_, values, record.values()))
+
+    @staticmethod
+    def _decode(blob, fernet):
+        """Decrypt and parse one payload. Under a PIN, rows that fail to authenticate raise ValueError."""
+        if fernet:
+            try:
+                blob = fernet.decrypt(bytes(blob))
+            except InvalidToken:
+                raise ValueError("payload failed to authenticate")
+        return json.loads(bytes(blob).decode('utf-8'))
+
+    def _groups(self, data):
+        return {
+            'bills': [('unpaid', data.get('unpaid_bills') or []), ('paid', data.get('paid_bills') or [])],
+            'savings_goals': [('', data.get('savings_goals') or [])],
+            'categories': [('', data.get('custom_categories') or [])],
+        }
+
+    def load(self, fernet, key_token):
+        """Read everything back into the JSON-shaped dict used by DataManager."""
+        with self._lock:
+            conn = self._connect()
+            data = {'unpaid_bills': [], 'paid_bills': [], 'savings_goals': [], 'custom_categories': []}
+            tampered = False
+            self._meta_digests = {}
+            for key, value in conn.execute("SELECT key, value FROM meta"):
+                if key == 'schema_version':
+                    continue
+                try:
+                    data[key] = self._decode(value, fernet)
+                    self._meta_digests[key] = hashlib.sha256(self._encode(data[key])).digest()
+                except (ValueError, UnicodeDecodeError) as e:
+                    logging.warning(f"Skipping SQLite meta value {key!r}: {e}")
+                    tampered = True
+
+            targets = {('bills', 'unpaid'): data['unpaid_bills'], ('bills', 'paid'): data['paid_bills'],
+                       ('savings_goals', ''): data['savings_goals'], ('categories', ''): data['custom_categories']}
+            for table in self.TABLES:
+                entries = {}
+                rows = conn.execute(f"SELECT id, status, position, payload FROM {table} ORDER BY status, position")
+                for rowid, status, position, payload in rows:
+                    try:
+                        record = self._decode(payload, fernet)
+                    except (ValueError, UnicodeDecodeError) as e:
+                        logging.warning(f"Skipping SQLite row {table}/{rowid}: {e}")
+                        tampered = True
+                        continue
+                    target = targets.get((table, status))
+                    if target is None:
+                        continue
+                    target.append(record)
+                    digest = hashlib.sha256(self._encode(record)).digest()
+                    entries[id(record)] = [rowid, digest, status, position, record, self._stamp(record)]
+                self._entries[table] = entries
+
+            self._primed = True
+            self._key_token = key_token
+            if tampered:
+                data['__tampered__'] = True
+            return data
+
+    def _prime(self, fernet):
+        """Build the in-memory row index when syncing before any load()."""
+        conn = self._connect()
+        for table in self.TABLES:
+            entries = {}
+            for rowid, status, position, payload in conn.execute(f"SELECT id, status, position, payload FROM {table}"):
+                try:
+                    record = self._decode(payload, fernet)
+                    digest = hashlib.sha256(self._encode(record)).digest()
+                except (ValueError, UnicodeDecodeError):
+                    digest = None
+                entries[('row', rowid)] = [rowid, digest, status, position, None, None]
+            self._entries[table] = entries
+        self._meta_digests = {}
+        self._primed = True
+
+    def sync(self, data, fernet, key_token):
+        """Write only the rows and meta values that differ from the last sync."""
+        with self._lock:
+            conn = self._connect()
+            if not self._primed:
+                self._prime(fernet)
+            rekey = key_token != self._key_token
+            if rekey:
+                self._meta_digests = {}
+            with conn:
+                self._sync_meta(conn, data, fernet, rekey)
+                for table, groups in self._groups(data).items():
+                    self._sync_table(conn, table, groups, fernet, rekey)
+            self._key_token = key_token
+            return True
+
+    def _sync_meta(self, conn, data, fernet, rekey=False):
+        current = {k: v for k, v in data.items() if k not in self.LIST_KEYS and not k.startswith('__')}
+        if rekey:
+            # Values under the old key that are no longer in the data would not decrypt any more
+            conn.execute("DELETE FROM meta WHERE key != 'schema_version'")
+        for key, value in current.items():
+            encoded = self._encode(value)
+            digest = hashlib.sha256(encoded).digest()
+            if self._meta_digests.get(key) != digest:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                             (key, fernet.encrypt(encoded) if fernet else encoded))
+                self._meta_digests[key] = digest
+        for key in [k for k in self._meta_digests if k not in current]:
+            conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+            del self._meta_digests[key]
+
+    def _sync_table(self, conn, table, groups, fernet, rekey):
+        has_due = self.TABLES[table][1]
+        old = self._entries[table]
+        matched = {}     # id(record) -> old entry
+        records = []     # (status, record, encoded or None, digest, stamp)
+
+        # 1. Match by object identity (cheap, catches in-place edits and status moves);
+        #    records unchanged since the last sync keep their digest without re-encoding
+        for status, items in groups:
+            for record in items:
+                token = id(record)
+                entry = old.get(token)
+                if self._unchanged(entry, record):
+                    encoded, digest, stamp = None, entry[1], entry[5]
+                else:
+                    encoded = self._encode(record)
+                    digest = hashlib.sha256(encoded).digest()
+                    stamp = self._stamp(record)
+                if entry is not None and token not in matched:
+                    matched[token] = entry
+                records.append((status, record, encoded, digest, stamp))
+
+        # 2. Match the rest by content digest (reloaded or copied records)
+        leftovers = {}
+        for token, entry in old.items():
+            if token not in matched:
+                leftovers.setdefault(entry[1], []).append(entry)
+        new_entries = {}
+        by_token = {}
+        for status, record, encoded, digest, stamp in records:
+            token = id(record)
+            if token in matched and token not in by_token:
+                by_token[token] = matched[token]
+            elif token not in by_token:
+                candidates = leftovers.get(digest)
+                by_token[token] = candidates.pop() if candidates else None
+
+        # 3. Positions: keep existing ones when still ordered, interpolate the gaps
+        positions = {}
+        for status, items in groups:
+            anchors = [(i, by_token[id(r)][3]) for i, r in enumerate(items)
+                       if by_token.get(id(r)) and by_token[id(r)][2] == status]
+            ordered = all(a[1] < b[1] for a, b in zip(anchors, anchors[1:]))
+            if not ordered:
+                for i, r in enumerate(items):
+                    positions[id(r)] = float(i)
+                continue
+            anchor_at = dict(anchors)
+            prev_pos = None
+            i = 0
+            while i < len(items):
+                if i in anchor_at:
+                    positions[id(items[i])] = prev_pos = anchor_at[i]
+                    i += 1
+                    continue
+                j = i
+                while j < len(items) and j not in anchor_at:
+                    j += 1
+                next_pos = anchor_at.get(j)
+                gap = j - i
+                for k in range(gap):
+                    if prev_pos is None and next_pos is None:
+                        pos = float(i + k)
+                    elif prev_pos is None:
+                        pos = next_pos - (gap - k)
+                    elif next_pos is None:
+                        pos = prev_pos + k + 1
+                    else:
+                        pos = prev_pos + (next_pos - prev_pos) * (k + 1) / (gap + 1)
+                    positions[id(items[i + k])] = pos
+                if prev_pos is not None and next_pos is not None and (next_pos - prev_pos) / (gap + 1) < 1e-9:
+                    # Ran out of float precision between two neighbours: renumber this list
+                    for n, r in enumerate(items):
+                        positions[id(r)] = float(n)
+                    break
+                i = j
+
+        # 4. Write the differences
+        for status, record, encoded, digest, stamp in records:
+            token = id(record)
+            if token in new_entries:
+                continue  # Same object listed twice; already written
+            entry = by_token.get(token)
+            pos = positions[token]
+            due = record.get('due_date') if has_due and isinstance(record, dict) else None
+            if encoded is None and (entry is None or entry[1] != digest or rekey):
+                encoded = self._encode(record)
+            if entry is None:
+                payload = fernet.encrypt(encoded) if fernet else encoded
+                if has_due:
+                    cur = conn.execute(f"INSERT INTO {table} (status, position, due_date, payload) VALUES (?, ?, ?, ?)",
+                                       (status, pos, due, payload))
+                else:
+                    cur = conn.execute(f"INSERT INTO {table} (status, position, payload) VALUES (?, ?, ?)",
+                                       (status, pos, payload))
+                new_entries[token] = [cur.lastrowid, digest, status, pos, record, stamp]
+                continue
+            rowid = entry[0]
+            if entry[1] != digest or rekey:
+                payload = fernet.encrypt(encoded) if fernet else encoded
+                if has_due:
+                    conn.execute(f"UPDATE {table} SET status = ?, position = ?, due_date = ?, payload = ? WHERE id = ?",
+                                 (status, pos, due, payload, rowid))
+                else:
+                    conn.execute(f"UPDATE {table} SET status = ?, position = ?, payload = ? WHERE id = ?",
+                                 (status, pos, payload, rowid))
+            elif entry[2] != status or entry[3] != pos:
+                conn.execute(f"UPDATE {table} SET status = ?, position = ? WHERE id = ?", (status, pos, rowid))
+            new_entries[token] = [rowid, digest, status, pos, record, stamp]
+
+        kept = {entry[0] for entry in new_entries.values()}
+        stale = [(entry[0],) for entry in old.values() if entry[0] not in kept]
+        if stale:
+            conn.executemany(f"DELETE FROM {table} WHERE id = ?", stale)
+        self._entries[table] = new_entries
+
+    def backup_to(self, target_path):
+        """Consistent online copy of the database (used for rotating backups)."""
+        with self._lock:
+            conn = self._connect()
+            target = sqlite3.connect(target_path)
+            try:
+                conn.backup(target)
+            finally:
+                target.close()
+
+
+class RecordEncoder:
+    """Compact JSON encoder that remembers the previous encoding of each record.
+
+    Flat dicts whose keys and values are unchanged (by identity) since the last
+    pass reuse their encoding instead of going through json.dumps again. Call
+    begin(), encode() every live record, then commit() to drop stale entries.
+    """
+    def __init__(self):
+        self._cache = {}  # id(record) -> (record, keys, values, encoded)
+        self._next = {}
+
+    @staticmethod
+    def dumps(value):
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+    def begin(self):
+        self._next = {}
+
+    def encode(self, item):
+        if not isinstance(item, dict):
+            return self.dumps(item)
+        keys, values = tuple(item), tuple(item.values())
+        hit = self._cache.get(id(item))
+        if (hit is not None and hit[0] is item and hit[1] == keys
+                and all(map(operator.is_, hit[2], values))):
+            self._next[id(item)] = hit
+            return hit[3]
+        encoded = self.dumps(item)
+        if all(isinstance(v, (str, int, float, bool, type(None))) for v in values):
+            self._next[id(item)] = (item, keys, values, encoded)
+        return encoded
+
+    def commit(self):
+        self._cache, self._next = self._next, {}
+
+    def clear(self):
+        self._cache, self._next = {}, {}
+
+
+class MutationJournal:
+    """Append-only journal of encrypted mutation records (v6.7.0).
+
+    The JSON backend keeps bill_data.json as a snapshot and appends each
+    save's changes here as length-prefixed records, so a save costs
+    O(change) instead of O(history). Records are list splices (add, pay,
+    edit, delete, reorder) and key sets (budget, currencies). The first
+    record names the snapshot hash the journal applies to; compaction
+    rewrites the snapshot and starts a fresh journal, moving the previous
+    one to <journal>.old until the new snapshot is safely on disk.
+
+    Each record starts with a chain tag, sha256(previous tag + record), so the
+    journal is tied to the snapshot hash in its base record. Records that fail
+    to decrypt under the PIN or break the chain are rejected on replay.
+    """
+    MAGIC = b'BTJ2'
+    TAG_SIZE = 32
+    LIST_KEYS = ('unpaid_bills', 'paid_bills', 'savings_goals', 'custom_categories')
+    COMPACT_RECORDS = 200
+    COMPACT_MIN_BYTES = 64 * 1024
+
+    def __init__(self, path):
+        self.path = path
+        self.old_path = path + '.old'
+        self.lock = threading.RLock()
+        self._state = None       # key -> encoded scalar (str) or list of encoded records
+        self._key_token = None
+        self.records = 0
+        self.size = 0
+        self.snapshot_size = 0
+        self.broken = False      # Set when a compaction failed; forces a full write
+        self.tampered = False    # Set by replay when records were rejected
+        self._tail = b''         # Chain tag of the last record written
+        self._encoder = RecordEncoder()
+
+    @property
+    def primed(self):
+        return self._state is not None
+
+    def _split(self, data):
+        state = {}
+        encoder = self._encoder
+        encoder.begin()
+        for key, value in data.items():
+            if key.startswith('__'):
+                continue
+            if key in self.LIST_KEYS and isinstance(value, list):
+                state[key] = [encoder.encode(item) for item in value]
+            else:
+                state[key] = encoder.dumps(value)
+        encoder.commit()
+        return state
+
+    def render(self):
+        """Snapshot JSON text for the current state (records are already encoded)."""
+        parts = []
+        for key, value in self._state.items():
+            if isinstance(value, list):
+                value = '[' + ','.join(value) + ']'
+            parts.append(f"{json.dumps(key)}:{value}")
+        return '{' + ','.join(parts) + '}'
+
+    def reset(self):
+        with self.lock:
+            self._state = None
+            self._key_token = None
+            self._encoder.clear()
+            self.records = 0
+            self.size = 0
+            self.broken = False
+            self._tail = b''
+
+    def prime(self, data, key_token):
+        with self.lock:
+            self._state = self._split(data)
+            self._key_token = key_token
+            self.broken = False
+
+    def start(self, snapshot_hash, fernet):
+        """Begin a fresh journal on top of the snapshot with the given hash."""
+        with self.lock:
+            header, tail = self._frame(json.dumps({'op': 'base', 'hash': snapshot_hash}), fernet, b'')
+            tmp = self.path + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(self.MAGIC + header)
+            os.replace(tmp, self.path)
+            self._tail = tail
+            self.records = 0
+            self.size = len(self.MAGIC) + len(header)
+
+    @classmethod
+    def _chain(cls, previous, text):
+        return hashlib.sha256(previous + text).digest()
+
+    @classmethod
+    def _frame(cls, text, fernet, previous):
+        """Length-prefixed record chained to previous. Returns (frame, its tag)."""
+        text = text.encode('utf-8')
+        tag = cls._chain(previous, text)
+        body = tag + text
+        if fernet:
+            body = fernet.encrypt(body)
+        return struct.pack('>I', len(body)) + body, tag
+
+    def _diff(self, state):
+        ops = []
+        old_state = self._state
+        for key, new in state.items():
+            old = old_state.get(key)
+            if isinstance(new, list) and isinstance(old, list):
+                limit = min(len(old), len(new))
+                head = 0
+                while head < limit and old[head] == new[head]:
+                    head += 1
+                tail = 0
+                while tail < limit - head and old[-1 - tail] == new[-1 - tail]:
+                    tail += 1
+                if head == len(old) == len(new):
+                    continue
+                inserted = ','.join(new[head:len(new) - tail])
+                ops.append(f'{{"op":"splice","key":{json.dumps(key)},"at":{head},'
+                           f'"del":{len(old) - head - tail},"ins":[{inserted}]}}')
+            else:
+                value = '[' + ','.join(new) + ']' if isinstance(new, list) else new
+                old_value = '[' + ','.join(old) + ']' if isinstance(old, list) else old
+                if value != old_value:
+                    ops.append(f'{{"op":"set","key":{json.dumps(key)},"value":{value}}}')
+        for key in old_state:
+            if key not in state:
+                ops.append(f'{{"op":"del","key":{json.dumps(key)}}}')
+        return ops
+
+    def append(self, data, fernet, key_token):
+        """Journal the changes since the last save. False means a full write is needed."""
+        with self.lock:
+            if not self.primed or self.broken or key_token != self._key_token or not os.path.exists(self.path):
+                return False
+            state = self._split(data)
+            ops = self._diff(state)
+            if ops:
+                frames = []
+                tail = self._tail
+                for op in ops:
+                    frame, tail = self._frame(op, fernet, tail)
+                    frames.append(frame)
+                blob = b''.join(frames)
+                with open(self.path, 'ab') as f:
+                    f.write(blob)
+                self._tail = tail
+                self.records += len(ops)
+                self.size += len(blob)
+            self._state = state
+            return True
+
+    def should_compact(self):
+        return self.records >= self.COMPACT_RECORDS or self.size >= max(self.COMPACT_MIN_BYTES, self.snapshot_size // 4)
+
+    def roll(self, fernet):
+        """Freeze the current state for compaction and continue in a new journal."""
+        with self.lock:
+            content = self.render()
+            content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            os.replace(self.path, self.old_path)
+            self.start(content_hash, fernet)
+            return content
+
+    def _read(self, path, fernet):
+        """Return (base_hash, ops, tail tag) for one journal file.
+
+        Only a torn last frame (shorter than its length prefix) is truncated.
+        Reading stops at the first record that fails to authenticate or does
+        not continue the chain, and flags the journal as tampered: splices are
+        positional, so nothing after it can be applied. The records before it
+        are kept.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if not raw.startswith(self.MAGIC):
+            logging.warning(f"Ignoring journal with unknown format: {path}")
+            return None
+        offset = len(self.MAGIC)
+        records = []
+        tail = b''
+        while offset < len(raw):
+            header = raw[offset:offset + 4]
+            length = struct.unpack('>I', header)[0] if len(header) == 4 else None
+            body = raw[offset + 4:offset + 4 + length] if length is not None else b''
+            if length is None or len(body) < length:
+                logging.warning(f"Truncating torn journal tail in {path} ({len(raw) - offset} bytes)")
+                with open(path, 'r+b') as f:
+                    f.truncate(offset)
+                break
+            offset += 4 + length
+            if fernet:
+                try:
+                    body = fernet.decrypt(body)
+                except InvalidToken:
+                    logging.warning(f"Rejected unauthenticated journal record in {path}")
+                    self.tampered = True
+                    break
+            tag, text = body[:self.TAG_SIZE], body[self.TAG_SIZE:]
+            if len(tag) < self.TAG_SIZE or self._chain(tail, text) != tag:
+                logging.warning(f"Rejected journal record that breaks the chain in {path}")
+                self.tampered = True
+                break
+            try:
+                record = json.loads(text.decode('utf-8'))
+            except (ValueError, UnicodeDecodeError):
+                logging.warning(f"Unreadable journal record in {path}")
+                self.tampered = True
+                break
+            records.append(record)
+            tail = tag
+        if not records or records[0].get('op') != 'base':
+            return None
+        return records[0].get('hash'), records[1:], tail
+
+    def replay(self, data, snapshot_hash, fernet):
+        """Apply journal records on top of the snapshot.
+
+        Returns True if the chain is clean and can be appended to; otherwise
+        the next save writes a full snapshot. tampered reports rejected records.
+        """
+        with self.lock:
+            self.tampered = False
+            current = self._read(self.path, fernet)
+            previous = self._read(self.old_path, fernet)
+            if current and current[0] == snapshot_hash:
+                chain = [current]
+                if previous:
+                    os.remove(self.old_path)  # Compaction finished; leftover from before
+            elif previous and previous[0] == snapshot_hash:
+                # Interrupted compaction: the old journal still applies to the snapshot
+                chain = [previous] + ([current] if current else [])
+            else:
+                if current or previous:
+                    logging.warning("Journal does not match the data snapshot; ignoring it")
+                return False
+            for _, ops, _ in chain:
+                for op in ops:
+                    kind, key = op.get('op'), op.get('key')
+                    if kind == 'splice':
+                        items = data.setdefault(key, [])
+                        at = op.get('at', 0)
+                        items[at:at + op.get('del', 0)] = op.get('ins', [])
+                    elif kind == 'set':
+                        data[key] = op.get('value')
+                    elif kind == 'del':
+                        data.pop(key, None)
+            self.records = sum(len(ops) for _, ops, _ in chain)
+            self.size = sum(os.path.getsize(p) for p in (self.path, self.old_path) if os.path.exists(p))
+            self._tail = chain[-1][2]
+            return len(chain) == 1 and not self.tampered
+
+    def discard(self):
+        """Remove journal files (after a restore replaced the snapshot)."""
+        with self.lock:
+            for path in (self.path, self.old_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.reset()
+
+
+class HistorySegments:
+    """Per-year cold segments of paid history (v6.7.0).
+
+    Paid bills older than the hot window (this year and last) are moved out of
+    the main data into <data>.paid-<year>.json, encrypted like the main file.
+    The hot data keeps a 'paid_index' with each segment's digest, count and
+    per-currency totals by year, month and day, so totals and the Trends chart work
+    without decrypting cold years. Segments are only read when the full
+    history is needed (Paid tab, search, export).
+    """
+    HOT_YEARS = 2
+
+    def __init__(self, data_file):
+        self.data_file = data_file
+        self.base = os.path.splitext(data_file)[0]
+        self.index = {}  # year (str) -> summary, as stored in the hot data
+        self._encoder = RecordEncoder()
+
+    def path(self, year):
+        return f"{self.base}.paid-{year}.json"
+
+    def existing_files(self):
+        folder, prefix = os.path.dirname(self.base) or '.', os.path.basename(self.base) + '.paid-'
+        found = {}
+        if os.path.isdir(folder):
+            for name in os.listdir(folder):
+                year = name[len(prefix):-len('.json')] if name.startswith(prefix) and name.endswith('.json') else ''
+                if year.isdigit():
+                    found[year] = os.path.join(folder, name)
+        return found
+
+    @staticmethod
+    def record_year(bill):
+        stamp = bill.get('paid_date') or bill.get('due_date') or ''
+        return stamp[:4] if len(stamp) >= 4 and stamp[:4].isdigit() else None
+
+    def partition(self, paid_bills):
+        """Split paid bills into (hot list, {year: cold list}), keeping order."""
+        cutoff = str(date.today().year - self.HOT_YEARS + 1)
+        hot, cold = [], {}
+        for bill in paid_bills:
+            year = self.record_year(bill) if isinstance(bill, (dict, Bill)) else None
+            if year and year < cutoff:
+                cold.setdefault(year, []).append(bill)
+            else:
+                hot.append(bill)
+        return hot, cold
+
+    @staticmethod
+    def summarize(records):
+        totals, months, days = {}, {}, {}
+        for bill in records:
+            currency = bill.get('currency', '$ (USD)')
+            try:
+                amount = float(bill.get('amount', 0) or 0)
+            except (TypeError, ValueError):
+                continue
+            totals[currency] = totals.get(currency, 0.0) + amount
+            due = bill.get('due_date', '')
+            for size, groups in ((7, months), (10, days)):
+                key = due[:size]
+                if len(key) == size:
+                    bucket = groups.setdefault(key, {})
+                    bucket[currency] = bucket.get(currency, 0.0) + amount
+        return {'count': len(records), 'totals': totals, 'months': months, 'days': days}
+
+    def _write_file(self, path, text, fernet):
+        payload = text.encode('utf-8')
+        if fernet:
+            payload = fernet.encrypt(payload)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, path)
+
+    def write(self, paid_bills, fernet):
+        """Move cold records into their segments. Returns (hot list, index, written paths)."""
+        hot, cold = self.partition(paid_bills)
+        encoder = self._encoder
+        encoder.begin()
+        index, written = {}, []
+        for year, records in cold.items():
+            text = '[' + ','.join(encoder.encode(r) for r in records) + ']'
+            digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            old = self.index.get(year)
+            path = self.path(year)
+            if not old or old.get('digest') != digest or not os.path.exists(path):
+                self._write_file(path, text, fernet)
+                written.append(path)
+            entry = self.summarize(records)
+            entry['digest'] = digest
+            index[year] = entry
+        encoder.commit()
+        for year, path in self.existing_files().items():
+            if year not in index:
+                os.remove(path)
+        self.index = index
+        return hot, index, written
+
+    def add(self, cold, fernet):
+        """Move newly cold records into segments without reading the other years.
+
+        cold is {year: records} (see partition). A year that already has a
+        segment is read and extended; records already in it (same id) are not
+        added twice. A segment that cannot be read is left alone and its
+        year's records stay hot. Returns (index, written paths, years moved).
+        """
+        index, written, moved = dict(self.index), [], []
+        for year, records in cold.items():
+            existing = []
+            path = self.path(year)
+            if year in index:
+                try:
+                    text = self._read_text(path, fernet)
+                    if hashlib.sha256(text.encode('utf-8')).hexdigest() != index[year].get('digest'):
+                        raise ValueError("segment failed its integrity check")
+                    existing = json.loads(text)
+                except (IOError, OSError, ValueError, UnicodeDecodeError) as e:
+                    logging.error(f"Not extending paid history segment {path}: {e}")
+                    continue
+            ids = {r.get('id') for r in existing if isinstance(r, dict)}
+            merged = existing + [r for r in records if r.get('id') is None or r.get('id') not in ids]
+            text = '[' + ','.join(RecordEncoder.dumps(r) for r in merged) + ']'
+            self._write_file(path, text, fernet)
+            entry = self.summarize(merged)
+            entry['digest'] = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            index[year] = entry
+            written.append(path)
+            moved.append(year)
+        self.index = index
+        return index, written, moved
+
+    def _read_text(self, path, fernet):
+        """Plain segment text. Under a PIN, a segment that fails to authenticate raises ValueError."""
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if fernet:
+            try:
+                raw = fernet.decrypt(raw)
+            except InvalidToken:
+                raise ValueError("segment failed to authenticate")
+        return raw.decode('utf-8')
+
+    def read_all(self, fernet):
+        """Load every indexed segment, newest year first. Returns (records, tampered)."""
+        records, tampered = [], False
+        for year in sorted(self.index, reverse=True):
+            path = self.path(year)
+            try:
+                text = self._read_text(path, fernet)
+                if hashlib.sha256(text.encode('utf-8')).hexdigest() != self.index[year].get('digest'):
+                    logging.warning(f"Paid history segment {year} failed its integrity check")
+                    tampered = True
+                items = json.loads(text)
+            except (IOError, OSError, ValueError, UnicodeDecodeError) as e:
+                logging.error(f"Could not read paid history segment {path}: {e}")
+                tampered = True
+                continue
+            records.extend(b for b in items if isinstance(b, dict) and ('name' in b or 'amount' in b))
+        return records, tampered
+
+    def rekey(self, old_fernet, new_fernet):
+        """Re-encrypt every segment after a PIN change."""
+        for year, path in self.existing_files().items():
+            try:
+                text = self._read_text(path, old_fernet)
+            except (ValueError, UnicodeDecodeError) as e:
+                logging.error(f"Not re-encrypting paid history segment {path}: {e}")
+                continue
+            self._write_file(path, text, new_fernet)
+
+
+class BackupStore:
+    """Content-addressed, deduplicated backup store (v6.7.0).
+
+    Each restore point (the main data file plus any paid-history segments) is
+    split into chunks that are stored once under their hash in
+    chunks/<xx>/<id>; a point only records one "tree" blob per file listing
+    its chunk IDs. JSON snapshots are cut at record boundaries chosen by record
+    content, so an edit only produces a couple of new chunks; SQLite files are
+    cut into fixed page-aligned blocks. manifest.json holds the points and a
+    reference count per blob, so pruning old points never has to scan the
+    store. With a PIN, blobs are Fernet-encrypted and IDs are keyed hashes.
+    The IDs each point uses are also listed in clear in points/<name>, so a
+    point can be released without decrypting it, even after a PIN change.
+    """
+    MAX_POINTS = 100
+    MIN_CHUNK = 4 * 1024
+    MAX_CHUNK = 64 * 1024
+    PAGE_CHUNK = 16 * 1024
+    CUT_MASK = 0x3F  # ~1 in 64 record boundaries ends a chunk
+    _BOUNDARY = re.compile(rb'\},\{')
+
+    def __init__(self, root):
+        self.root = root
+        self.chunk_dir = os.path.join(root, 'chunks')
+        self.points_dir = os.path.join(root, 'points')
+        self.manifest_file = os.path.join(root, 'manifest.json')
+        self.lock = threading.Lock()
+        self._manifest = None
+
+    def _load_manifest(self):
+        if self._manifest is None:
+            manifest = {'version': 1, 'points': [], 'refs': {}}
+            if os.path.exists(self.manifest_file):
+                try:
+                    with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                        manifest.update(json.load(f))
+                except (IOError, OSError, ValueError) as e:
+                    logging.error(f"Backup manifest unreadable, starting a new one: {e}")
+            self._manifest = manifest
+        return self._manifest
+
+    def _save_manifest(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp = self.manifest_file + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._manifest, f, separators=(',', ':'))
+        os.replace(tmp, self.manifest_file)
+
+    def points(self):
+        with self.lock:
+            return list(self._load_manifest()['points'])
+
+    def _chunks(self, data, kind):
+        if kind == 'db':
+            return [data[i:i + self.PAGE_CHUNK] for i in range(0, len(data), self.PAGE_CHUNK)] or [b'']
+        chunks = []
+        start = record_start = 0
+        for match in self._BOUNDARY.finditer(data):
+            cut = match.start() + 2  # Just after "},"
+            size = cut - start
+            if size >= self.MAX_CHUNK or (size >= self.MIN_CHUNK
+                                          and zlib.crc32(data[record_start:cut]) & self.CUT_MASK == 0):
+                chunks.append(data[start:cut])
+                start = cut
+            record_start = cut
+        while len(data) - start > self.MAX_CHUNK:
+            chunks.append(data[start:start + self.MAX_CHUNK])
+            start += self.MAX_CHUNK
+        chunks.append(data[start:])
+        return chunks
+
+    @staticmethod
+    def _blob_id(blob, mac_key):
+        if mac_key:
+            return hmac.new(mac_key, blob, hashlib.sha256).hexdigest()
+        return hashlib.sha256(blob).hexdigest()
+
+    def _blob_path(self, blob_id):
+        return os.path.join(self.chunk_dir, blob_id[:2], blob_id)
+
+    def _put(self, blob, fernet, mac_key):
+        """Store a blob unless it is already present. Returns (id, written)."""
+        blob_id = self._blob_id(blob, mac_key)
+        path = self._blob_path(blob_id)
+        if os.path.exists(path):
+            return blob_id, False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(fernet.encrypt(blob) if fernet else blob)
+        os.replace(tmp, path)
+        return blob_id, True
+
+    def _refs_path(self, name):
+        return os.path.join(self.points_dir, name)
+
+    def _get(self, blob_id, fernet):
+        with open(self._blob_path(blob_id), 'rb') as f:
+            blob = f.read()
+        return fernet.decrypt(blob) if fernet else blob
+
+    def add(self, files, kind, fernet=None, mac_key=None, keep=None):
+        """Record a restore point from {file name: bytes}; 'snapshot' is the main file.
+
+        Returns the point, or None if nothing changed since the last one.
+        """
+        with self.lock:
+            manifest = self._load_manifest()
+            points = manifest['points']
+            refs = manifest['refs']
+            digests = {fname: self._blob_id(blob, mac_key) for fname, blob in files.items()}
+            digest = self._blob_id(json.dumps(digests, sort_keys=True).encode('ascii'), mac_key)
+            if points and points[-1]['digest'] == digest and points[-1]['kind'] == kind:
+                return None
+
+            entries = {}
+            blob_ids = set()
+            written = chunk_count = 0
+            for fname, blob in files.items():
+                chunk_ids = []
+                for chunk in self._chunks(blob, kind if fname == 'snapshot' else 'json'):
+                    chunk_id, new = self._put(chunk, fernet, mac_key)
+                    chunk_ids.append(chunk_id)
+                    written += new
+                tree_id, _ = self._put('\n'.join(chunk_ids).encode('ascii'), fernet, mac_key)
+                blob_ids.update(chunk_ids)
+                blob_ids.add(tree_id)
+                chunk_count += len(chunk_ids)
+                entries[fname] = {'tree': tree_id, 'digest': digests[fname], 'size': len(blob)}
+            for blob_id in blob_ids:
+                refs[blob_id] = refs.get(blob_id, 0) + 1
+
+            name = f"bill_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{'db' if kind == 'db' else 'json'}"
+            taken = {p['name'] for p in points}
+            base, ext = os.path.splitext(name)
+            n = 1
+            while name in taken:
+                name = f"{base}_{n}{ext}"
+                n += 1
+            point = {'name': name, 'created': datetime.now().isoformat(timespec='seconds'), 'kind': kind,
+                     'digest': digest, 'files': entries, 'encrypted': bool(fernet)}
+            os.makedirs(self.points_dir, exist_ok=True)
+            with open(self._refs_path(name), 'w', encoding='ascii') as f:
+                f.write('\n'.join(sorted(blob_ids)))
+            points.append(point)
+
+            keep = keep or self.MAX_POINTS
+            removed = points[:-keep] if len(points) > keep else []
+            manifest['points'] = points[len(removed):]
+            self._save_manifest()
+            for old in removed:
+                self._release(old, fernet)
+            logging.debug(f"Backup {name}: {chunk_count} chunks, {written} new")
+            return point
+
+    def _release(self, point, fernet):
+        """Drop a point's references and delete blobs nobody else uses."""
+        refs = self._manifest['refs']
+        blob_ids = set()
+        refs_path = self._refs_path(point['name'])
+        try:
+            if os.path.exists(refs_path):
+                with open(refs_path, 'r', encoding='ascii') as f:
+                    blob_ids.update(f.read().split())
+            else:
+                # Point from before the ID lists: read its trees
+                for entry in point['files'].values():
+                    tree = self._get(entry['tree'], fernet if point.get('encrypted') else None)
+                    blob_ids.update(tree.decode('ascii').split('\n'))
+                    blob_ids.add(entry['tree'])
+        except Exception as e:
+            # Tree unreadable (e.g. made under another PIN); keep its blobs referenced
+            logging.warning(f"Could not release backup {point['name']}: {e}")
+            self._save_manifest()
+            return
+        for blob_id in blob_ids:
+            count = refs.get(blob_id, 0) - 1
+            if count > 0:
+                refs[blob_id] = count
+                continue
+            refs.pop(blob_id, None)
+            try:
+                os.remove(self._blob_path(blob_id))
+            except OSError:
+                pass
+        self._save_manifest()
+        try:
+            os.remove(refs_path)
+        except OSError:
+            pass
+
+    def remove(self, name, fernet=None):
+        with self.lock:
+            manifest = self._load_manifest()
+            point = next((p for p in manifest['points'] if p['name'] == name), None)
+            if point is None:
+                return False
+            manifest['points'].remove(point)
+            self._release(point, fernet)
+            return True
+
+    def read(self, name, fernet=None, mac_key=None):
+        """Reassemble a restore point. Returns ({file name: bytes}, kind)."""
+        with self.lock:
+            point = next((p for p in self._load_manifest()['points'] if p['name'] == name), None)
+        if point is None:
+            raise KeyError(name)
+        if not point.get('encrypted'):
+            fernet = mac_key = None
+        elif not fernet:
+            raise ValueError("Backup is encrypted; a PIN is required to restore it")
+        files = {}
+        try:
+            for fname, entry in point['files'].items():
+                chunk_ids = self._get(entry['tree'], fernet).decode('ascii').split('\n')
+                files[fname] = b''.join(self._get(chunk_id, fernet) for chunk_id in chunk_ids)
+                if self._blob_id(files[fname], mac_key) != entry['digest']:
+                    raise ValueError("Backup failed integrity check")
+        except InvalidToken:
+            raise ValueError("Backup was created with a different PIN")
+        return files, point['kind']
+
+class _Vocab:
+    """Interning table mapping repeated strings (currency, category) to small int codes."""
+    __slots__ = ('values', 'codes', 'lock')
+
+    def __init__(self, seed=()):
+        self.values = []
+        self.codes = {}
+        self.lock = threading.Lock()
+        for value in seed:
+            self.code(value)
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            with self.lock:
+                code = self.codes.get(value)
+                if code is None:
+                    code = len(self.values)
+                    self.values.append(sys.intern(value))
+                    self.codes[value] = code
+        return code
+
+
+_MISSING = object()
+
+
+class Bill(MutableMapping):
+    """Compact bill record (v6.7.0).
+
+    Slotted instead of a per-record dict: the due/paid dates are kept as date
+    ordinals, the amount as integer cents, and currency, category and
+    frequency as codes into shared interning tables. It still behaves as the
+    mapping the UI and file format expect (bill['due_date'] is the ISO
+    string), and anything that does not fit the compact form - odd amounts,
+    malformed dates, unknown keys - is kept verbatim so round-trips through
+    the JSON file are lossless. Hot paths use due_ordinal/due instead of
+    re-parsing date strings.
+    """
+    __slots__ = ('_id', '_name', '_amount', '_currency', '_category', '_freq', '_due',
+                 '_subscription', '_created', '_paid', '_extra', 'rev')
+
+    CURRENCIES = _Vocab()
+    CATEGORIES = _Vocab(CANONICAL_CATEGORIES)
+    FREQUENCIES = _Vocab(CANONICAL_FREQUENCIES)
+
+    # Values that do not fit the compact form are stored wrapped in a 1-tuple
+    @staticmethod
+    def _enc_amount(value):
+        if type(value) is float:
+            cents = round(value * 100)
+            if cents / 100 == value:
+                return cents
+        return (value,)
+
+    @staticmethod
+    def _dec_amount(value):
+        return value[0] if type(value) is tuple else value / 100
+
+    @staticmethod
+    def _enc_date(value):
+        if type(value) is str and len(value) == 10:
+            try:
+                day = date.fromisoformat(value)
+                if day.isoformat() == value:
+                    return day.toordinal()
+            except ValueError:
+                pass
+        return (value,)
+
+    @staticmethod
+    def _dec_date(value):
+        return value[0] if type(value) is tuple else date.fromordinal(value).isoformat()
+
+    @staticmethod
+    def _vocab_codec(vocab):
+        def enc(value):
+            return vocab.code(value) if type(value) is str else (value,)
+
+        def dec(value):
+            return value[0] if type(value) is tuple else vocab.values[value]
+        return enc, dec
+
+    def __init__(self, data=()):
+        for slot in self._SLOTS:
+            setattr(self, slot, _MISSING)
+        self._extra = None
+        self.rev = 0
+        fields = self._FIELDS
+        for key, value in (data.items() if hasattr(data, 'items') else data):
+            field = fields.get(key)
+            if field is None:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
+            else:
+                setattr(self, field[0], field[1](value) if field[1] else value)
+
+    @classmethod
+    def from_record(cls, record):
+        return record if isinstance(record, cls) else cls(record)
+
+    def to_dict(self):
+        out = {}
+        for key, (slot, _, decode) in self._FIELDS.items():
+            value = getattr(self, slot)
+            if value is not _MISSING:
+                out[key] = decode(value) if decode else value
+        if self._extra:
+            out.update(self._extra)
+        return out
+
+    def copy(self):
+        clone = Bill.__new__(Bill)
+        for slot in self._SLOTS:
+            setattr(clone, slot, getattr(self, slot))
+        clone._extra = dict(self._extra) if self._extra is not None else None
+        clone.rev = 0
+        return clone
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return Bill(copy.deepcopy(self.to_dict(), memo))
+
+    def __getitem__(self, key):
+        field = self._FIELDS.get(key)
+        if field is None:
+            if self._extra is not None and key in self._extra:
+                return self._extra[key]
+            raise KeyError(key)
+        value = getattr(self, field[0])
+        if value is _MISSING:
+            raise KeyError(key)
+        return field[2](value) if field[2] else value
+
+    def get(self, key, default=None):
+        field = self._FIELDS.get(key)
+        if field is None:
+            return self._extra.get(key, default) if self._extra is not None else default
+        value = getattr(self, field[0])
+        if value is _MISSING:
+            return default
+        return field[2](value) if field[2] else value
+
+    def __contains__(self, key):
+        field = self._FIELDS.get(key)
+        if field is None:
+            return self._extra is not None and key in self._extra
+        return getattr(self, field[0]) is not _MISSING
+
+    def __setitem__(self, key, value):
+        field = self._FIELDS.get(key)
+        if field is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+        else:
+            setattr(self, field[0], field[1](value) if field[1] else value)
+        self.rev += 1
+
+    def __delitem__(self, key):
+        field = self._FIELDS.get(key)
+        if field is None:
+            if self._extra is None or key not in self._extra:
+                raise KeyError(key)
+            del self._extra[key]
+        else:
+            if getattr(self, field[0]) is _MISSING:
+                raise KeyError(key)
+            setattr(self, field[0], _MISSING)
+        self.rev += 1
+
+    def __iter__(self):
+        for key, field in self._FIELDS.items():
+            if getattr(self, field[0]) is not _MISSING:
+                yield key
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self):
+        return (sum(getattr(self, f[0]) is not _MISSING for f in self._FIELDS.values())
+                + (len(self._extra) if self._extra else 0))
+
+    def __repr__(self):
+        return f"Bill({self.to_dict()!r})"
+
+    @property
+    def due_ordinal(self):
+        """Due date as a date ordinal, or None if missing/invalid."""
+        return self._due if type(self._due) is int else None
+
+    @property
+    def due(self):
+        return date.fromordinal(self._due) if type(self._due) is int else None
+
+    @property
+    def paid_ordinal(self):
+        return self._paid if type(self._paid) is int else None
+
+    @property
+    def cents(self):
+        """Amount in minor units (float for sub-cent amounts), or None if not numeric."""
+        if type(self._amount) is int:
+            return self._amount
+        try:
+            return float(self._amount[0]) * 100
+        except (TypeError, ValueError):
+            return None
+
+
+_currency_codec = Bill._vocab_codec(Bill.CURRENCIES)
+_category_codec = Bill._vocab_codec(Bill.CATEGORIES)
+_freq_codec = Bill._vocab_codec(Bill.FREQUENCIES)
+Bill._SLOTS = ('_id', '_name', '_amount', '_currency', '_category', '_freq', '_due',
+               '_subscription', '_created', '_paid')
+# key -> (slot, encode, decode); iteration follows this order
+Bill._FIELDS = {
+    'id': ('_id', None, None),
+    'name': ('_name', None, None),
+    'amount': ('_amount', Bill._enc_amount, Bill._dec_amount),
+    'currency': ('_currency',) + _currency_codec,
+    'category': ('_category',) + _category_codec,
+    'repeat_freq': ('_freq',) + _freq_codec,
+    'due_date': ('_due', Bill._enc_date, Bill._dec_date),
+    'is_subscription': ('_subscription', None, None),
+    'created_at': ('_created', None, None),
+    'paid_date': ('_paid', Bill._enc_date, Bill._dec_date),
+}
+
+
+class RunningTotals:
+    """Per-currency sums, optionally grouped (category, month), kept up to date
+    as records come and go (v6.7.0).
+
+    Amounts are summed in minor units, so adding and removing the same bills
+    never drifts. Readers convert once per currency instead of once per bill
+    (CurrencyConverter.convert_totals).
+    """
+    def __init__(self):
+        self.sums = {}  # group -> {currency: minor units}
+
+    def clear(self):
+        self.sums.clear()
+
+    def add(self, group, currency, cents, sign=1):
+        bucket = self.sums.setdefault(group, {})
+        value = bucket.get(currency, 0) + sign * cents
+        if abs(value) < 1e-6:
+            bucket.pop(currency, None)
+            if not bucket:
+                del self.sums[group]
+        else:
+            bucket[currency] = value
+
+    def get(self, group=None):
+        """{currency: amount} for one group."""
+        return {cur: cents / 100 for cur, cents in self.sums.get(group, {}).items()}
+
+    def groups(self):
+        """{group: {currency: amount}}."""
+        return {group: {cur: cents / 100 for cur, cents in bucket.items()}
+                for group, bucket in self.sums.items()}
+
+
+class SpendingSeries:
+    """Paid amounts by due date at day, week, month and year resolution (v6.7.0).
+
+    Each level is a RunningTotals keyed by bucket ('2024-03-15', '2024-W11',
+    '2024-03', '2024'). BillLedger counts paid records in as they come and go.
+    While nobody has read the series (bulk load) only the day level is kept,
+    one add per bill like the old by-month totals; the first read rolls the
+    coarser levels up from the days, and from then on every change updates all
+    four levels in place. Cold-year segment summaries are folded in once by
+    set_cold(). version changes with every update, so the Trends chart can
+    tell when to redraw; it converts only the buckets it shows.
+    """
+    LEVELS = ('day', 'week', 'month', 'year')
+    _buckets = {}  # due date -> [(level, bucket)], shared; dates repeat a lot
+
+    def __init__(self):
+        self.days = RunningTotals()
+        self._coarse = None  # {level: RunningTotals} for week/month/year, once rolled up
+        self._cold = []  # [(level, bucket, currency, cents)] folded in by set_cold
+        self.version = 0
+
+    def clear(self):
+        self.days.clear()
+        self._coarse = None
+        self._cold = []
+        self.version += 1
+
+    @classmethod
+    def buckets(cls, stamp):
+        """[(level, bucket)] for a 'YYYY-MM-DD' date, finest first; [] if it does not parse."""
+        found = cls._buckets.get(stamp)
+        if found is None:
+            try:
+                day = date(int(stamp[:4]), int(stamp[5:7]), int(stamp[8:10]))
+            except (TypeError, ValueError):
+                found = []
+            else:
+                iso_year, iso_week, _ = day.isocalendar()
+                found = [('day', day.isoformat()), ('week', f"{iso_year}-W{iso_week:02d}"),
+                         ('month', day.isoformat()[:7]), ('year', f"{day.year:04d}")]
+            cls._buckets[stamp] = found
+        return found
+
+    def add(self, stamp, currency, cents, sign=1):
+        """RunningTotals.add keyed by due date; stamps that do not parse are skipped."""
+        buckets = self.buckets(stamp)
+        if not buckets:
+            return
+        self.version += 1
+        self.days.add(buckets[0][1], currency, cents, sign)
+        if self._coarse is not None:
+            for level, bucket in buckets[1:]:
+                self._coarse[level].add(bucket, currency, cents, sign)
+
+    def _roll_up(self):
+        coarse = {level: RunningTotals() for level in self.LEVELS[1:]}
+        for stamp, bucket in self.days.sums.items():
+            for level, group in self.buckets(stamp)[1:]:
+                for currency, cents in bucket.items():
+                    coarse[level].add(group, currency, cents)
+        self._coarse = coarse
+
+    def levels(self):
+        """{level: RunningTotals}, live; read buckets with RunningTotals.get."""
+        if self._coarse is None:
+            self._roll_up()
+        return {'day': self.days, **self._coarse}
+
+    def set_cold(self, summaries):
+        """Replace the folded-in cold-year segment summaries (paid_index values).
+
+        Summaries carry per-day totals ('days'); ones written before that only
+        have 'months', which then feed the month and year levels.
+        """
+        cold = []
+        for summary in summaries:
+            days = summary.get('days')
+            if days:
+                entries = [(level, bucket, totals) for stamp, totals in days.items()
+                           for level, bucket in self.buckets(stamp)]
+            else:
+                entries = [(level, bucket, totals) for month, totals in summary.get('months', {}).items()
+                           if len(month) == 7 for level, bucket in (('month', month), ('year', month[:4]))]
+            for level, bucket, totals in entries:
+                for currency, amount in totals.items():
+                    cold.append((level, bucket, currency, round(amount * 100)))
+        if not cold and not self._cold:
+            return  # Nothing folded in before or now; keep a bulk load lazy
+        levels = self.levels()
+        for level, bucket, currency, cents in self._cold:
+            levels[level].add(bucket, currency, cents, -1)
+        for level, bucket, currency, cents in cold:
+            levels[level].add(bucket, currency, cents)
+        self._cold = cold
+        self.version += 1
+
+
+class DueDateIndex:
+    """Unpaid bills sorted by due date, for reminders and day lookups (v6.7.0).
+
+    Keys are (due ordinal, insertion sequence, id) in one sorted list, so
+    bills due the same day keep list order. Queries bisect to the first
+    match and slice, O(log n + k). Adds are queued and merged on the next
+    query or removal: a few are insorted, a bulk load is sorted once.
+    Bills without a valid due date are not indexed.
+    """
+    MERGE_INSORT = 32  # queued adds up to this many are insorted
+
+    def __init__(self, bills):
+        self._bills = bills  # id -> bill (BillLedger._index)
+        self._keys = []
+        self._key_of = {}  # id -> key
+        self._queued = []
+        self._seq = 0
+
+    def clear(self):
+        self._keys.clear()
+        self._key_of.clear()
+        self._queued.clear()
+
+    def __len__(self):
+        return len(self._key_of)
+
+    def add(self, bill_id, ordinal):
+        if ordinal is None:
+            return
+        self._seq += 1
+        key = (ordinal, self._seq, bill_id)
+        self._key_of[bill_id] = key
+        self._queued.append(key)
+
+    def _merge(self):
+        queued = self._queued
+        if not queued:
+            return
+        if len(queued) <= self.MERGE_INSORT:
+            for key in queued:
+                bisect.insort(self._keys, key)
+        else:
+            self._keys.extend(queued)
+            self._keys.sort()
+        queued.clear()
+
+    def discard(self, bill_id):
+        key = self._key_of.pop(bill_id, None)
+        if key is None:
+            return
+        self._merge()
+        i = bisect.bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def first(self):
+        """Earliest due ordinal, or None when no unpaid bill has a due date."""
+        self._merge()
+        return self._keys[0][0] if self._keys else None
+
+    def between(self, first=None, last=None):
+        """Bills due from ordinal first to last (inclusive, None = open), in due order."""
+        self._merge()
+        keys = self._keys
+        lo = 0 if first is None else bisect.bisect_left(keys, (first,))
+        hi = len(keys) if last is None else bisect.bisect_left(keys, (last + 1,))
+        bills = self._bills
+        return [bills[key[2]] for key in keys[lo:hi]]
+
+    def on(self, ordinal):
+        """Bills due on that day."""
+        return self.between(ordinal, ordinal) if ordinal is not None else []
+
+    def within(self, days, today=None):
+        """Bills due from today through today + days."""
+        today = date.today().toordinal() if today is None else today
+        return self.between(today, today + days)
+
+    def overdue(self, today=None):
+        """Bills whose due date has passed."""
+        today = date.today().toordinal() if today is None else today
+        return self.between(None, today - 1)
+
+
+class BillLedger:
+    """Owns the unpaid/paid bill lists plus an id -> record index (v6.7.0).
+
+    Every bill gets a stable 'id' when it is created or first loaded, and UI
+    rows carry that id instead of the dict itself. Lookups are a dict hit
+    rather than a scan comparing whole dicts, which also could not tell two
+    identical bills apart. The lists are only ever mutated in place, so views
+    holding a reference to them (search, tabs) stay current.
+
+    Objects in `observers` are told about each list change before and after
+    it happens (begin_insert/end_insert, begin_remove/end_remove,
+    begin_reset/end_reset, changed), which is what BillTableModel turns
+    into Qt row signals.
+    """
+    UNPAID, PAID = 'unpaid', 'paid'
+    RESET_RUNS = 32  # removals split into more runs than this reset the view instead
+
+    def __init__(self):
+        self.unpaid = []
+        self.paid = []
+        self._index = {}   # id -> bill
+        self._status = {}  # id -> UNPAID | PAID
+        self.assigned = 0  # ids handed out by the last reset()/extend()
+        # Running totals: unpaid overall/by category, paid overall/by due date
+        # (day to year, see SpendingSeries)/by paid month
+        self.totals = {self.UNPAID: RunningTotals(), self.PAID: RunningTotals()}
+        self.unpaid_by_category = RunningTotals()
+        self.paid_series = SpendingSeries()
+        self.paid_by_paid_month = RunningTotals()
+        self._contrib = {}  # id -> [(RunningTotals, group)], currency, cents
+        self.due = DueDateIndex(self._index)  # unpaid bills by due date
+        self.observers = []
+
+    def _emit(self, event, *args):
+        for observer in self.observers:
+            getattr(observer, event)(*args)
+
+    @staticmethod
+    def new_id():
+        return uuid.uuid4().hex
+
+    def _list(self, status):
+        return self.paid if status == self.PAID else self.unpaid
+
+    def _count(self, bill, status):
+        """Add a record's amount to the running totals (and due index) for its status."""
+        if status == self.UNPAID:
+            self.due.add(bill['id'], bill.due_ordinal)
+        cents = bill.cents
+        if cents is None:
+            return
+        if status == self.PAID:
+            targets = [(self.totals[status], None),
+                       (self.paid_by_paid_month, (bill.get('paid_date') or '')[:7]),
+                       (self.paid_series, bill.get('due_date'))]
+        else:
+            targets = [(self.totals[status], None),
+                       (self.unpaid_by_category, bill.get('category', 'Other'))]
+        currency = bill.get('currency')
+        for totals, group in targets:
+            totals.add(group, currency, cents)
+        self._contrib[bill['id']] = (targets, currency, cents)
+
+    def _uncount(self, bill_id):
+        self.due.discard(bill_id)
+        entry = self._contrib.pop(bill_id, None)
+        if entry is not None:
+            targets, currency, cents = entry
+            for totals, group in targets:
+                totals.add(group, currency, cents, -1)
+
+    def _adopt(self, bill, status):
+        """Index a record as a Bill, assigning an id if it has none (or a clashing one)."""
+        bill = Bill.from_record(bill)
+        bill_id = bill.get('id')
+        if not isinstance(bill_id, str) or not bill_id or bill_id in self._index:
+            bill_id = bill['id'] = self.new_id()
+            self.assigned += 1
+        self._index[bill_id] = bill
+        self._status[bill_id] = status
+        self._count(bill, status)
+        return bill
+
+    def reset(self, unpaid, paid):
+        """Replace both lists (load, clear). Returns how many ids were assigned."""
+        self._index.clear()
+        self._status.clear()
+        self._contrib.clear()
+        self.due.clear()
+        for totals in (*self.totals.values(), self.unpaid_by_category,
+                       self.paid_series, self.paid_by_paid_month):
+            totals.clear()
+        self.assigned = 0
+        unpaid = [self._adopt(b, self.UNPAID) for b in unpaid]
+        paid = [self._adopt(b, self.PAID) for b in paid]
+        for status in (self.UNPAID, self.PAID):
+            self._emit('begin_reset', status)
+        self.unpaid[:] = unpaid
+        self.paid[:] = paid
+        for status in (self.UNPAID, self.PAID):
+            self._emit('end_reset', status)
+        return self.assigned
+
+    def __contains__(self, bill_id):
+        return bill_id in self._index
+
+    def get(self, bill_id):
+        return self._index.get(bill_id)
+
+    def status(self, bill_id):
+        return self._status.get(bill_id)
+
+    def add(self, bill, status=UNPAID, front=False):
+        """Add a new record (an 'id' copied from another bill is replaced)."""
+        if bill.get('id') in self._index and self._index[bill['id']] is not bill:
+            bill['id'] = self.new_id()
+        bill = self._adopt(bill, status)
+        self._insert(status, [bill], front)
+        return bill
+
+    def _insert(self, status, bills, front=False):
+        if not bills:
+            return
+        target = self._list(status)
+        first = 0 if front else len(target)
+        self._emit('begin_insert', status, first, first + len(bills) - 1)
+        target[first:first] = bills
+        self._emit('end_insert', status)
+
+    def extend(self, bills, status=UNPAID):
+        """Append records (import, lazily loaded history). Returns ids assigned."""
+        self.assigned = 0
+        self._insert(status, [self._adopt(b, status) for b in bills])
+        return self.assigned
+
+    def remove(self, bill_ids):
+        """Drop records by id in one pass per list. Returns the removed records."""
+        ids = {i for i in bill_ids if i in self._index}
+        removed = []
+        for status in {self._status[i] for i in ids}:
+            target = self._list(status)
+            rows = [row for row, bill in enumerate(target) if bill.get('id') in ids]
+            removed.extend(target[row] for row in rows)
+            # Contiguous runs, so views get one remove signal per block of rows
+            runs = []
+            for row in rows:
+                if runs and runs[-1][1] == row - 1:
+                    runs[-1][1] = row
+                else:
+                    runs.append([row, row])
+            if len(runs) > self.RESET_RUNS:
+                self._emit('begin_reset', status)
+                target[:] = [bill for bill in target if bill.get('id') not in ids]
+                self._emit('end_reset', status)
+                continue
+            for first, last in reversed(runs):
+                self._emit('begin_remove', status, first, last)
+                del target[first:last + 1]
+                self._emit('end_remove', status)
+        for bill_id in ids:
+            del self._index[bill_id]
+            del self._status[bill_id]
+            self._uncount(bill_id)
+        return removed
+
+    def move(self, bill_ids, status, front=False):
+        """Move records between the unpaid and paid lists (pay, restore)."""
+        bills = self.remove(i for i in bill_ids if self._status.get(i) != status)
+        for bill in bills:
+            self._index[bill['id']] = bill
+            self._status[bill['id']] = status
+            self._count(bill, status)
+        self._insert(status, bills, front)
+        return bills
+
+    def update(self, bill_id, fields):
+        """Edit a record in place; its id and any fields not given are kept."""
+        bill = self._index.get(bill_id)
+        if bill is not None:
+            fields = {k: v for k, v in fields.items() if k != 'id'}
+            self._uncount(bill_id)
+            bill.update(fields)
+            status = self._status[bill_id]
+            self._count(bill, status)
+            if self.observers:
+                row = next((r for r, b in enumerate(self._list(status)) if b is bill), None)
+                if row is not None:
+                    self._emit('changed', status, row)
+        return bill
+
+
+class KeysSealedError(RuntimeError):
+    """A PIN key was requested while the app is locked (DataManager.seal)."""
+
+
 class DataManager:
     """Handles loading and saving of config and application data."""
+    # SQLite saves are per-row; a restore point copies the whole database, so
+    # it is only taken every so many saves, after a while, or on compact()
+    SQLITE_BACKUP_SAVES = 200
+    SQLITE_BACKUP_INTERVAL = 30 * 60  # seconds
+
     def __init__(self, config_dir):
         self.config_dir = config_dir
         self.config_file = os.path.join(self.config_dir, 'config.json')
         self.data_file = os.path.join(self.config_dir, 'bill_data.json')
         self.security_file = os.path.join(self.config_dir, 'security.json')
+        self.storage_backend = 'json'  # 'json' or 'sqlite' (see SQLiteStore)
+        self._sqlite_store = None
+        self._sqlite_saves = 0  # SQLite saves since the last restore point
+        self._sqlite_backup_at = time.monotonic()
+        self._key_cache = {}
+        self._key_cache_lock = threading.Lock()
+        self._sealed = False  # Locked app: PIN keys may not be derived (see seal)
+        self._journal = None
+        self._compact_thread = None
+        self._io_lock = threading.RLock()  # Serialises background saves with loads/restores
+        self._backup_store = None
+        self._segments = None
+        self._config_cache = None  # ((mtime_ns, size), pin, config) of the last load_config
         
         os.makedirs(self.config_dir, exist_ok=True)
         
@@ -1043,7 +2099,55 @@ class DataManager:
         self.sync_path = self.config.get('sync_path')
 
     def _get_fernet(self, pin=None):
-        """Derive key from PIN or use fallback obfuscation key."""
+        """Derive key from PIN or use fallback obfuscation key.
+
+        Derived keys are cached for the unlocked session (v6.7.0) so saves,
+        loads and timer-driven config reads don't re-run PBKDF2 each time.
+        The cache is keyed by a salt+PIN fingerprint, never the PIN itself,
+        and is emptied by seal() when the app locks.
+        """
+        return Fernet(self._get_key(pin))
+
+    def _get_key(self, pin=None):
+        if pin and self._sealed:
+            raise KeysSealedError("PIN keys are unavailable while the app is locked")
+        cache_key = self._key_token(pin) if pin else None
+        with self._key_cache_lock:
+            key = self._key_cache.get(cache_key)
+        if key is not None:
+            return key
+        key = self._derive_key(pin)
+        with self._key_cache_lock:
+            self._key_cache[cache_key] = key
+        return key
+
+    def _get_backup_mac_key(self, pin=None):
+        """Key for backup chunk IDs, so stored hashes reveal nothing without the PIN."""
+        if not pin:
+            return None
+        return hmac.new(self._get_key(pin), b'billtracker-backup-chunk-ids', hashlib.sha256).digest()
+
+    def clear_key_cache(self):
+        """Forget all derived keys."""
+        with self._key_cache_lock:
+            self._key_cache.clear()
+
+    def seal(self):
+        """Drop derived keys and refuse to derive PIN keys until unseal() (app locked).
+
+        Callers flush their pending saves first; a compaction still running
+        is allowed to finish with the key it already holds.
+        """
+        self.wait_for_compaction()
+        self._sealed = True
+        self.clear_key_cache()
+
+    def unseal(self):
+        self._sealed = False
+
+    def _derive_key(self, pin=None):
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
         if pin:
             kdf = PBKDF2HMAC(
                 algorithm=hashes.SHA256(),
@@ -1051,18 +2155,16 @@ class DataManager:
                 salt=base64.b64decode(self.encryption_salt),
                 iterations=100000,
             )
-            key = base64.urlsafe_b64encode(kdf.derive(pin.encode()))
-        else:
-            # Fallback obfuscation key (stable but not as secure as PIN-derived)
-            # This is used when PIN is not enabled for basic non-readability
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=b'static_salt_for_obfuscation',
-                iterations=1000,
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(b"default_obfuscation_key"))
-        return Fernet(key)
+            return base64.urlsafe_b64encode(kdf.derive(pin.encode()))
+        # Fallback obfuscation key (stable but not as secure as PIN-derived)
+        # This is used when PIN is not enabled for basic non-readability
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=b'static_salt_for_obfuscation',
+            iterations=1000,
+        )
+        return base64.urlsafe_b64encode(kdf.derive(b"default_obfuscation_key"))
 
     def load_security(self):
         """Load security metadata from separate file (Obfuscated)."""
@@ -1101,7 +2203,19 @@ class DataManager:
             logging.error(f"Error saving security metadata: {e}")
 
     def load_config(self, pin=None):
-        if os.path.exists(self.config_file):
+        # Reminder ticks and settings ask for the config often; reuse the last
+        # parse while the file is unchanged (v6.7.0)
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            stat = None
+        cached = self._config_cache
+        if stat is not None and cached and cached[0] == (stat.st_mtime_ns, stat.st_size) and cached[1] == pin:
+            config = copy.deepcopy(cached[2])
+            self.data_file = config.get('data_file_path', self.data_file)
+            self.storage_backend = config.get('storage_backend', self.storage_backend)
+            return config
+        if stat is not None:
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -1124,6 +2238,9 @@ class DataManager:
                         return {}
                 
                 self.data_file = config.get('data_file_path', self.data_file)
+                self.storage_backend = config.get('storage_backend', self.storage_backend)
+                if isinstance(config, dict):
+                    self._config_cache = ((stat.st_mtime_ns, stat.st_size), pin, copy.deepcopy(config))
                 return config
             except (IOError, OSError) as e:
                 logging.error(f"Error loading config: {e}")
@@ -1131,6 +2248,7 @@ class DataManager:
         return {}
 
     def save_config(self, config_data, pin=None):
+        self._config_cache = None
         try:
             # Check if PIN is enabled in config
             should_encrypt = pin or config_data.get('pin_enabled', False)
@@ -1156,17 +2274,187 @@ class DataManager:
         except (IOError, OSError) as e:
             logging.error(f"Error saving config: {e}")
 
+    @property
+    def sqlite_file(self):
+        return os.path.splitext(self.data_file)[0] + '.db'
+
+    def _get_sqlite_store(self):
+        """Open (or re-open after a path change) the SQLite storage engine."""
+        if self._sqlite_store is None or self._sqlite_store.db_path != self.sqlite_file:
+            if self._sqlite_store is not None:
+                self._sqlite_store.close()
+            self._sqlite_store = SQLiteStore(self.sqlite_file)
+        return self._sqlite_store
+
+    def _get_journal(self):
+        """Mutation journal for the current data file (re-created after a path change)."""
+        path = self.data_file + '.journal'
+        if self._journal is None or self._journal.path != path:
+            self.wait_for_compaction()
+            self._journal = MutationJournal(path)
+        return self._journal
+
+    def _key_token(self, pin):
+        """In-memory fingerprint of the active key, so a PIN change re-encrypts rows."""
+        return hashlib.sha256(f"{self.encryption_salt}:{pin or ''}".encode('utf-8')).hexdigest()
+
     def load_data(self, pin=None):
+        """Load the hot data. Cold paid history stays on disk (see load_paid_history)."""
+        with self._io_lock:
+            if self.storage_backend == 'sqlite':
+                data = self._load_data_sqlite(pin)
+            else:
+                data = self._load_data_json(pin)
+            self._get_segments().index = dict(data.get('paid_index') or {})
+            return data
+
+    def _get_segments(self):
+        if self._segments is None or self._segments.data_file != self.data_file:
+            self._segments = HistorySegments(self.data_file)
+        return self._segments
+
+    def load_paid_history(self, pin=None):
+        """Decrypt all cold paid-history segments. Returns (records, tampered)."""
+        with self._io_lock:
+            return self._get_segments().read_all(self._get_fernet(pin) if pin else None)
+
+    def needs_segmenting(self, paid_bills):
+        """True if complete paid history still holds records that belong in cold segments."""
+        return bool(self._get_segments().partition(paid_bills)[1])
+
+    def rekey_history(self, old_pin, new_pin):
+        """Re-encrypt cold segments when the PIN is set, changed or removed."""
+        with self._io_lock:
+            try:
+                self._get_segments().rekey(self._get_fernet(old_pin) if old_pin else None,
+                                           self._get_fernet(new_pin) if new_pin else None)
+            except (IOError, OSError, UnicodeDecodeError) as e:
+                logging.error(f"Re-encrypting paid history failed: {e}")
+
+    def retire_history(self, paid_index, paid_bills, pin=None):
+        """Move paid years that left the hot window into segments while the
+        rest of the history stays unloaded (paid_index is set).
+
+        Returns (new paid_index, records moved); the caller drops those
+        records from its hot list and saves.
+        """
+        with self._io_lock:
+            segments = self._get_segments()
+            segments.index = dict(paid_index)
+            cold = {year: [r.to_dict() if isinstance(r, Bill) else r for r in records]
+                    for year, records in segments.partition(paid_bills)[1].items()}
+            try:
+                index, written, years = segments.add(cold, self._get_fernet(pin) if pin else None)
+            except (IOError, OSError) as e:
+                logging.error(f"Writing paid history segments failed, keeping history in the main file: {e}")
+                return paid_index, []
+            self._sync_segments(written)
+            moved = set(years)
+            return index, [r for r in paid_bills if segments.record_year(r) in moved]
+
+    def _sync_segments(self, paths):
+        if self.sync_path and os.path.isdir(self.sync_path):
+            for path in paths:
+                try:
+                    shutil.copy2(path, os.path.join(self.sync_path, os.path.basename(path)))
+                except (IOError, OSError) as e:
+                    logging.error(f"Sync failed: {e}")
+
+    def _segment_history(self, data, pin):
+        """Move cold paid bills into their segments before the hot data is written.
+
+        Data carrying a 'paid_index' holds only hot paid bills (history was never
+        loaded), so the existing segments are kept as they are.
+        """
+        segments = self._get_segments()
+        if data.get('paid_index'):
+            segments.index = dict(data['paid_index'])
+            return data
+        try:
+            hot, index, written = segments.write(data.get('paid_bills') or [], self._get_fernet(pin) if pin else None)
+        except (IOError, OSError) as e:
+            logging.error(f"Writing paid history segments failed, keeping history in the main file: {e}")
+            return data
+        self._sync_segments(written)
+        hot_data = dict(data)
+        hot_data['paid_bills'] = hot
+        if index:
+            hot_data['paid_index'] = index
+        else:
+            hot_data.pop('paid_index', None)
+        return hot_data
+
+    def export_data_file(self, target_path, pin=None):
+        """Write the complete data (hot + all cold history) as one file, encrypted like the main file."""
+        with self._io_lock:
+            data = self.load_data(pin)
+            data.pop('__tampered__', None)
+            if data.get('paid_index'):
+                cold, _ = self.load_paid_history(pin)
+                data['paid_bills'] = data.get('paid_bills', []) + cold
+                del data['paid_index']
+            payload = json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+            if pin:
+                payload = self._get_fernet(pin).encrypt(payload)
+            with open(target_path, 'wb') as f:
+                f.write(payload)
+            return True
+
+    def _load_data_sqlite(self, pin=None):
+        store = self._get_sqlite_store()
+        if not store.exists() and os.path.exists(self.data_file):
+            # MIGRATION: First start on the SQLite engine, import bill_data.json once
+            data = self._load_data_json(pin)
+            if data and not data.get('__tampered__'):
+                try:
+                    store.sync(data, self._get_fernet(pin) if pin else None, self._key_token(pin))
+                    logging.info(f"Migrated {self.data_file} to SQLite storage at {store.db_path}")
+                except sqlite3.Error as e:
+                    logging.error(f"SQLite migration failed: {e}")
+            return data
+        try:
+            data = store.load(self._get_fernet(pin) if pin else None, self._key_token(pin))
+        except sqlite3.Error as e:
+            logging.error(f"SQLite error loading data: {e}")
+            return {}
+        is_tampered = data.pop('__tampered__', False)
+        safe_data = self._sanitize_data(data)
+        if is_tampered:
+            safe_data['__tampered__'] = True
+        return safe_data
+
+    def _sanitize_data(self, data):
+        """Schema validation and category/frequency normalization for loaded data."""
+        safe_data = {}
+        safe_data['budget'] = float(data.get('budget', 0.0))
+        safe_data['unpaid_bills'] = [b for b in data.get('unpaid_bills', []) if isinstance(b, dict) and ('name' in b or 'amount' in b)]
+        safe_data['paid_bills'] = [b for b in data.get('paid_bills', []) if isinstance(b, dict) and ('name' in b or 'amount' in b)]
+        safe_data['budget_currency'] = str(data.get('budget_currency', '$ (USD)'))
+        safe_data['bill_currency'] = str(data.get('bill_currency', '$ (USD)'))
+        safe_data['summary_currency'] = str(data.get('summary_currency', '$ (USD)'))
+        safe_data['custom_categories'] = data.get('custom_categories', [])
+        safe_data['savings_goals'] = data.get('savings_goals', [])
+        if isinstance(data.get('paid_index'), dict):
+            safe_data['paid_index'] = data['paid_index']
+        for key in ('subscription_currency', 'savings_currency'):
+            if data.get(key):
+                safe_data[key] = str(data[key])
+        
+        # MIGRATION: Normalize categories
+        for bill in safe_data['unpaid_bills'] + safe_data['paid_bills']:
+            if 'category' in bill:
+                bill['category'] = get_canonical_category(bill['category'])
+            if 'repeat_freq' in bill:
+                bill['repeat_freq'] = get_canonical_frequency(bill['repeat_freq'])
+        return safe_data
+
+    def _load_data_json(self, pin=None):
         if os.path.exists(self.data_file):
             try:
-                # Security: Check file size (max 10MB to prevent DoS)
-                file_size = os.path.getsize(self.data_file)
-                if file_size > 10 * 1024 * 1024:
-                    logging.error(f"Data file too large: {file_size} bytes (max 10MB)")
-                    return {}
-                
+                # No size cap (v6.7.0): old paid history lives in per-year
+                # segments, so the main file stays small (see HistorySegments)
                 with open(self.data_file, 'rb') as f:
-                    raw_content = f.read(10 * 1024 * 1024)  # Max 10MB read
+                    raw_content = f.read()
                 
                 if not raw_content:
                     logging.warning(f"Data file {self.data_file} is empty (0 bytes). Returning empty data.")
@@ -1205,27 +2493,24 @@ class DataManager:
                 if not isinstance(data, dict):
                     print(f"DEBUG: Data loaded from '{self.data_file}' is not a dict: {type(data)}", flush=True)
                     return {}
+
+                # Replay the mutation journal on top of the snapshot (v6.7.0)
+                journal = self._get_journal()
+                self.wait_for_compaction()
+                snapshot_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+                if journal.replay(data, snapshot_hash, self._get_fernet(pin) if pin else None):
+                    journal.prime(data, self._key_token(pin))
+                    journal.snapshot_size = len(content)
+                else:
+                    journal.reset()  # Next save writes a full snapshot
+                if journal.tampered:
+                    is_tampered = True
                     
                 print(f"DEBUG: Data loaded successfully. Keys: {list(data.keys())}", flush=True)
                 print(f"DEBUG: Raw Currency Data in File: Budget='{data.get('budget_currency')}', Bill='{data.get('bill_currency')}', Summary='{data.get('summary_currency')}'", flush=True)
                 
                 # Schema validation (rest of the logic remains same)
-                safe_data = {}
-                safe_data['budget'] = float(data.get('budget', 0.0))
-                safe_data['unpaid_bills'] = [b for b in data.get('unpaid_bills', []) if isinstance(b, dict) and ('name' in b or 'amount' in b)]
-                safe_data['paid_bills'] = [b for b in data.get('paid_bills', []) if isinstance(b, dict) and ('name' in b or 'amount' in b)]
-                safe_data['budget_currency'] = str(data.get('budget_currency', '$ (USD)'))
-                safe_data['bill_currency'] = str(data.get('bill_currency', '$ (USD)'))
-                safe_data['summary_currency'] = str(data.get('summary_currency', '$ (USD)'))
-                safe_data['custom_categories'] = data.get('custom_categories', [])
-                safe_data['savings_goals'] = data.get('savings_goals', [])
-                
-                # MIGRATION: Normalize categories
-                for bill in safe_data['unpaid_bills'] + safe_data['paid_bills']:
-                    if 'category' in bill:
-                        bill['category'] = get_canonical_category(bill['category'])
-                    if 'repeat_freq' in bill:
-                        bill['repeat_freq'] = get_canonical_frequency(bill['repeat_freq'])
+                safe_data = self._sanitize_data(data)
                 
                 if is_tampered:
                     safe_data['__tampered__'] = True
@@ -1243,11 +2528,120 @@ class DataManager:
         return {}
 
     def save_data(self, data_to_save, pin=None):
+        with self._io_lock:
+            data_to_save = self._segment_history(data_to_save, pin)
+            if self.storage_backend == 'sqlite':
+                return self._save_data_sqlite(data_to_save, pin)
+            return self._save_data_json(data_to_save, pin)
+
+    def _save_data_sqlite(self, data_to_save, pin=None):
+        try:
+            store = self._get_sqlite_store()
+            store.sync(data_to_save, self._get_fernet(pin) if pin else None, self._key_token(pin))
+        except sqlite3.Error as e:
+            logging.exception(f"Error saving data to SQLite: {e}")
+            return False
+        self._sqlite_saves += 1
+        if (self._sqlite_saves >= self.SQLITE_BACKUP_SAVES
+                or time.monotonic() - self._sqlite_backup_at >= self.SQLITE_BACKUP_INTERVAL):
+            self._backup_sqlite(pin)
+        return True
+
+    def _backup_sqlite(self, pin=None):
+        self._sqlite_saves = 0
+        self._sqlite_backup_at = time.monotonic()
+        self.backup_data(pin=pin)
+
+    def _save_data_json(self, data_to_save, pin=None):
+        """Journal the change if possible, otherwise rewrite the full snapshot."""
+        journal = self._get_journal()
+        if os.path.exists(self.data_file):
+            try:
+                if journal.append(data_to_save, self._get_fernet(pin) if pin else None, self._key_token(pin)):
+                    if self.sync_path and os.path.isdir(self.sync_path):
+                        # The sync copy is a full file; keep it current on every save
+                        with journal.lock:
+                            final_data = journal.render().encode('utf-8')
+                        if pin:
+                            final_data = self._get_fernet(pin).encrypt(final_data)
+                        self._write_sync_copy(final_data)
+                    if journal.should_compact():
+                        self.compact(pin)
+                    return True
+            except (IOError, OSError) as e:
+                logging.warning(f"Journal append failed, writing full snapshot: {e}")
+        return self._write_full_snapshot(data_to_save, pin)
+
+    def _write_full_snapshot(self, data_to_save, pin=None):
+        self.wait_for_compaction()
+        journal = self._get_journal()
+        try:
+            with journal.lock:
+                journal.prime(data_to_save, self._key_token(pin))
+                content = journal.render()
+                if not self._write_snapshot(content, pin):
+                    journal.reset()
+                    return False
+                journal.snapshot_size = len(content)
+                journal.start(hashlib.sha256(content.encode('utf-8')).hexdigest(), self._get_fernet(pin) if pin else None)
+                if os.path.exists(journal.old_path):
+                    os.remove(journal.old_path)
+            return True
+        except (IOError, OSError) as e:
+            logging.exception(f"Error starting data journal: {e}")
+            journal.reset()
+            return False
+
+    def compact(self, pin=None, wait=False):
+        """Fold the journal into a new snapshot on a background thread.
+
+        With the SQLite backend this records the restore point outstanding saves
+        have not triggered yet.
+        """
+        if self.storage_backend == 'sqlite':
+            if self._sqlite_saves:
+                with self._io_lock:
+                    self._backup_sqlite(pin)
+            return
+        journal = self._journal
+        if journal is None or not journal.primed or journal.broken:
+            return
+        if wait:
+            self.wait_for_compaction()
+        elif self._compact_thread is not None and self._compact_thread.is_alive():
+            return
+        if journal.records == 0:
+            return
+        try:
+            content = journal.roll(self._get_fernet(pin) if pin else None)
+        except (IOError, OSError) as e:
+            logging.error(f"Journal compaction could not start: {e}")
+            journal.broken = True
+            return
+        self._compact_thread = threading.Thread(target=self._compact_worker, args=(journal, content, pin),
+                                                name="JournalCompaction", daemon=True)
+        self._compact_thread.start()
+        if wait:
+            self._compact_thread.join()
+
+    def _compact_worker(self, journal, content, pin):
+        if self._write_snapshot(content, pin):
+            journal.snapshot_size = len(content)
+            try:
+                os.remove(journal.old_path)
+            except OSError:
+                pass
+        else:
+            journal.broken = True
+
+    def wait_for_compaction(self):
+        thread = self._compact_thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join()
+
+    def _write_snapshot(self, json_str, pin=None, backup=True):
         import time
         try:
-            # Prepare data
-            json_str = json.dumps(data_to_save, indent=4, ensure_ascii=False)
-            
             # 1. Integrity: Calculate and Save Hash (on plain JSON)
             data_hash = hashlib.sha256(json_str.encode('utf-8')).hexdigest()
             hash_file = self.data_file + ".sha256"
@@ -1289,47 +2683,152 @@ class DataManager:
                     raise e
             
             # Backup after successful save
-            self.backup_data()
+            if backup:
+                self.backup_data(json_str, pin)
             
             # Also save to sync path if enabled
-            if self.sync_path and os.path.isdir(self.sync_path):
-                try:
-                    sync_file = os.path.join(self.sync_path, 'bill_data.json')
-                    with open(sync_file, 'wb') as f: # Use wb for encrypted binary
-                        f.write(encrypted_data)
-                    logging.info(f"Data synced to {self.sync_path}")
-                except Exception as e:
-                    logging.error(f"Sync failed: {e}")
+            self._write_sync_copy(final_data)
             
             return True
         except (IOError, OSError) as e:
             logging.exception(f"Error saving data: {e}")
+            return False
 
-    def backup_data(self):
-        """Create a rotating backup of the data file."""
-        if not os.path.exists(self.data_file):
+    def _write_sync_copy(self, final_data):
+        """Mirror the (encrypted) data file into the cloud sync folder if one is set."""
+        if self.sync_path and os.path.isdir(self.sync_path):
+            try:
+                sync_file = os.path.join(self.sync_path, 'bill_data.json')
+                with open(sync_file, 'wb') as f: # Use wb for encrypted binary
+                    f.write(final_data)
+                logging.info(f"Data synced to {self.sync_path}")
+            except Exception as e:
+                logging.error(f"Sync failed: {e}")
+
+    @property
+    def backup_dir(self):
+        return self.config.get('backup_dir') or os.path.join(self.config_dir, 'backups')
+
+    def _get_backup_store(self):
+        root = os.path.join(self.backup_dir, 'store')
+        if self._backup_store is None or self._backup_store.root != root:
+            self._backup_store = BackupStore(root)
+        return self._backup_store
+
+    def _read_snapshot_text(self, pin=None):
+        """Plain JSON text of the snapshot on disk (journal not applied)."""
+        with open(self.data_file, 'rb') as f:
+            raw = f.read()
+        if pin:
+            try:
+                return self._get_fernet(pin).decrypt(raw).decode('utf-8')
+            except InvalidToken:
+                pass  # Written before the PIN was set
+        return raw.decode('utf-8')
+
+    def backup_data(self, content=None, pin=None):
+        """Record a restore point in the deduplicated backup store.
+
+        content is the plain snapshot text when the caller already has it;
+        otherwise the current data file is read.
+        """
+        use_sqlite = self.storage_backend == 'sqlite'
+        if not os.path.exists(self.sqlite_file if use_sqlite else self.data_file):
             return
             
         try:
-            # Use configured backup dir or default
-            backup_dir = self.config.get('backup_dir')
-            if not backup_dir:
-                backup_dir = os.path.join(self.config_dir, 'backups')
-            
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_path = os.path.join(backup_dir, f"bill_data_{timestamp}.json")
-            
-            shutil.copy2(self.data_file, backup_path)
-            
-            # Rotate: Keep last 5 (Per folder)
-            backups = sorted([os.path.join(backup_dir, f) for f in os.listdir(backup_dir) if f.startswith('bill_data_')])
-            while len(backups) > 5:
-                os.remove(backups.pop(0))
+            store = self._get_backup_store()
+            if use_sqlite:
+                os.makedirs(store.root, exist_ok=True)
+                tmp_path = os.path.join(store.root, 'snapshot.db.tmp')
+                try:
+                    self._get_sqlite_store().backup_to(tmp_path)
+                    with open(tmp_path, 'rb') as f:
+                        data = f.read()
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                kind = 'db'
+            else:
+                if content is None:
+                    content = self._read_snapshot_text(pin)
+                data = content.encode('utf-8')
+                kind = 'json'
+            files = {'snapshot': data}
+            # Cold history segments go in as stored (already encrypted); unchanged
+            # years dedupe to the same blobs
+            segments = self._get_segments()
+            for year, path in segments.existing_files().items():
+                if year in segments.index:
+                    with open(path, 'rb') as f:
+                        files[f'paid-{year}'] = f.read()
+            keep = self.config.get('backup_keep') or BackupStore.MAX_POINTS
+            store.add(files, kind, self._get_fernet(pin) if pin else None, self._get_backup_mac_key(pin), keep)
         except Exception as e:
             logging.error(f"Backup failed: {e}")
 
+    def list_backups(self):
+        """Restore point names, oldest first (store points plus legacy backup files)."""
+        names = [p['name'] for p in self._get_backup_store().points()]
+        if os.path.isdir(self.backup_dir):
+            names += [f for f in os.listdir(self.backup_dir) if f.startswith('bill_data_')
+                      and os.path.isfile(os.path.join(self.backup_dir, f))]
+        def order(name):
+            match = re.match(r'bill_data_(\d{8}_\d{6})(?:_(\d+))?', name)
+            return (match.group(1), int(match.group(2) or 0)) if match else (name, 0)
+        return sorted(set(names), key=order)
+
+    def legacy_backup_path(self, name):
+        """Path of a pre-v6.7.0 whole-file backup, or None if name is a store point."""
+        path = os.path.join(self.backup_dir, name)
+        return path if os.path.isfile(path) else None
+
+    def restore_backup(self, name, pin=None):
+        """Restore a backup by name into the live data file."""
+        legacy = self.legacy_backup_path(name)
+        if legacy:
+            return self.restore_file(legacy, 'data')
+        with self._io_lock:
+            try:
+                files, kind = self._get_backup_store().read(name, self._get_fernet(pin) if pin else None,
+                                                          self._get_backup_mac_key(pin))
+                data = files.pop('snapshot')
+                self.wait_for_compaction()
+                self._get_journal().discard()
+                if self._sqlite_store is not None:
+                    self._sqlite_store.close()
+                for suffix in ('-wal', '-shm'):
+                    if os.path.exists(self.sqlite_file + suffix):
+                        os.remove(self.sqlite_file + suffix)
+                segments = self._get_segments()
+                for path in segments.existing_files().values():
+                    os.remove(path)
+                for fname, blob in files.items():
+                    if fname.startswith('paid-'):
+                        with open(segments.path(fname[len('paid-'):]), 'wb') as f:
+                            f.write(blob)
+                segments.index = {}
+                if kind == 'db':
+                    tmp = self.sqlite_file + '.tmp'
+                    with open(tmp, 'wb') as f:
+                        f.write(data)
+                    os.replace(tmp, self.sqlite_file)
+                    return True
+                if self.storage_backend == 'sqlite' and os.path.exists(self.sqlite_file):
+                    # A JSON restore supersedes the database; it is re-imported on next load
+                    os.remove(self.sqlite_file)
+                return self._write_snapshot(data.decode('utf-8'), pin, backup=False)
+            except Exception as e:
+                logging.error(f"Restore of backup {name} failed: {e}")
+                raise
+
+    def delete_backup(self, name, pin=None):
+        legacy = self.legacy_backup_path(name)
+        if legacy:
+            os.remove(legacy)
+            return True
+        return self._get_backup_store().remove(name, self._get_fernet(pin) if pin else None)
+
     def backup_config(self, target_path, pin=None):
         """Backup configuration to specific target."""
         if not os.path.exists(self.config_file):
@@ -1345,11 +2844,32 @@ class DataManager:
         """Restore file from source_path.
         file_type: 'data' or 'config'
         """
+        with self._io_lock:
+            return self._restore_file(source_path, file_type)
+
+    def _restore_file(self, source_path, file_type):
         try:
             target = self.data_file if file_type == 'data' else self.config_file
+            self._config_cache = None
+            if file_type == 'data':
+                # The journal belongs to the snapshot being replaced
+                self.wait_for_compaction()
+                self._get_journal().discard()
+            if file_type == 'data' and self._sqlite_store is not None:
+                # Drop the open connection and row index; they describe the old file
+                self._sqlite_store.close()
+            if file_type == 'data' and (source_path.endswith('.db') or self.storage_backend == 'sqlite'):
+                for suffix in ('-wal', '-shm'):
+                    if os.path.exists(self.sqlite_file + suffix):
+                        os.remove(self.sqlite_file + suffix)
+                if source_path.endswith('.db'):
+                    target = self.sqlite_file
+                elif os.path.exists(self.sqlite_file):
+                    # A JSON restore supersedes the database; it is re-imported on next load
+                    os.remove(self.sqlite_file)
             
             # Simple integrity check before copy?
-            with open(source_path, 'r', encoding='utf-8') as f:
+            with open(source_path, 'rb') as f:
                 content = f.read(1024) # Read header
                 # Basic check: JSON?
                 # If encrypted, it might be weird chars, but decent JSON parsers might fail fast.
@@ -1364,6 +2884,7 @@ class DataManager:
             return False
 
     def save_rates_cache(self, rates_data):
+        """Persist rates with their fetch time and HTTP validators (v6.7.0)."""
         try:
             cache_file = os.path.join(self.config_dir, 'rates_cache.json')
             with open(cache_file, 'w', encoding='utf-8') as f:
@@ -1475,42 +2996,264 @@ class DraggableFrame(QFrame):
             super().mouseMoveEvent(event)
 
 
-class APIThread(QThread):
-    """Background thread for fetching currency rates."""
-    finished = pyqtSignal(dict)
+class RateProvider:
+    """One exchange-rate endpoint with its latency and health record (v6.7.0).
+
+    rates_key/base_key name the fields of its JSON answer. latency is a
+    moving average of successful (or cancelled-while-slow) fetches;
+    consecutive failures or a high latency demote the provider, so the
+    registry starts it only after a head start for the healthy ones.
+    """
+    FAILURES_TO_DEMOTE = 2
+    SLOW_LATENCY = 2.0  # seconds
+    SMOOTHING = 0.3
+
+    def __init__(self, name, url, rates_key='rates', base_key='base'):
+        self.name = name
+        self.url = url
+        self.rates_key = rates_key
+        self.base_key = base_key
+        self.latency = None
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"RateProvider({self.name!r}, latency={self.latency}, failures={self.failures})"
+
+    @property
+    def demoted(self):
+        return (self.failures >= self.FAILURES_TO_DEMOTE
+                or (self.latency is not None and self.latency > self.SLOW_LATENCY))
+
+    def rank(self):
+        return (self.demoted, self.latency if self.latency is not None else 0.0)
+
+    def parse(self, payload):
+        """Normalised {'conversion_rates', 'base_code'} or None if the answer is unusable."""
+        data = json.loads(payload)
+        rates = data.get(self.rates_key) if isinstance(data, dict) else None
+        if not isinstance(rates, dict) or not rates:
+            return None
+        return {'conversion_rates': rates, 'base_code': data.get(self.base_key, 'USD')}
 
-    def run(self):
-        primary_url = "https://api.exchangerate.host/latest?base=USD"
-        fallback_url = "https://open.er-api.com/v6/latest/USD"
-        
+    def record(self, ok, elapsed=None):
+        with self._lock:
+            if ok:
+                self.failures = 0
+            else:
+                self.failures += 1
+            if elapsed is not None:
+                self.latency = elapsed if self.latency is None else (
+                    self.SMOOTHING * elapsed + (1 - self.SMOOTHING) * self.latency)
+
+    def record_cancelled(self, elapsed):
+        """A fetch cut short by a faster peer: it took at least elapsed."""
+        with self._lock:
+            if self.latency is None or elapsed > self.latency:
+                self.latency = elapsed if self.latency is None else (
+                    self.SMOOTHING * elapsed + (1 - self.SMOOTHING) * self.latency)
+
+    def fetch(self, timeout, track, validators=None):
+        """GET the endpoint; track(conn) lets the registry abort it. Returns parsed data or None.
+
+        validators ({'etag', 'last_modified'} from an earlier answer) make the
+        request conditional; a 304 returns {'not_modified': True}. Parsed
+        data carries the response's own validators.
+        """
+        parts = urllib.parse.urlsplit(self.url)
+        if parts.scheme == 'https':
+            conn = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=timeout,
+                                               context=ssl.create_default_context())
+        elif parts.scheme == 'http':
+            conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=timeout)
+        else:
+            raise ValueError(f"Unsupported rate provider URL: {self.url}")
+        track(conn)
         try:
-            ctx = ssl.create_default_context()
-            with urllib.request.urlopen(primary_url, context=ctx, timeout=10) as response:
-                if response.status == 200:
-                    content = response.read().decode('utf-8')
-                    data = json.loads(content)
-                    if 'rates' in data and isinstance(data['rates'], dict) and data['rates']:
-                        normalized = {'conversion_rates': data['rates'], 'base_code': data.get('base', 'USD')}
-                        self.finished.emit({'status': 'success', 'data': normalized})
-                        return
-        except (urllib.error.URLError, json.JSONDecodeError, ssl.SSLError, TimeoutError) as e:
-            logging.warning(f"Primary API request failed: {e}")
+            path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+            headers = {'User-Agent': 'Mozilla/5.0', 'Accept': 'application/json'}
+            if validators:
+                if validators.get('etag'):
+                    headers['If-None-Match'] = validators['etag']
+                if validators.get('last_modified'):
+                    headers['If-Modified-Since'] = validators['last_modified']
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+            payload = response.read()
+            if response.status == 304 and validators:
+                return {'not_modified': True}
+            if response.status != 200:
+                raise http.client.HTTPException(f"HTTP {response.status}")
+            data = self.parse(payload.decode('utf-8'))
+            if data:
+                data['etag'] = response.getheader('ETag')
+                data['last_modified'] = response.getheader('Last-Modified')
+            return data
+        finally:
+            conn.close()
 
-        # Fallback
-        try:
-            ctx = ssl.create_default_context()
-            with urllib.request.urlopen(fallback_url, context=ctx, timeout=10) as response:
-                if response.status == 200:
-                    content = response.read().decode('utf-8')
-                    data = json.loads(content)
-                    if 'rates' in data and isinstance(data['rates'], dict) and data['rates']:
-                        normalized = {'conversion_rates': data['rates'], 'base_code': data.get('base_code', 'USD')}
-                        self.finished.emit({'status': 'success', 'data': normalized})
-                        return
-        except (urllib.error.URLError, json.JSONDecodeError, ssl.SSLError, TimeoutError) as e:
-            logging.warning(f"Fallback API request failed: {e}")
 
-        self.finished.emit({'status': 'error', 'message': STRINGS["network_error"]})
+class RateProviderRegistry:
+    """Registered rate providers, queried concurrently (v6.7.0).
+
+    race() starts every provider on its own daemon thread, healthy ones
+    first and demoted ones HEDGE_DELAY later (or as soon as all healthy ones
+    have failed). It returns once quorum valid answers are in (the median of
+    each rate when quorum > 1) and aborts the fetches still running. The
+    provider that produced the cached rates gets a conditional request; its
+    304 counts as an answer with the cached rates.
+    """
+    HEDGE_DELAY = 1.5  # seconds
+
+    def __init__(self):
+        self._providers = {}
+
+    def register(self, provider):
+        self._providers[provider.name] = provider
+        return provider
+
+    def unregister(self, name):
+        return self._providers.pop(name, None)
+
+    def providers(self):
+        """Providers in the order they are tried, fastest healthy first."""
+        return sorted(self._providers.values(), key=RateProvider.rank)
+
+    def race(self, timeout=10, quorum=1, cached=None):
+        """Returns (data, [provider names]) or (None, []) if no provider answered.
+
+        cached is the rates cache ('provider', 'etag', 'last_modified',
+        'conversion_rates', 'base_code'); data is marked 'not_modified' when it
+        was confirmed rather than downloaded.
+        """
+        providers = self.providers()
+        if not providers:
+            return None, []
+        prompt = [p for p in providers if not p.demoted] or providers
+        cond = threading.Condition()
+        answers = []  # (provider, data or None)
+        conns = set()
+        state = {'done': False, 'hedge': len(prompt) == len(providers)}
+
+        def track(conn):
+            with cond:
+                if state['done']:
+                    raise ConnectionAbortedError("race already decided")
+                conns.add(conn)
+
+        def worker(provider, hedged):
+            with cond:
+                if hedged:
+                    cond.wait_for(lambda: state['hedge'] or state['done'], self.HEDGE_DELAY)
+                if state['done']:
+                    return
+            validators = cached if cached and cached.get('provider') == provider.name else None
+            t0 = time.perf_counter()
+            try:
+                data = provider.fetch(timeout, track, validators)
+                if data and data.get('not_modified'):
+                    data = {'conversion_rates': cached['conversion_rates'],
+                            'base_code': cached.get('base_code', 'USD'),
+                            'etag': cached.get('etag'), 'last_modified': cached.get('last_modified'),
+                            'not_modified': True}
+                error = None if data else "no rates in response"
+            except (http.client.HTTPException, OSError, ValueError) as e:
+                data, error = None, str(e)
+            elapsed = time.perf_counter() - t0
+            with cond:
+                if state['done']:
+                    provider.record_cancelled(elapsed)
+                    return
+                answers.append((provider, data))
+                cond.notify_all()
+            if data:
+                provider.record(True, elapsed)
+            else:
+                provider.record(False)
+                logging.warning(f"Rate provider {provider.name} failed: {error}")
+
+        for provider in providers:
+            threading.Thread(target=worker, args=(provider, provider not in prompt),
+                             name=f"rates-{provider.name}", daemon=True).start()
+
+        deadline = time.monotonic() + timeout + (self.HEDGE_DELAY if len(prompt) < len(providers) else 0)
+        with cond:
+            while True:
+                valid = [(p, d) for p, d in answers if d]
+                if len(valid) >= quorum or len(answers) == len(providers):
+                    break
+                if not state['hedge'] and all(p in dict(answers) for p in prompt):
+                    state['hedge'] = True
+                    cond.notify_all()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                cond.wait(remaining)
+            state['done'] = True
+            cond.notify_all()
+            pending = list(conns)
+        for conn in pending:
+            # shutdown() wakes a thread blocked in recv(); close() alone does not
+            sock = getattr(conn, 'sock', None)
+            try:
+                if sock is not None:
+                    sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+        if not valid:
+            return None, []
+        valid = valid[:quorum]
+        if len(valid) < quorum:
+            logging.warning(f"Rate quorum of {quorum} not reached, using {len(valid)} provider(s)")
+        if len(valid) == 1:
+            provider, data = valid[0]
+            return data, [provider.name]
+        merged = {}
+        for code in set().union(*(d['conversion_rates'] for _, d in valid)):
+            values = sorted(d['conversion_rates'][code] for _, d in valid
+                            if isinstance(d['conversion_rates'].get(code), (int, float)))
+            if values:
+                mid = len(values) // 2
+                merged[code] = values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+        return ({'conversion_rates': merged, 'base_code': valid[0][1]['base_code']},
+                [p.name for p, _ in valid])
+
+
+RATE_PROVIDERS = RateProviderRegistry()
+RATE_PROVIDERS.register(RateProvider('exchangerate.host', "https://api.exchangerate.host/latest?base=USD"))
+RATE_PROVIDERS.register(RateProvider('open.er-api.com', "https://open.er-api.com/v6/latest/USD",
+                                     base_key='base_code'))
+RATES_TTL_MINUTES = 60  # default for config 'rates_ttl_minutes'
+RATES_RETRY_SECONDS = 5 * 60  # after a failed refresh
+
+
+class APIThread(QThread):
+    """Background thread for fetching currency rates.
+
+    v6.7.0: Races the registered providers (RATE_PROVIDERS) instead of
+    trying them one after another. Successful data is stamped with
+    fetched_at and the answering provider, ready for save_rates_cache.
+    """
+    finished = pyqtSignal(dict)
+
+    def __init__(self, registry=None, quorum=1, timeout=10, cached=None):
+        super().__init__()
+        self.registry = registry or RATE_PROVIDERS
+        self.quorum = quorum
+        self.timeout = timeout
+        self.cached = cached
+
+    def run(self):
+        data, providers = self.registry.race(self.timeout, self.quorum, self.cached)
+        if data:
+            logging.info(f"Exchange rates from {', '.join(providers)}"
+                         + (" (not modified)" if data.get('not_modified') else ""))
+            data['fetched_at'] = time.time()
+            data['provider'] = providers[0] if len(providers) == 1 else None
+            self.finished.emit({'status': 'success', 'data': data})
+        else:
+            self.finished.emit({'status': 'error', 'message': STRINGS["network_error"]})
 
 
 class HistoryAPIThread(QThread):
@@ -1546,6 +3289,545 @@ class HistoryAPIThread(QThread):
         
         self.finished.emit([])
 
+class WebhookQueue(QObject):
+    """Background webhook delivery with retries (v6.7.0).
+
+    send() only queues; a worker thread posts with bounded timeouts, so a
+    slow endpoint never blocks the GUI. Failed deliveries (network errors,
+    HTTP 429/5xx) are retried with exponential backoff, honouring
+    Retry-After. Reminders waiting for delivery are kept in a JSON file and
+    survive a restart. Their target is the configured webhook URL
+    (set_target), which is not written to that file. Due messages for the
+    same URL are batched into one payload, and one keep-alive connection is
+    reused per host. delivered(delivery id, ok, detail) reports each
+    outcome; test sends get a single attempt and are not persisted.
+    """
+    delivered = pyqtSignal(str, bool, str)
+
+    TIMEOUT = 10           # seconds, connect and read
+    BASE_DELAY = 5         # seconds before the first retry, doubled each time
+    MAX_DELAY = 15 * 60
+    MAX_ATTEMPTS = 8
+    MAX_BATCH_CHARS = 1900  # Discord rejects content over 2000 characters
+
+    def __init__(self, queue_file, parent=None):
+        super().__init__(parent)
+        self.queue_file = queue_file
+        self.target = None
+        self._entries = self._load()  # [{'id', 'content', 'attempts', 'due', 'url'?, 'test'?}]
+        self._cond = threading.Condition()
+        self._conns = {}  # (scheme, host, port) -> HTTP(S)Connection, worker thread only
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name='webhook-queue', daemon=True)
+        self._thread.start()
+
+    # --- GUI side --------------------------------------------------------
+
+    def set_target(self, url):
+        """Webhook URL for queued reminders (None/'' holds them)."""
+        with self._cond:
+            self.target = url or None
+            self._cond.notify()
+
+    def send(self, content, url=None, test=False):
+        """Queue a message (to url, or the target). Returns its delivery id."""
+        entry = {'id': uuid.uuid4().hex, 'content': content, 'attempts': 0, 'due': time.time()}
+        if url:
+            entry['url'] = url
+        if test:
+            entry['test'] = True
+        with self._cond:
+            self._entries.append(entry)
+            self._save()
+            self._cond.notify()
+        return entry['id']
+
+    def pending(self):
+        with self._cond:
+            return len(self._entries)
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join(timeout=1)
+
+    # --- Persistence -----------------------------------------------------
+
+    def _load(self):
+        try:
+            with open(self.queue_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable webhook queue {self.queue_file}: {e}")
+            return []
+        return [e for e in entries if isinstance(e, dict) and e.get('id') and isinstance(e.get('content'), str)]
+
+    def _save(self):
+        """Write queued reminders (not tests or explicit URLs); caller holds the lock."""
+        kept = [{k: e[k] for k in ('id', 'content', 'attempts', 'due')}
+                for e in self._entries if not e.get('test') and not e.get('url')]
+        try:
+            if not kept:
+                if os.path.exists(self.queue_file):
+                    os.remove(self.queue_file)
+                return
+            tmp = self.queue_file + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(kept, f)
+            os.replace(tmp, self.queue_file)
+        except OSError as e:
+            logging.error(f"Could not save webhook queue: {e}")
+
+    # --- Worker ----------------------------------------------------------
+
+    def _next_batch(self):
+        """(url, entries) ready to send now, or (None, seconds to wait or None)."""
+        now = time.time()
+        waits = []
+        for entry in self._entries:
+            url = entry.get('url') or self.target
+            if not url:
+                continue
+            if entry['due'] > now:
+                waits.append(entry['due'] - now)
+                continue
+            if entry.get('test'):
+                return url, [entry]
+            batch, size = [], 0
+            for other in self._entries:
+                if (not other.get('test') and (other.get('url') or self.target) == url
+                        and other['due'] <= now and size + len(other['content']) <= self.MAX_BATCH_CHARS):
+                    batch.append(other)
+                    size += len(other['content']) + 1
+            return url, batch or [entry]
+        return None, (min(waits) if waits else None)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        self._close_connections()
+                        return
+                    url, batch = self._next_batch()
+                    if url:
+                        break
+                    self._cond.wait(timeout=batch)
+            content = "\n".join(entry['content'] for entry in batch)
+            ok, detail, retry_after = self._deliver(url, content)
+            with self._cond:
+                for entry in batch:
+                    entry['attempts'] += 1
+                    final = ok or retry_after is None or entry.get('test') or entry['attempts'] >= self.MAX_ATTEMPTS
+                    if final:
+                        if entry in self._entries:
+                            self._entries.remove(entry)
+                    else:
+                        delay = min(self.MAX_DELAY, self.BASE_DELAY * 2 ** (entry['attempts'] - 1))
+                        entry['due'] = time.time() + max(delay, retry_after)
+                    if final and not ok:
+                        logging.warning(f"Webhook delivery failed after {entry['attempts']} attempt(s): {detail}")
+                    if final:
+                        self.delivered.emit(entry['id'], ok, detail)
+                self._save()
+
+    def _deliver(self, url, content):
+        """POST one payload. Returns (ok, detail, retry-after seconds or None if not retryable)."""
+        body = json.dumps({"content": content}).encode('utf-8')
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            return False, f"Unsupported webhook URL: {url}", None
+        path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        key = (parts.scheme, parts.hostname, parts.port)
+        headers = {'Content-Type': 'application/json', 'User-Agent': 'Mozilla/5.0', 'Connection': 'keep-alive'}
+        for reconnect in (False, True):
+            conn = self._conns.get(key)
+            reused = conn is not None
+            if conn is None:
+                if parts.scheme == 'https':
+                    conn = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=self.TIMEOUT,
+                                                       context=ssl.create_default_context())
+                else:
+                    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=self.TIMEOUT)
+                self._conns[key] = conn
+            try:
+                conn.request('POST', path, body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                self._conns.pop(key, None)
+                if reused and not reconnect:
+                    continue  # The server closed an idle keep-alive connection
+                return False, str(e), 0
+            if response.will_close:
+                conn.close()
+                self._conns.pop(key, None)
+            status = response.status
+            if 200 <= status < 300:
+                return True, f"HTTP {status}", None
+            if status == 429 or status >= 500:
+                try:
+                    retry_after = float(response.getheader('Retry-After') or 0)
+                except ValueError:
+                    retry_after = 0
+                return False, f"HTTP {status}", min(retry_after, self.MAX_DELAY)
+            return False, f"HTTP {status}", None
+        return False, "Connection failed", 0
+
+    def _close_connections(self):
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
+
+
+class SaveThread(QThread):
+    """Background thread that writes one data snapshot through the DataManager."""
+    save_finished = pyqtSignal(bool)
+
+    def __init__(self, data_manager, data, pin):
+        super().__init__()
+        self.data_manager = data_manager
+        self.data = data
+        self.pin = pin
+
+    def run(self):
+        try:
+            ok = bool(self.data_manager.save_data(self.data, self.pin))
+        except Exception:
+            logging.exception("Background save failed")
+            ok = False
+        self.save_finished.emit(ok)
+
+
+class SaveScheduler(QObject):
+    """Coalescing write-behind save queue (v6.7.0).
+
+    save requests restart a short timer, so a burst (e.g. paying several
+    bills) becomes a single write. When it fires, the window state is
+    snapshotted on the GUI thread and written by a SaveThread; requests that
+    arrive while a write is running collapse into one follow-up write.
+    flush() writes anything outstanding synchronously (used on exit).
+    While held (app locked) requests are only remembered and written after
+    release(). A failed write is retried with backoff (RETRY_MS doubling up
+    to MAX_RETRY_MS); save_failed fires on the first failure of a streak.
+    """
+    RETRY_MS = 2000
+    MAX_RETRY_MS = 60000
+    save_failed = pyqtSignal()
+
+    def __init__(self, data_manager, snapshot_fn, delay_ms=250, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.snapshot_fn = snapshot_fn  # -> (data, pin)
+        self.delay_ms = delay_ms
+        self.held = False
+        self._held_due = False
+        self._thread = None
+        self._pending = None
+        self._failures = 0  # consecutive failed writes
+        self._copies = {}  # id(record) -> (record, keys or rev, values, copy) from the last snapshot
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._start_save)
+
+    def schedule(self):
+        if self.held:
+            self._held_due = True
+            return
+        self.timer.start(self.delay_ms)
+
+    def hold(self):
+        """Write outstanding changes, then defer new ones until release()."""
+        self.flush()
+        self.held = True
+        if self.timer.isActive():  # A retry was waiting
+            self.timer.stop()
+            self._held_due = True
+
+    def release(self):
+        self.held = False
+        if self._held_due:
+            self._held_due = False
+            self.schedule()
+
+    def _freeze(self, data):
+        """Copy the record lists so the worker never sees them mid-edit.
+
+        Records whose keys and values are unchanged keep their previous copy,
+        which also keeps the journal's encoding cache warm.
+        """
+        copies = {}
+        frozen = {}
+        for key, value in data.items():
+            if not isinstance(value, list):
+                frozen[key] = value
+                continue
+            items = []
+            for record in value:
+                if isinstance(record, Bill):
+                    # Bills count their edits; unchanged ones keep the old copy
+                    hit = self._copies.get(id(record))
+                    if hit is None or hit[0] is not record or hit[1] != record.rev:
+                        frozen_record = record.to_dict()
+                        if record._extra and not all(isinstance(v, (str, int, float, bool, type(None)))
+                                                     for v in record._extra.values()):
+                            frozen_record = copy.deepcopy(frozen_record)
+                        hit = (record, record.rev, None, frozen_record)
+                    copies[id(record)] = hit
+                    items.append(hit[3])
+                    continue
+                if not isinstance(record, dict):
+                    items.append(record)
+                    continue
+                keys, values = tuple(record), tuple(record.values())
+                hit = self._copies.get(id(record))
+                if (hit is None or hit[0] is not record or hit[1] != keys
+                        or not all(map(operator.is_, hit[2], values))):
+                    flat = all(isinstance(v, (str, int, float, bool, type(None))) for v in values)
+                    hit = (record, keys, values, dict(record) if flat else copy.deepcopy(record))
+                copies[id(record)] = hit
+                items.append(hit[3])
+            frozen[key] = items
+        self._copies = copies
+        return frozen
+
+    def _start_save(self):
+        data, pin = self.snapshot_fn()
+        snapshot = (self._freeze(data), pin)
+        if self._thread is not None and self._thread.isRunning():
+            self._pending = snapshot  # Newer state supersedes any queued one
+            return
+        self._launch(snapshot)
+
+    def _launch(self, snapshot):
+        thread = SaveThread(self.data_manager, *snapshot)
+        thread.save_finished.connect(self._on_save_finished)
+        thread.finished.connect(self._on_thread_finished)
+        self._thread = thread
+        thread.start()
+
+    def _on_save_finished(self, ok):
+        if ok:
+            self._failures = 0
+            return
+        self._failures += 1
+        if self._failures == 1:
+            self.save_failed.emit()
+        if self._pending is not None:
+            return  # The queued follow-up write carries these changes too
+        if self.held:
+            self._held_due = True
+        else:
+            self.timer.start(min(self.MAX_RETRY_MS, self.RETRY_MS * 2 ** (self._failures - 1)))
+
+    def _on_thread_finished(self):
+        finished = self.sender()
+        if finished is not None and finished is not self._thread:
+            finished.deleteLater()
+            return
+        if self._pending is not None:
+            snapshot, self._pending = self._pending, None
+            old, self._thread = self._thread, None
+            if old is not None:
+                old.deleteLater()
+            self._launch(snapshot)
+
+    def _wait(self):
+        if self._thread is not None:
+            self._thread.wait()
+
+    def cancel(self):
+        """Drop queued saves (state is about to be replaced from disk)."""
+        self.timer.stop()
+        self._pending = None
+        self._wait()
+
+    def flush(self):
+        """Write any outstanding changes now, on the calling thread."""
+        if self.held:
+            if self._held_due:
+                logging.warning("Changes made while locked are written after unlocking")
+            return
+        due = self.timer.isActive() or self._pending is not None
+        self.timer.stop()
+        self._pending = None
+        self._wait()
+        if due:
+            data, pin = self.snapshot_fn()
+            self._on_save_finished(bool(self.data_manager.save_data(self._freeze(data), pin)))
+
+
+class ReminderScheduler(QObject):
+    """Sleeps until the next reminder instead of polling (v6.7.0).
+
+    The next moment is the configured reminder_time (HH:MM) on the first
+    day a bill is in the reminder window: today if anything is overdue or
+    due within reminder_days, otherwise reminder_days before the earliest
+    due date in BillLedger.due. One precise single-shot QTimer is armed for
+    it. As a ledger observer the scheduler re-arms after any bill change
+    (coalesced); call schedule() after config changes. Waits longer than
+    MAX_SLEEP_MS wake up once to re-arm, which also corrects drift after
+    the machine was suspended.
+    """
+    MAX_SLEEP_MS = 6 * 3600 * 1000
+    DEFAULT_TIME = (9, 0)
+
+    def __init__(self, ledger, load_config, notify, parent=None):
+        super().__init__(parent)
+        self.ledger = ledger
+        self.load_config = load_config  # -> config dict
+        self.notify = notify            # shows the reminder (and sends the webhook)
+        self.deadline = None            # datetime the timer is armed for
+        self.last_fired = None          # date of the last reminder
+        self.paused = False             # App locked: no config reads, no reminders
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._fire)
+        self._rearm = QTimer(self)
+        self._rearm.setSingleShot(True)
+        self._rearm.timeout.connect(self.arm)
+        ledger.observers.append(self)
+
+    # BillLedger observer: any list change may move the next reminder
+    def begin_insert(self, status, first, last): pass
+    def begin_remove(self, status, first, last): pass
+    def begin_reset(self, status): pass
+    def end_insert(self, status): self.schedule()
+    def end_remove(self, status): self.schedule()
+    def end_reset(self, status): self.schedule()
+    def changed(self, status, row): self.schedule()
+
+    def schedule(self):
+        """Re-arm once control returns to the event loop."""
+        if not self.paused:
+            self._rearm.start(0)
+
+    def pause(self):
+        self.paused = True
+        self.timer.stop()
+        self._rearm.stop()
+
+    def resume(self):
+        """Re-arm after unlocking; a reminder missed while locked fires now."""
+        self.paused = False
+        self.schedule()
+
+    @classmethod
+    def reminder_clock(cls, config):
+        """(hour, minute) from config['reminder_time'], the default if malformed."""
+        try:
+            hour, minute = (int(part) for part in str(config.get('reminder_time', '')).split(':'))
+        except ValueError:
+            return cls.DEFAULT_TIME
+        return (hour, minute) if 0 <= hour < 24 and 0 <= minute < 60 else cls.DEFAULT_TIME
+
+    @classmethod
+    def reminder_moment(cls, config, day):
+        hour, minute = cls.reminder_clock(config)
+        return datetime(day.year, day.month, day.day, hour, minute)
+
+    def next_deadline(self, now):
+        config = self.load_config()
+        first = self.ledger.due.first()
+        if first is None:
+            return None
+        try:
+            days_advance = int(config.get('reminder_days', 1))
+        except (TypeError, ValueError):
+            days_advance = 1
+        today = now.date()
+        day = max(today, date.fromordinal(max(1, first - days_advance)))
+        if self.last_fired is not None and day <= self.last_fired:
+            day = self.last_fired + timedelta(days=1)
+        # A reminder time already passed today (and not reminded yet) is due now
+        return max(now, self.reminder_moment(config, day))
+
+    def start(self, delay_ms=2000):
+        """Remind once shortly after launch, then sleep until the next reminder."""
+        QTimer.singleShot(delay_ms, self._startup)
+
+    def _startup(self):
+        if self.paused:
+            return  # resume() arms the timer
+        now = datetime.now()
+        self.notify()
+        if now >= self.reminder_moment(self.load_config(), now.date()):
+            self.last_fired = now.date()  # Counts as today's reminder
+        self.arm()
+
+    def arm(self):
+        now = datetime.now()
+        self.deadline = self.next_deadline(now)
+        if self.deadline is None:
+            self.timer.stop()
+            return
+        wait_ms = int((self.deadline - now).total_seconds() * 1000)
+        self.timer.start(max(0, min(wait_ms + 1, self.MAX_SLEEP_MS)))  # +1: never wake just before
+
+    def _fire(self):
+        now = datetime.now()
+        if self.deadline is not None and now >= self.deadline:
+            self.last_fired = now.date()
+            self.notify()
+        self.arm()
+
+
+class RefreshScheduler(QObject):
+    """Dirty-flag view refresh, at most one batch per event-loop turn (v6.7.0).
+
+    Mutations mark the views they affect; a zero-delay timer then refreshes
+    the dirty views that are currently on screen, in a fixed order. Views on
+    hidden tabs stay dirty and are refreshed by show() when their tab opens.
+    """
+    TOTALS, UNPAID, PAID, CHARTS, CALENDAR, SUBSCRIPTIONS, SAVINGS = (
+        'totals', 'unpaid', 'paid', 'charts', 'calendar', 'subscriptions', 'savings')
+    ALL = (TOTALS, UNPAID, PAID, CHARTS, CALENDAR, SUBSCRIPTIONS, SAVINGS)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._views = {}  # name -> (refresh_fn, is_visible_fn or None for always)
+        self.dirty = set()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+    def register(self, view, refresh_fn, is_visible_fn=None):
+        self._views[view] = (refresh_fn, is_visible_fn)
+
+    def mark(self, *views):
+        """Mark views (all of them if none given) dirty for the next batch."""
+        self.dirty.update(views or self.ALL)
+        if not self.timer.isActive():
+            self.timer.start(0)
+
+    def _run(self, view):
+        self.dirty.discard(view)
+        try:
+            self._views[view][0]()
+        except Exception as e:
+            logging.error(f"Refresh of {view} failed: {e}")
+
+    def show(self, view):
+        """A view just became visible: refresh it if anything changed meanwhile."""
+        if view in self.dirty and view in self._views:
+            self._run(view)
+
+    def flush(self, force=False):
+        """Refresh dirty visible views now (every dirty view if force)."""
+        self.timer.stop()
+        for view in self.ALL:
+            if view not in self.dirty or view not in self._views:
+                continue  # Views registered later keep their flag
+            is_visible = self._views[view][1]
+            if force or is_visible is None or is_visible():
+                self._run(view)
+
+
 class SparklineWidget(QWidget):
     """A custom widget to display a simple line chart (sparkline)."""
     def __init__(self, color="#6200ea"):
@@ -1629,6 +3911,117 @@ def get_currency_list():
     return currency_data
 
 
+class CurrencyConverter:
+    """Indexed exchange-rate table with batch conversion (v6.7.0).
+
+    Each currency spelling in use - display key ("₾ - Georgian Lari"), ISO
+    code, or a legacy "$ (USD)" label - resolves once to an integer id, and
+    rates (units per USD) sit in one contiguous array indexed by that id.
+    convert_many() converts a whole column of amounts in one go, with NumPy
+    when it is installed and the array module otherwise. Unknown or unrated
+    currencies convert at 1.0, like the old rates.get(key, 1.0) lookups.
+    """
+    _LEGACY_CODE = re.compile(r'\(([A-Z]{3})\)')
+
+    def __init__(self, currencies):
+        self._lock = threading.Lock()
+        self._ids = {}    # spelling -> id
+        self.codes = []   # id -> ISO code (or the spelling itself if unknown)
+        self._known = {'USD': 1.0}
+        self._rates = array('d')
+        self._np_rates = None
+        for display, meta in currencies.items():
+            code = meta.get('code') if isinstance(meta, dict) else None
+            self._ids[display] = self._register(code or display)
+
+    def _register(self, code):
+        cid = self._ids.get(code)
+        if cid is None:
+            cid = len(self.codes)
+            self.codes.append(code)
+            self._rates.append(self._known.get(code, 1.0))
+            self._ids[code] = cid
+            self._np_rates = None
+        return cid
+
+    def id_of(self, currency):
+        """Integer id for any currency spelling (registered on first sight)."""
+        cid = self._ids.get(currency)
+        if cid is None:
+            with self._lock:
+                cid = self._ids.get(currency)
+                if cid is None:
+                    match = self._LEGACY_CODE.search(currency) if isinstance(currency, str) else None
+                    cid = self._register(match.group(1) if match else currency)
+                    self._ids[currency] = cid
+        return cid
+
+    def set_rates(self, rates_by_code):
+        """Replace the table from an API payload ({ISO code: units per USD})."""
+        known = {}
+        for code, rate in rates_by_code.items():
+            try:
+                rate = float(rate)
+            except (TypeError, ValueError):
+                continue
+            if rate > 0:
+                known[code] = rate
+        known['USD'] = 1.0  # Base currency
+        with self._lock:
+            self._known = known
+            self._rates = array('d', (known.get(code, 1.0) for code in self.codes))
+            self._np_rates = None
+
+    def rate(self, currency):
+        return self._rates[self.id_of(currency)]
+
+    def convert(self, amount, source, target='USD'):
+        rates = self._rates
+        return amount / rates[self.id_of(source)] * rates[self.id_of(target)]
+
+    def convert_many(self, amounts, currency_ids, target='USD'):
+        """Convert amounts (with matching currency ids) into target. Returns a float sequence."""
+        target_rate = self._rates[target if isinstance(target, int) else self.id_of(target)]
+        if NUMPY_AVAILABLE:
+            import numpy as np
+            rates = self._np_rates
+            if rates is None or len(rates) != len(self._rates):
+                rates = self._np_rates = np.frombuffer(self._rates, dtype=np.float64).copy()
+            return (np.asarray(amounts, dtype=np.float64)
+                    / rates[np.asarray(currency_ids, dtype=np.intp)] * target_rate)
+        rates = self._rates.tolist()
+        return array('d', [amount / rates[cid] * target_rate
+                           for amount, cid in zip(amounts, currency_ids)])
+
+    def convert_totals(self, totals, target='USD'):
+        """Sum a {currency: amount} map (see RunningTotals) into one currency."""
+        if not totals:
+            return 0.0
+        return float(sum(self.convert_many(list(totals.values()), [self.id_of(c) for c in totals], target)))
+
+    def convert_groups(self, groups, target='USD'):
+        """{group: {currency: amount}} -> {group: total in target}, as one batch."""
+        keys, amounts, ids = [], [], []
+        for group, totals in groups.items():
+            for currency, amount in totals.items():
+                keys.append(group)
+                amounts.append(amount)
+                ids.append(self.id_of(currency))
+        result = dict.fromkeys(groups, 0.0)
+        for group, value in zip(keys, self.convert_many(amounts, ids, target)):
+            result[group] += float(value)
+        return result
+
+    @staticmethod
+    def merge(*totals):
+        """Add {currency: amount} maps together."""
+        merged = {}
+        for part in totals:
+            for currency, amount in part.items():
+                merged[currency] = merged.get(currency, 0.0) + amount
+        return merged
+
+
 
 
 class ThemeManager:
@@ -1777,7 +4170,7 @@ class ThemeManager:
                 padding: 4px;
                 border: 1px solid {p['border']};
             }}
-            QTableWidget {{
+            QTableView {{
                 gridline-color: {p['border']};
                 selection-background-color: {accent};
                 selection-color: {contrast};
@@ -2415,10 +4808,10 @@ class BillEditorDialog(QDialog):
 
 class ConverterWindow(QDialog):
     """Currency converter dialog."""
-    def __init__(self, parent, currencies, exchange_rates):
+    def __init__(self, parent, currencies, converter):
         super().__init__(parent)
         self.currencies = currencies
-        self.exchange_rates = exchange_rates
+        self.converter = converter
         self.setWindowTitle(STRINGS["converter_title"])
         self.setGeometry(100, 100, 400, 300)
         
@@ -2505,11 +4898,8 @@ class ConverterWindow(QDialog):
             from_curr = self.from_combo.currentText()
             to_curr = self.to_combo.currentText()
             
-            from_rate = self.exchange_rates.get(from_curr, 1.0)
-            to_rate = self.exchange_rates.get(to_curr, 1.0)
-            
-            if from_rate > 0:
-                result = (amount / from_rate) * to_rate
+            if self.converter.rate(from_curr) > 0:
+                result = self.converter.convert(amount, from_curr, to_curr)
                 meta = self.currencies.get(to_curr, {'symbol': '$'})
                 symbol = meta.get('symbol', '$')
                 self.result_label.setText(f"{symbol}{result:,.2f}")
@@ -2690,25 +5080,30 @@ class SavingsTab(QWidget):
     def add_goal(self):
         dialog = SavingsGoalDialog(self.main_window)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.main_window.savings_goals.append(dialog.get_data())
+            goal = dialog.get_data()
+            self.main_window.savings_goals.append(goal)
+            self.main_window.count_goal(goal)
             self.main_window.save_data()
-            self.refresh_data()
+            self.main_window.update_display(RefreshScheduler.SAVINGS, RefreshScheduler.TOTALS)
 
     def edit_goal(self, goal_index):
         goal = self.main_window.savings_goals[goal_index]
         dialog = SavingsGoalDialog(self.main_window, goal)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.main_window.savings_goals[goal_index] = dialog.get_data()
+            updated = dialog.get_data()
+            self.main_window.count_goal(goal, -1)
+            self.main_window.savings_goals[goal_index] = updated
+            self.main_window.count_goal(updated)
             self.main_window.save_data()
-            self.refresh_data()
+            self.main_window.update_display(RefreshScheduler.SAVINGS, RefreshScheduler.TOTALS)
 
     def delete_goal(self, goal_index):
         reply = QMessageBox.question(self, STRINGS["dialog_confirm_delete"], 
                                    STRINGS["confirm_delete_msg"].format(self.main_window.savings_goals[goal_index]['name']))
         if reply == QMessageBox.StandardButton.Yes:
-            self.main_window.savings_goals.pop(goal_index)
+            self.main_window.count_goal(self.main_window.savings_goals.pop(goal_index), -1)
             self.main_window.save_data()
-            self.refresh_data()
+            self.main_window.update_display(RefreshScheduler.SAVINGS, RefreshScheduler.TOTALS)
 
     def add_savings_funds(self, goal_index):
         """Quickly add funds to a savings goal."""
@@ -2717,10 +5112,11 @@ class SavingsTab(QWidget):
                                          f"{goal['name']} ({goal['currency']}):", 
                                          0, 0, 1000000, 2)
         if ok and amount > 0:
+            self.main_window.count_goal(goal, -1)
             goal['current'] = float(goal['current']) + amount
+            self.main_window.count_goal(goal)
             self.main_window.save_data()
-            self.refresh_data()
-            self.main_window.update_display() # Update dashboard too
+            self.main_window.update_display(RefreshScheduler.SAVINGS, RefreshScheduler.TOTALS) # Dashboard too
 
     def refresh_data(self):
         # Clear existing entries
@@ -2728,8 +5124,6 @@ class SavingsTab(QWidget):
             widget = self.goals_layout.itemAt(i).widget()
             if widget:
                 widget.setParent(None)
-            
-        total_saved_usd = 0.0
         
         # 1. Determine Target Currency (Moved outside loop to fix UnboundLocalError)
         target_curr = self.savings_currency_combo.currentText()
@@ -2737,29 +5131,6 @@ class SavingsTab(QWidget):
             # Fallback
             target_curr = self.main_window.summary_currency_combo.currentText() or "USD"
             
-        # Extract code usually needed for metadata lookup/symbol
-        import re
-        t_match = re.search(r'\((.*?)\)', target_curr)
-        target_curr_code = t_match.group(1) if t_match else None
-        
-        # 2. Get Target Rate (to_rate) - Constant for all items
-        to_rate = 1.0 # Default
-        
-        # Find to_rate
-        found = False
-        for k, v in self.main_window.exchange_rates.items():
-            if k == target_curr:
-                to_rate = v
-                found = True
-                break
-        
-        if not found and target_curr_code:
-             # Fallback search by code
-             for k, v in self.main_window.exchange_rates.items():
-                if f"({target_curr_code})" in k:
-                    to_rate = v
-                    break
-        
         for i, goal in enumerate(self.main_window.savings_goals):
             p = self.main_window.theme_manager.get_palette()
             goal_card = QFrame()
@@ -2817,14 +5188,9 @@ class SavingsTab(QWidget):
             
             self.goals_layout.addWidget(goal_card)
             
-            # Convert to selected summary currency
-            # Rate of goal currency (relative to base)
-            from_rate = self.main_window.get_exchange_rate(goal['currency'])
-            
-            if from_rate > 0:
-                # Convert goal current amount -> Base -> Target
-                val_in_target = (cur / from_rate) * to_rate
-                total_saved_usd += val_in_target
+        # Convert goal current amounts -> Base -> Target, once per currency
+        total_saved_usd = self.main_window.converter.convert_totals(
+            self.main_window.savings_totals.get('current'), target_curr)
 
         # Get Symbol for target
         t_meta = self.main_window.currencies.get(target_curr, {'symbol': '$'})
@@ -3133,8 +5499,7 @@ class MiniTrackerWidget(QWidget):
         self.budget_lbl.setText(f"{self.STRINGS['lbl_budget_rem']} {remaining}")
         
         # Get bills due today
-        today = date.today().strftime('%Y-%m-%d')
-        due_today_count = sum(1 for b in self.main_window.unpaid_bills if b['due_date'] == today)
+        due_today_count = len(self.main_window.ledger.due.on(date.today().toordinal()))
         self.due_lbl.setText(f"{STRINGS['lbl_due_today']} {due_today_count}")
 
     def restore_main(self):
@@ -3430,7 +5795,12 @@ class SettingsDialog(QDialog):
         browse_button = QPushButton(STRINGS["browse_button"])
         browse_button.clicked.connect(self.browse_file)
         path_layout.addWidget(browse_button)
-        path_group.setLayout(path_layout)
+        path_vbox = QVBoxLayout()
+        path_vbox.addLayout(path_layout)
+        self.sqlite_chk = QCheckBox(STRINGS["chk_sqlite_storage"])
+        self.sqlite_chk.setChecked(self.data_manager.storage_backend == 'sqlite')
+        path_vbox.addWidget(self.sqlite_chk)
+        path_group.setLayout(path_vbox)
         form_layout.addRow(path_group)
 
         # 2. Appearance & General
@@ -3481,6 +5851,19 @@ class SettingsDialog(QDialog):
         reminder_row.addWidget(QLabel(STRINGS["label_notify_me"]))
         reminder_row.addWidget(self.reminder_days_spin)
         general_layout.addLayout(reminder_row)
+
+        # Exchange rate cache lifetime (v6.7.0)
+        rates_row = QHBoxLayout()
+        self.rates_ttl_spin = QSpinBox()
+        self.rates_ttl_spin.setRange(1, 24 * 60)
+        try:
+            self.rates_ttl_spin.setValue(int(config.get('rates_ttl_minutes', RATES_TTL_MINUTES)))
+        except (TypeError, ValueError):
+            self.rates_ttl_spin.setValue(RATES_TTL_MINUTES)
+        self.rates_ttl_spin.setSuffix(STRINGS["suffix_minutes"])
+        rates_row.addWidget(QLabel(STRINGS["label_rates_ttl"]))
+        rates_row.addWidget(self.rates_ttl_spin)
+        general_layout.addLayout(rates_row)
         
         general_group.setLayout(general_layout)
         form_layout.addRow(general_group)
@@ -3514,7 +5897,8 @@ class SettingsDialog(QDialog):
         webhook_row.addRow(STRINGS["lbl_reminder_time"] + ":", self.reminder_time_input)
         notif_layout.addLayout(webhook_row)
 
-        test_btn = QPushButton(STRINGS["btn_test_webhook"])
+        self.test_webhook_btn = test_btn = QPushButton(STRINGS["btn_test_webhook"])
+        self._webhook_test_id = None
         test_btn.clicked.connect(self.test_webhook)
         notif_layout.addWidget(test_btn)
 
@@ -3644,14 +6028,16 @@ class SettingsDialog(QDialog):
 
     def load_backups(self):
         self.backup_list.clear()
-        backup_dir = os.path.join(self.data_manager.config_dir, 'backups')
-        if os.path.exists(backup_dir):
-            backups = sorted([f for f in os.listdir(backup_dir) if f.startswith('bill_data_')])
-            self.backup_list.addItems(backups)
+        self.backup_list.addItems(self.data_manager.list_backups())
             
     def create_manual_backup(self):
         try:
-            self.data_manager.backup_data()
+            # Make sure queued and journaled changes are in the snapshot being backed up
+            pin = self.parent().session_pin if hasattr(self.parent(), 'session_pin') else None
+            if hasattr(self.parent(), 'flush_saves'):
+                self.parent().flush_saves()
+            self.data_manager.compact(pin, wait=True)
+            self.data_manager.backup_data(pin=pin)
             self.load_backups()
             QMessageBox.information(self, STRINGS["title_backup_created"], STRINGS["msg_backup_created"])
         except Exception as e:
@@ -3668,7 +6054,6 @@ class SettingsDialog(QDialog):
             return
             
         filename = selected_items[0].text()
-        backup_path = os.path.join(self.data_manager.config_dir, 'backups', filename)
         
         reply = QMessageBox.question(self, STRINGS["title_confirm_restore"], 
                                    STRINGS["msg_confirm_restore"].format(filename),
@@ -3676,7 +6061,11 @@ class SettingsDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                shutil.copy2(backup_path, self.data_manager.data_file)
+                if hasattr(self.parent(), 'flush_saves'):
+                    self.parent().flush_saves()
+                pin = self.parent().session_pin if hasattr(self.parent(), 'session_pin') else None
+                if not self.data_manager.restore_backup(filename, pin):
+                    raise IOError(filename)
                 QMessageBox.information(self, STRINGS["title_restored"], STRINGS["msg_restored"])
                 if hasattr(self.parent(), 'load_data'):
                     self.parent().load_data()
@@ -3703,11 +6092,9 @@ class SettingsDialog(QDialog):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 deleted_count = 0
+                pin = self.parent().session_pin if hasattr(self.parent(), 'session_pin') else None
                 for item in selected_items:
-                    filename = item.text()
-                    backup_path = os.path.join(self.data_manager.config_dir, 'backups', filename)
-                    if os.path.exists(backup_path):
-                        os.remove(backup_path)
+                    if self.data_manager.delete_backup(item.text(), pin):
                         deleted_count += 1
                 
                 QMessageBox.information(self, STRINGS["title_data_cleared"], STRINGS["msg_batch_delete_success"].format(deleted_count))
@@ -3797,6 +6184,10 @@ class SettingsDialog(QDialog):
                 QMessageBox.warning(self, STRINGS["title_invalid_path"], STRINGS["msg_invalid_path_security"])
                 return
             
+            if hasattr(self.parent(), 'flush_saves'):
+                # Cold history segments live next to the old file; carry them over in memory
+                self.parent().ensure_paid_history()
+                self.parent().flush_saves()
             self.data_manager.data_file = new_path
             # We update config immediately for path
             pin = self.parent().session_pin if hasattr(self.parent(), 'session_pin') else None
@@ -3809,12 +6200,18 @@ class SettingsDialog(QDialog):
         config = self.data_manager.load_config(pin)
         config['minimize_to_tray'] = self.tray_chk.isChecked()
         config['reminder_days'] = self.reminder_days_spin.value()
+        config['rates_ttl_minutes'] = self.rates_ttl_spin.value()
         # Cloud Sync
         config['sync_path'] = self.sync_path_input.text()
         
         # Backup Location
         config['backup_dir'] = self.backup_path_input.text()
         
+        # Storage Engine: write the current state into the newly selected backend
+        new_backend = 'sqlite' if self.sqlite_chk.isChecked() else 'json'
+        backend_changed = new_backend != self.data_manager.storage_backend
+        config['storage_backend'] = new_backend
+        
         # Handle Language Change
         selected_lang = self.lang_combo.currentText()
         if selected_lang != config.get('language', 'English'):
@@ -3865,8 +6262,11 @@ class SettingsDialog(QDialog):
                     self.session_pin = None
                     
                     # Decrypt main bill data file immediately
+                    if hasattr(self.parent(), 'flush_saves'):
+                        self.parent().flush_saves()
                     current_data = self.data_manager.load_data(entered_pin)
                     self.data_manager.save_data(current_data, pin=None)
+                    self.data_manager.rekey_history(entered_pin, None)
                     
                     # Security metadata will follow updated 'pin_enabled' flag
                 except Exception as e:
@@ -3895,6 +6295,12 @@ class SettingsDialog(QDialog):
         
         # Save Config
         self.data_manager.save_config(config, self.session_pin)
+        if backend_changed:
+            if hasattr(self.parent(), 'flush_saves'):
+                self.parent().flush_saves()
+            self.data_manager.storage_backend = new_backend
+            if hasattr(self.parent(), 'save_data'):
+                self.parent().save_data()
 
         # 3. Save Registry (Startup)
         try:
@@ -3931,10 +6337,12 @@ class SettingsDialog(QDialog):
         default_name = f"bill_data_backup_{timestamp}.json"
         target, _ = QFileDialog.getSaveFileName(self, STRINGS["title_backup_data"], default_name, "JSON Files (*.json)")
         if target:
-            if not os.path.exists(self.data_manager.data_file):
-                return
+            if hasattr(self.parent(), 'flush_saves'):
+                self.parent().flush_saves()
+            pin = self.parent().session_pin if hasattr(self.parent(), 'session_pin') else None
             try:
-                shutil.copy2(self.data_manager.data_file, target)
+                # One self-contained file, including cold paid-history segments
+                self.data_manager.export_data_file(target, pin)
                 QMessageBox.information(self, STRINGS["title_success"], STRINGS["msg_backup_success"])
             except Exception as e:
                 QMessageBox.critical(self, STRINGS["title_error"], STRINGS["msg_backup_failed"].format(e))
@@ -3958,6 +6366,8 @@ class SettingsDialog(QDialog):
         if warning == QMessageBox.StandardButton.Yes:
             source, _ = QFileDialog.getOpenFileName(self, STRINGS["title_restore_data"], "", "JSON Files (*.json);;All Files (*)")
             if source:
+                if hasattr(self.parent(), 'flush_saves'):
+                    self.parent().flush_saves()
                 if self.data_manager.restore_file(source, 'data'):
                     QMessageBox.information(self, STRINGS["title_restored"], STRINGS["msg_data_restored_reload"])
                     if isinstance(self.parent(), BillTrackerWindow):
@@ -3990,6 +6400,7 @@ class SettingsDialog(QDialog):
             config['accent_color'] = self.current_accent_hex
             
             self.data_manager.save_config(config, new_pin)
+            self.data_manager.rekey_history(current_pin, new_pin)
             
             # Update session pin for the current session (Parent and current Dialog)
             if hasattr(self.parent(), 'session_pin'):
@@ -4020,20 +6431,23 @@ class SettingsDialog(QDialog):
 
     def test_webhook(self):
         url = self.webhook_input.text().strip()
-        if not url: return
+        webhooks = getattr(self.parent(), 'webhooks', None)
+        if not url or webhooks is None: return
         
-        try:
-            import json
-            import urllib.request
-            data = json.dumps({"content": "🔔 BillTracker Webhook Test: Connection Successful!"}).encode('utf-8')
-            req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json', 'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req) as response:
-                if response.getcode() in [200, 204]:
-                    QMessageBox.information(self, STRINGS["title_success"], STRINGS["msg_webhook_test_sent"])
-                else:
-                    raise Exception(f"HTTP {response.getcode()}")
-        except Exception as e:
-            QMessageBox.critical(self, STRINGS["title_error"], STRINGS["msg_webhook_error"].format(str(e)))
+        # Sent by the window's WebhookQueue; the result arrives via delivered
+        if self._webhook_test_id is None:
+            webhooks.delivered.connect(self.on_webhook_test_result)
+        self.test_webhook_btn.setEnabled(False)
+        self._webhook_test_id = webhooks.send("🔔 BillTracker Webhook Test: Connection Successful!", url=url, test=True)
+
+    def on_webhook_test_result(self, delivery_id, ok, detail):
+        if delivery_id != self._webhook_test_id:
+            return
+        self.test_webhook_btn.setEnabled(True)
+        if ok:
+            QMessageBox.information(self, STRINGS["title_success"], STRINGS["msg_webhook_test_sent"])
+        else:
+            QMessageBox.critical(self, STRINGS["title_error"], STRINGS["msg_webhook_error"].format(detail))
 
     def is_run_on_startup(self):
         """Check if app runs on startup (cross-platform)."""
@@ -4149,11 +6563,81 @@ Comment=Personal Finance Manager'''
 
 
 
-class ChartWidget(QWidget):
-    """Simple Pie Chart Widget."""
+class CachedChartWidget(QWidget):
+    """Base for charts that render once into a QPixmap and blit it on paint (v6.7.0).
+
+    The pixmap is keyed by the data, the widget size, the device pixel ratio
+    and the theme colours, so resizes to the same size, repaints after
+    overlapping windows and PDF export reuse it. Subclasses implement draw().
+    """
     def __init__(self, parent=None):
         super().__init__(parent)
         self.data = {} # label: value
+        self._data_key = None
+        self._cache_key = None
+        self._cache = None
+
+    def set_data(self, data):
+        key = tuple(data.items())
+        if key == self._data_key:
+            return  # Same numbers, keep the cached image
+        self.data = data
+        self._data_key = key
+        self.update()
+
+    def theme_key(self):
+        palette = self.palette()
+        return (palette.color(QPalette.ColorRole.WindowText).rgba(),
+                palette.color(QPalette.ColorRole.Highlight).rgba())
+
+    def render_pixmap(self, size=None):
+        """Chart image at size (default: widget size), drawn only when a key part changed."""
+        size = size or self.size()
+        dpr = self.devicePixelRatioF()
+        key = (self._data_key, size.width(), size.height(), dpr, self.theme_key(), self.view_key())
+        if self._cache is None or key != self._cache_key:
+            pixmap = QPixmap(max(1, int(size.width() * dpr)), max(1, int(size.height() * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            try:
+                self.draw(painter, QRect(0, 0, size.width(), size.height()))
+            finally:
+                painter.end()
+            self._cache, self._cache_key = pixmap, key
+        return self._cache
+
+    def export_image(self, file_path):
+        """Save the chart on the window background, as grab() would."""
+        pixmap = QPixmap(self.render_pixmap())
+        pixmap.fill(self.palette().color(QPalette.ColorRole.Window))
+        painter = QPainter(pixmap)
+        painter.drawPixmap(0, 0, self.render_pixmap())
+        painter.end()
+        return pixmap.save(file_path)
+
+    def view_key(self):
+        """Extra cache key part for charts with their own view state (zoom, pan)."""
+        return None
+
+    def is_dark(self):
+        # Determine if dark mode via palette or just default text color
+        # In QSS, text color is white/black. Let's check window text.
+        return self.palette().color(QPalette.ColorRole.WindowText).lightness() > 128
+
+    def draw(self, painter, rect):
+        raise NotImplementedError
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.render_pixmap())
+
+
+class ChartWidget(CachedChartWidget):
+    """Simple Pie Chart Widget."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.colors = [
             QColor("#3a86ff"), QColor("#ff006e"), QColor("#8338ec"), 
             QColor("#fb5607"), QColor("#ffbe0b"), QColor("#3a0ca3"),
@@ -4171,23 +6655,15 @@ class ChartWidget(QWidget):
     def save_image(self):
         file_path, _ = QFileDialog.getSaveFileName(self, STRINGS["title_save_chart"], "chart.png", "Images (*.png *.jpg *.bmp)")
         if file_path:
-            pixmap = self.grab()
-            pixmap.save(file_path)
+            self.export_image(file_path)
             QMessageBox.information(self, STRINGS["title_saved"], STRINGS["msg_chart_saved"].format(file_path))
 
     def set_data(self, data):
-        self.data = {k: v for k, v in data.items() if v > 0}
-        self.update()
+        super().set_data({k: v for k, v in data.items() if v > 0})
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Determine if dark mode via palette or just default text color
-        # In QSS, text color is white/black. Let's check window text.
-        is_dark = self.palette().color(QPalette.ColorRole.WindowText).lightness() > 128
+    def draw(self, painter, rect):
+        is_dark = self.is_dark()
         
-        rect = self.rect()
         total = sum(self.data.values())
         if total == 0:
             painter.setPen(QColor("#888888"))
@@ -4222,72 +6698,319 @@ class ChartWidget(QWidget):
             i += 1
 
 
-class TrendsWidget(QWidget):
-    """Bar Chart for Spending History."""
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.data = {} # label: value
-        self.setMinimumSize(300, 200)
+class TrendsWidget(CachedChartWidget):
+    """Bar Chart for Spending History, with zoom and pan (v6.7.0).
+
+    Reads the ledger's live SpendingSeries (set_series). The visible range
+    picks the finest level that fits MAX_BARS bars, so drawing only ever looks
+    up and converts that many buckets no matter how many years of history
+    there are. Ctrl+wheel zooms around the cursor, dragging pans, double-click
+    resets to the last six months.
+    """
+    MAX_BARS = 24
+    MIN_SPAN, MAX_SPAN = 7, 366 * 50  # days
+    DEFAULT_MONTHS = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(300, 200)
+        self.setToolTip(STRINGS["tooltip_trends_zoom"])
+        self.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
+        self.view = None  # (first day, last day) once zoomed or panned
+        self._drag = None  # (x, view) at mouse press
+        self.series = None  # SpendingSeries
+        self.convert = None  # {bucket: {currency: amount}} -> {bucket: amount}
+
+    def set_series(self, series, convert):
+        """Show series; convert turns bucket totals into the display currency."""
+        self.series, self.convert = series, convert
+        _, buckets, values = self.visible()
+        key = (tuple(key for key, _ in buckets), tuple(values))
+        if key == self._data_key:
+            return  # Same bars, keep the cached image
+        self._data_key = key
+        self.update()
+
+    def visible(self):
+        """(level, [(bucket, label)], [amount]) for the current view."""
+        start, end = self.current_view()
+        level = self.level_for((end - start).days + 1)
+        buckets = self.bucket_range(level, start, end)
+        if self.series is None:
+            return level, buckets, [0.0] * len(buckets)
+        totals = self.series.levels()[level]
+        converted = self.convert({key: totals.get(key) for key, _ in buckets})
+        return level, buckets, [converted.get(key, 0.0) for key, _ in buckets]
+
+    # --- Visible range ---------------------------------------------------
+
+    def default_view(self):
+        """The last DEFAULT_MONTHS calendar months up to the newest data (or today)."""
+        months = self.series.levels()['month'].sums if self.series is not None else None
+        last = max(months) if months else date.today().strftime('%Y-%m')
+        year, month = int(last[:4]), int(last[5:7])
+        end = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        index = year * 12 + month - self.DEFAULT_MONTHS
+        return date(index // 12, index % 12 + 1, 1), end
+
+    def current_view(self):
+        return self.view or self.default_view()
+
+    def set_view(self, start, span):
+        span = min(max(int(span), self.MIN_SPAN), self.MAX_SPAN)
+        start = min(max(start, date(1970, 1, 1)), date(2200, 1, 1))
+        self.view = (start, start + timedelta(days=span - 1))
+        self.update()
+
+    def zoom(self, factor, anchor=0.5):
+        """Scale the visible span by factor, keeping the point at anchor (0..1) in place."""
+        start, end = self.current_view()
+        span = (end - start).days + 1
+        new_span = min(max(int(span * factor), self.MIN_SPAN), self.MAX_SPAN)
+        self.set_view(start + timedelta(days=round((span - new_span) * anchor)), new_span)
+
+    def pan(self, days):
+        start, end = self.current_view()
+        self.set_view(start + timedelta(days=days), (end - start).days + 1)
+
+    def reset_view(self):
+        self.view = None
+        self.update()
+
+    def view_key(self):
+        return self.current_view()
+
+    @classmethod
+    def level_for(cls, span):
+        for level, days in (('day', 1), ('week', 7), ('month', 30.44)):
+            if span / days <= cls.MAX_BARS:
+                return level
+        return 'year'
+
+    @staticmethod
+    def bucket_range(level, start, end):
+        """[(bucket, label)] covering start..end at level."""
+        buckets = []
+        if level == 'day':
+            day = start
+            while day <= end:
+                buckets.append((day.isoformat(), day.strftime('%d')))
+                day += timedelta(days=1)
+        elif level == 'week':
+            day = start - timedelta(days=start.weekday())
+            while day <= end:
+                iso_year, iso_week, _ = day.isocalendar()
+                buckets.append((f"{iso_year}-W{iso_week:02d}", f"W{iso_week:02d}"))
+                day += timedelta(days=7)
+        elif level == 'month':
+            index, last = start.year * 12 + start.month - 1, end.year * 12 + end.month - 1
+            while index <= last:
+                buckets.append((f"{index // 12:04d}-{index % 12 + 1:02d}", f"{index % 12 + 1:02d}"))
+                index += 1
+        else:
+            buckets = [(str(year), str(year)) for year in range(start.year, end.year + 1)]
+        return buckets
+
+    # --- Mouse -----------------------------------------------------------
+
+    def wheelEvent(self, event):
+        if not event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            event.ignore()  # Plain wheel keeps scrolling the Trends tab
+            return
+        steps = event.angleDelta().y() / 120
+        if steps:
+            anchor = event.position().x() / max(1, self.width())
+            self.zoom(0.8 ** steps, min(max(anchor, 0.0), 1.0))
+        event.accept()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag = (event.position().x(), self.current_view())
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self._drag is not None:
+            x, (start, end) = self._drag
+            span = (end - start).days + 1
+            days = round((x - event.position().x()) / max(1, self.width()) * span)
+            self.set_view(start + timedelta(days=days), span)
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self._drag = None
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        self.reset_view()
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        start, end = self.current_view()
+        step = max(1, ((end - start).days + 1) // 4)
+        if key in (Qt.Key.Key_Plus, Qt.Key.Key_Equal):
+            self.zoom(0.8)
+        elif key == Qt.Key.Key_Minus:
+            self.zoom(1.25)
+        elif key == Qt.Key.Key_Left:
+            self.pan(-step)
+        elif key == Qt.Key.Key_Right:
+            self.pan(step)
+        elif key == Qt.Key.Key_Home:
+            self.reset_view()
+        else:
+            super().keyPressEvent(event)
 
-    def set_data(self, data):
-        self.data = data
-        self.update()
+    # --- Painting --------------------------------------------------------
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        rect = self.rect()
-        
-        is_dark = self.palette().color(QPalette.ColorRole.WindowText).lightness() > 128
-        text_color = QColor("#ffffff") if is_dark else QColor("#000000")
+    def draw(self, painter, rect):
+        text_color = QColor("#ffffff") if self.is_dark() else QColor("#000000")
         
-        if not self.data:
+        if self.series is None or not self.series.levels()['year'].sums:
             painter.setPen(QColor("#888888"))
             painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "No History Data")
             return
 
-        max_val = max(self.data.values()) if self.data else 1
-        count = len(self.data)
-        bar_width = (rect.width() - (count * 10)) / max(1, count)
-        x = 5
-        
-        # Sort by date key (assuming YYYY-MM)
-        sorted_keys = sorted(self.data.keys())[-6:] # Last 6 months
+        start, end = self.current_view()
+        level, buckets, values = self.visible()
+        max_val = max(values) or 1
+
+        # Visible range caption
+        painter.setPen(QColor("#888888"))
+        painter.drawText(QRect(5, 0, rect.width() - 10, 18), Qt.AlignmentFlag.AlignLeft,
+                         f"{start.isoformat()} – {end.isoformat()}")
+
+        count = len(buckets)
+        slot = (rect.width() - 10) / max(1, count)
+        gap = min(10, slot * 0.2)
+        bar_width = slot - gap
+        metrics = painter.fontMetrics()
+        label_every = max(1, int(metrics.horizontalAdvance(buckets[-1][1]) + 6) // max(1, int(slot)) + 1)
+        x = 5 + gap / 2
         
-        for key in sorted_keys:
-            val = self.data[key]
+        for i, ((key, label), val) in enumerate(zip(buckets, values)):
             h = (val / max_val) * (rect.height() - 40)
             
             # Bar
             painter.setBrush(self.palette().highlight().color())
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRect(int(x), int(rect.height() - h - 20), int(bar_width), int(h))
+            painter.drawRect(int(x), int(rect.height() - h - 20), max(1, int(bar_width)), int(h))
             
-            # Label - safely extract month
-            painter.setPen(text_color)
-            parts = key.split('-')
-            month_label = parts[1] if len(parts) >= 2 else key[:3]
-            painter.drawText(QRect(int(x), int(rect.height() - 20), int(bar_width), 20), 
-                           Qt.AlignmentFlag.AlignCenter, month_label)
+            # Label
+            if i % label_every == 0:
+                painter.setPen(text_color)
+                painter.drawText(QRect(int(x - gap / 2), int(rect.height() - 20), int(slot * label_every), 20),
+                               Qt.AlignmentFlag.AlignLeft if label_every > 1 else Qt.AlignmentFlag.AlignCenter,
+                               label)
             
-            x += bar_width + 10
+            x += slot
+
+class CalendarDay:
+    """What a calendar cell shows: the day's bills, unpaid/paid flags and totals."""
+    __slots__ = ('bills', 'unpaid', 'paid', 'totals')
+
+    def __init__(self):
+        self.bills = []  # [(status, bill)]
+        self.unpaid = self.paid = 0
+        self.totals = {'unpaid': {}, 'paid': {}}  # status -> {currency: amount}
+
+    def add(self, status, bill):
+        self.bills.append((status, bill))
+        if status == 'unpaid':
+            self.unpaid += 1
+        else:
+            self.paid += 1
+        try:
+            amount = float(bill.get('amount', 0) or 0)
+        except (TypeError, ValueError):
+            return
+        totals = self.totals[status]
+        currency = bill.get('currency', 'USD')
+        totals[currency] = totals.get(currency, 0.0) + amount
+
+
+class CalendarIndex:
+    """Bills by day, grouped per month, for painting calendars (v6.7.0).
+
+    rebuild() sorts the records into months in one pass; a month's days
+    (date ordinal -> CalendarDay) are filled the first time that month is
+    shown. Painting a cell is then two dict lookups, so a month costs 42
+    lookups however many bills there are.
+    """
+    JULIAN_OFFSET = 1721425  # QDate.toJulianDay() - date.toordinal()
+    _ordinals = {}  # date text -> ordinal (or None), shared; dates repeat a lot
+
+    def __init__(self):
+        self._pending = {}  # (year, month) -> [(ordinal, status, bill)]
+        self._months = {}   # (year, month) -> {ordinal: CalendarDay}
+
+    @classmethod
+    def ordinal(cls, value):
+        """Date ordinal for 'yyyy-MM-dd' (or any ISO date/datetime text), None if unparseable."""
+        if isinstance(value, QDate):
+            return value.toJulianDay() - cls.JULIAN_OFFSET if value.isValid() else None
+        found = cls._ordinals.get(value, False)
+        if found is False:
+            found = None
+            if isinstance(value, str):
+                try:
+                    found = date.fromisoformat(value[:10]).toordinal()
+                except ValueError:
+                    try:
+                        found = datetime.fromisoformat(value).date().toordinal()
+                    except ValueError:
+                        pass
+            cls._ordinals[value] = found
+        return found
+
+    def rebuild(self, unpaid, paid):
+        pending = {}
+        for status, bills, field in (('unpaid', unpaid, None), ('paid', paid, 'paid_date')):
+            for bill in bills:
+                raw = bill.get(field, bill.get('due_date')) if field else bill.get('due_date')
+                if not raw:
+                    continue
+                ordinal = self.ordinal(raw)
+                if ordinal is None:
+                    continue
+                day = date.fromordinal(ordinal)
+                pending.setdefault((day.year, day.month), []).append((ordinal, status, bill))
+        self._pending = pending
+        self._months = {}
+        if DIAGNOSTICS:
+            diag_log.debug(f"CalendarIndex: {len(unpaid)} unpaid, {len(paid)} paid in {len(pending)} months")
+
+    def month(self, year, month):
+        days = self._months.get((year, month))
+        if days is None:
+            days = self._months[(year, month)] = {}
+            for ordinal, status, bill in self._pending.get((year, month), ()):
+                entry = days.get(ordinal)
+                if entry is None:
+                    entry = days[ordinal] = CalendarDay()
+                entry.add(status, bill)
+        return days
+
+    def day(self, qdate):
+        """CalendarDay for a QDate, or None when nothing is due/paid that day."""
+        return self.month(qdate.year(), qdate.month()).get(qdate.toJulianDay() - self.JULIAN_OFFSET)
+
 
 class BillCalendar(QCalendarWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.bills = [] # list of dicts
+        self.index = CalendarIndex()
 
     def set_bills(self, bills):
         self.bills = bills
+        self.index.rebuild(bills, [])
         self.updateCells()
 
     def paintCell(self, painter, rect, date):
         super().paintCell(painter, rect, date)
-        dt = date.toString("yyyy-MM-dd")
         
         # Check for bills
-        bills_on_day = [b for b in self.bills if b.get('due_date') == dt]
-        if bills_on_day:
+        if self.index.day(date) is not None:
             painter.save()
             painter.setBrush(QColor(255, 0, 0, 50)) # Red tint
             painter.setPen(Qt.PenStyle.NoPen)
@@ -4304,6 +7027,69 @@ class BillCalendar(QCalendarWidget):
         super().mouseDoubleClickEvent(event)
 
 
+class StartupPipeline:
+    """Runs the blocking startup stages on worker threads (v6.7.0).
+
+    As soon as the PIN is known, one thread derives the key and then
+    decrypts and parses the config and the data file (each step needs the
+    previous one), while a second reads the rates cache. The GUI thread
+    shows the splash and builds widgets meanwhile; result() only blocks for
+    a stage that has not finished. Timings are kept per stage for the splash
+    and the startup log.
+    """
+    STAGES = ('key', 'config', 'data', 'rates')
+
+    def __init__(self, data_manager, pin=None):
+        self.data_manager = data_manager
+        self.pin = pin
+        self.timings = {}  # stage -> ms
+        self._results = {}
+        self._done = {stage: threading.Event() for stage in self.STAGES}
+
+    def start(self):
+        for target in (self._load_secure, self._load_rates):
+            threading.Thread(target=target, name='StartupPipeline', daemon=True).start()
+        return self
+
+    def _stage(self, name, fn):
+        t0 = time.perf_counter()
+        try:
+            self._results[name] = (fn(), None)
+        except Exception as e:
+            self._results[name] = (None, e)
+        self.timings[name] = (time.perf_counter() - t0) * 1000
+        self._done[name].set()
+
+    def _load_secure(self):
+        dm, pin = self.data_manager, self.pin
+        self._stage('key', lambda: dm._get_key(pin) if pin else None)
+        self._stage('config', lambda: dm.load_config(pin))
+        self._stage('data', lambda: dm.load_data(pin))
+
+    def _load_rates(self):
+        self._stage('rates', self.data_manager.load_rates_cache)
+
+    def done(self, stage):
+        return self._done[stage].is_set()
+
+    def wait(self, stage, idle_fn=None):
+        """Block until a stage finishes, calling idle_fn (e.g. processEvents) meanwhile."""
+        event = self._done[stage]
+        while not event.wait(0.02 if idle_fn else None):
+            idle_fn()
+
+    def result(self, stage):
+        """The stage's return value (re-raising its exception), waiting if needed."""
+        self.wait(stage)
+        value, error = self._results[stage]
+        if error is not None:
+            raise error
+        return value
+
+    def summary(self):
+        return ", ".join(f"{stage} {self.timings[stage]:.0f} ms" for stage in self.STAGES if stage in self.timings)
+
+
 class SplashScreen(QWidget):
     """Modern loading screen with progress indicator."""
     def __init__(self, accent_color='#8338ec'):
@@ -4435,83 +7221,207 @@ class BillCalendarWidget(QCalendarWidget):
     """Custom Calendar Widget to paint indicators for bills."""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.daily_bills = {}  # Map date text -> list of (bill, type)
+        self.index = CalendarIndex()
 
     def set_data(self, unpaid, paid):
-        logging.warning("BillCalendarWidget: set_data called")
-        self.daily_bills = {}
-        
-        def normalize_date(date_val):
-            """Normalize various date formats to yyyy-MM-dd string."""
-            if not date_val:
-                return None
-            try:
-                # If it's already a QDate
-                if isinstance(date_val, QDate):
-                    return date_val.toString("yyyy-MM-dd")
-                
-                # If it's a string, try to parse it
-                if isinstance(date_val, str):
-                    # Try QDate parsing first
-                    qdate = QDate.fromString(date_val, "yyyy-MM-dd")
-                    if qdate.isValid():
-                        return qdate.toString("yyyy-MM-dd")
-                    
-                    # Try other formats if needed, or simple string handling
-                    # For now, let's assume if it's not yyyy-MM-dd it might need repair, 
-                    # but if the app standardizes on yyyy-MM-dd we usually are good.
-                    # Let's try ISO format fallback
-                    try:
-                        dt = datetime.fromisoformat(date_val).date()
-                        return dt.strftime("%Y-%m-%d")
-                    except ValueError:
-                        pass
-                        
-                return str(date_val) # Fallback to original string
-            except Exception:
-                return str(date_val)
-
-        for bill in unpaid:
-            d = normalize_date(bill.get('due_date'))
-            if d:
-                self.daily_bills.setdefault(d, []).append(('unpaid', bill))
-                logging.warning(f"BillCalendarWidget: Added unpaid bill on {d}")
-        for bill in paid:
-            raw_date = bill.get('paid_date', bill.get('due_date'))
-            d = normalize_date(raw_date)
-            if d:
-                self.daily_bills.setdefault(d, []).append(('paid', bill))
-                logging.warning(f"BillCalendarWidget: Added paid bill on {d}")
-        
-        logging.warning(f"BillCalendarWidget: Total daily_bills keys: {list(self.daily_bills.keys())}")
-        self.update() # Trigger repaint of all cells
+        self.index.rebuild(unpaid, paid)
+        self.updateCells() # Trigger repaint of all cells
 
     def paintCell(self, painter, rect, date):
         super().paintCell(painter, rect, date)
-        date_str = date.toString("yyyy-MM-dd")
-        if date_str in self.daily_bills:
-            logging.warning(f"BillCalendarWidget: Painting cell {date_str} - Found Data")
-            bills = self.daily_bills[date_str]
-            has_unpaid = any(b[0] == 'unpaid' for b in bills)
-            has_paid = any(b[0] == 'paid' for b in bills)
-            
+        day = self.index.day(date)
+        if day is not None:
+            if DIAGNOSTICS:
+                diag_log.debug(f"BillCalendarWidget: painting {date.toString('yyyy-MM-dd')} "
+                               f"({day.unpaid} unpaid, {day.paid} paid)")
             painter.save()
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
             
             # Dot positions
-            if has_unpaid:
+            if day.unpaid:
                 painter.setBrush(QColor(255, 85, 85)) # Red
                 painter.setPen(Qt.PenStyle.NoPen)
                 painter.drawEllipse(rect.bottomRight() + QPoint(-15, -15), 6, 6)
             
-            if has_paid:
-                offset = -25 if has_unpaid else -15
+            if day.paid:
+                offset = -25 if day.unpaid else -15
                 painter.setBrush(QColor(80, 250, 123)) # Green
                 painter.setPen(Qt.PenStyle.NoPen)
                 painter.drawEllipse(rect.bottomRight() + QPoint(offset, -15), 6, 6)
                 
             painter.restore()
 
+class BillTableModel(QAbstractTableModel):
+    """Lazy table model over one of the BillLedger lists (v6.7.0).
+
+    Cells are formatted in data(), which the view only asks for on visible
+    rows, so a refresh no longer costs five QTableWidgetItems per bill. The
+    model observes the ledger and turns each list change into the matching
+    row insert/remove signal instead of rebuilding the table.
+    """
+    IdRole = Qt.ItemDataRole.UserRole
+    CategoryRole = Qt.ItemDataRole.UserRole + 1
+    COLUMNS = 5
+    OVERDUE_COLOR = QColor('#ff4d4d')
+    NO_DATE = date.max.toordinal()  # Bills without a valid date sort last
+
+    def __init__(self, ledger, status, currencies, headers, converter=None, parent=None):
+        super().__init__(parent)
+        self.status = status
+        self.is_paid = status == BillLedger.PAID
+        self.bills = ledger.paid if self.is_paid else ledger.unpaid  # mutated in place only
+        self.currencies = currencies
+        self.headers = headers
+        self.converter = converter
+        self._symbols = {}
+        self._sort_keys = {}  # bill id -> (rev, per-column keys)
+        self._today = date.today().toordinal()
+        ledger.observers.append(self)
+
+    def bill_at(self, row):
+        return self.bills[row]
+
+    def sort_key(self, row, column):
+        """Comparable key for a cell, computed once per bill revision."""
+        bill = self.bills[row]
+        entry = self._sort_keys.get(bill['id'])
+        if entry is None or entry[0] != bill.rev:
+            entry = self._sort_keys[bill['id']] = (bill.rev, self._make_sort_keys(bill))
+        return entry[1][column]
+
+    def _make_sort_keys(self, bill):
+        try:
+            amount = float(bill['amount'])
+            if self.converter is not None:
+                amount = self.converter.convert(amount, bill['currency'])
+        except (TypeError, ValueError, KeyError):
+            amount = 0.0
+        due_ord = bill.due_ordinal
+        return (str(bill.get('name', '')).casefold(),
+                amount,
+                get_display_category(bill.get('category', 'Other')).casefold(),
+                self.NO_DATE if due_ord is None else due_ord,
+                get_display_frequency(bill.get('repeat_freq', 'No Repeat')).casefold())
+
+    def refresh(self):
+        """Re-format cells after a currency, category or date change."""
+        self._symbols.clear()
+        self._sort_keys.clear()  # USD amounts follow the latest rates
+        self._today = date.today().toordinal()
+        if self.bills:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.bills) - 1, self.COLUMNS - 1))
+
+    def _symbol(self, currency):
+        symbol = self._symbols.get(currency)
+        if symbol is None:
+            metadata = self.currencies.get(currency, {'symbol': '$'})
+            symbol = metadata.get('symbol', '$') if isinstance(metadata, dict) else metadata
+            self._symbols[currency] = symbol
+        return symbol
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.bills)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMNS
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        bill = self.bills[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return bill['name']
+            if column == 1:
+                return f"{self._symbol(bill['currency'])}{bill['amount']:,.2f}"
+            if self.is_paid:
+                # History shows the stored values as-is
+                if column == 2:
+                    return bill.get('category', 'Other')
+                if column == 3:
+                    return bill.get('due_date', '-')
+                return bill.get('repeat_freq', '-')
+            if column == 2:
+                return get_display_category(bill.get('category', 'Other'))
+            if column == 3:
+                return bill.get('due_date', STRINGS["no_date_label"])
+            return get_display_frequency(bill.get('repeat_freq', 'No Repeat'))
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if not self.is_paid:
+                due_ord = bill.due_ordinal
+                if due_ord is not None and due_ord < self._today:
+                    return self.OVERDUE_COLOR
+            return None
+        if role == self.IdRole:
+            return bill.get('id')
+        if role == self.CategoryRole:
+            return bill.get('category')
+        return None
+
+    # BillLedger observer hooks
+    def begin_insert(self, status, first, last):
+        if status == self.status:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def end_insert(self, status):
+        if status == self.status:
+            self.endInsertRows()
+
+    def begin_remove(self, status, first, last):
+        if status == self.status:
+            self.beginRemoveRows(QModelIndex(), first, last)
+
+    def end_remove(self, status):
+        if status == self.status:
+            self.endRemoveRows()
+
+    def begin_reset(self, status):
+        if status == self.status:
+            self._sort_keys.clear()
+            self.beginResetModel()
+
+    def end_reset(self, status):
+        if status == self.status:
+            self.endResetModel()
+
+    def changed(self, status, row):
+        if status == self.status:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.COLUMNS - 1))
+
+
+class BillSortFilterProxy(QSortFilterProxyModel):
+    """View-only sorting and category filtering over a BillTableModel (v6.7.0).
+
+    Comparisons use the source model's precomputed keys (casefolded names,
+    USD amounts, date ordinals) rather than the displayed text, and neither
+    operation reorders the ledger or triggers a save.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.category = None  # canonical category to show, None for all
+
+    def set_category(self, category):
+        if category != self.category:
+            self.category = category
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.category is None:
+            return True
+        return self.sourceModel().bill_at(source_row).get('category') == self.category
+
+    def lessThan(self, left, right):
+        model = self.sourceModel()
+        column = left.column()
+        return model.sort_key(left.row(), column) < model.sort_key(right.row(), column)
+
+
 class SubscriptionTab(QWidget):
     """A dedicated tab for managing recurring monthly subscriptions."""
     def __init__(self, main_window):
@@ -4596,7 +7506,8 @@ class SubscriptionTab(QWidget):
         menu.exec(self.sub_list.mapToGlobal(pos))
 
     def edit_subscription(self, item):
-        bill = item.data(Qt.ItemDataRole.UserRole)
+        ledger = self.main_window.ledger
+        bill = ledger.get(item.data(Qt.ItemDataRole.UserRole))
         if not bill:
             return
         
@@ -4605,27 +7516,25 @@ class SubscriptionTab(QWidget):
             new_data = dialog.get_data()
             if new_data:
                 # Update original object
-                bill.update(new_data)
+                ledger.update(bill['id'], new_data)
                 self.main_window.save_data()
                 self.main_window.update_display()
 
     def delete_subscription(self, item):
-        bill = item.data(Qt.ItemDataRole.UserRole)
+        ledger = self.main_window.ledger
+        bill = ledger.get(item.data(Qt.ItemDataRole.UserRole))
         if not bill:
             return
             
         confirm = QMessageBox.question(
             self, 
             STRINGS["menu_delete_bill"],
-            STRINGS["msg_confirm_delete_history"].format(bill['name']) if bill in self.main_window.paid_bills else f"Delete '{bill['name']}'?",
+            STRINGS["msg_confirm_delete_history"].format(bill['name']) if ledger.status(bill['id']) == BillLedger.PAID else f"Delete '{bill['name']}'?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
         if confirm == QMessageBox.StandardButton.Yes:
-            if bill in self.main_window.unpaid_bills:
-                self.main_window.unpaid_bills.remove(bill)
-            elif bill in self.main_window.paid_bills:
-                self.main_window.paid_bills.remove(bill)
+            ledger.remove([bill['id']])
             self.main_window.save_data()
             self.main_window.update_display()
 
@@ -4635,7 +7544,6 @@ class SubscriptionTab(QWidget):
         # v6.7.0: Priority to is_subscription flag, fallback to recurring
         subscriptions = [b for b in self.main_window.unpaid_bills if b.get('is_subscription', False) or b.get('repeat_freq', 'No Repeat') != 'No Repeat']
         
-        total_monthly_burn = 0.0
         # 1. Determine Target Currency
         target_curr = self.sub_currency_combo.currentText()
         if not target_curr:
@@ -4649,22 +7557,9 @@ class SubscriptionTab(QWidget):
         t_match = re.search(r'\((.*?)\)', target_curr)
         target_curr_code = t_match.group(1) if t_match else None
         
-        # 2. Get Target Rate
-        to_rate = 1.0 # Default
-        found_rate = False
-        
-        # Try direct key match first
-        if target_curr in self.main_window.exchange_rates:
-            to_rate = self.main_window.exchange_rates[target_curr]
-            found_rate = True
-            
-        # Fallback to code search
-        if not found_rate and target_curr_code:
-            for k, v in self.main_window.exchange_rates.items():
-                if f"({target_curr_code})" in k:
-                    to_rate = v
-                    found_rate = True
-                    break
+        # 2. Collect monthly costs; converted to the target in one batch below
+        converter = self.main_window.converter
+        monthly_costs, currency_ids = [], []
             
         today = date.today()
         for sub in subscriptions:
@@ -4684,18 +7579,12 @@ class SubscriptionTab(QWidget):
             else: # Monthly or manual sub
                 monthly_cost = amount
                 
-            # Convert to summary currency
-            from_rate = self.main_window.exchange_rates.get(sub['currency'], 1.0)
-            
-            # Use pre-calculated to_rate
-            if from_rate > 0:
-                cost_converted = (monthly_cost / from_rate) * to_rate
-                total_monthly_burn += cost_converted
+            monthly_costs.append(monthly_cost)
+            currency_ids.append(converter.id_of(sub['currency']))
             
             # Days until next payment
             try:
-                due_date = datetime.strptime(sub['due_date'], '%Y-%m-%d').date()
-                days_left = (due_date - today).days
+                days_left = sub.due_ordinal - today.toordinal()
                 if days_left < 0:
                     days_str = STRINGS.get("lbl_overdue", "Overdue")
                 elif days_left == 0:
@@ -4710,13 +7599,16 @@ class SubscriptionTab(QWidget):
             symbol = metadata.get('symbol', '$') if isinstance(metadata, dict) else metadata
             display_text = f"{sub['name']} - {symbol}{amount:,.2f} ({freq}) | {days_str}"
             
-            # v6.3.2: Store bill object in item for editing/deletion
+            # v6.3.2: Store bill id in item for editing/deletion
             item = QListWidgetItem(display_text)
             if days_str == STRINGS["lbl_due_today"] or days_str == STRINGS["lbl_overdue"]:
                 item.setForeground(QColor("#ff5555")) # Alert color
 
-            item.setData(Qt.ItemDataRole.UserRole, sub)
+            item.setData(Qt.ItemDataRole.UserRole, sub.get('id'))
             self.sub_list.addItem(item)
+        
+        # Convert to summary currency
+        total_monthly_burn = float(sum(converter.convert_many(monthly_costs, currency_ids, target_curr)))
             
         # Get symbol for target currency
         symbol_target = "$"
@@ -4763,7 +7655,8 @@ class CalendarTab(QWidget):
         self.setLayout(self.layout)
         
     def refresh_data(self):
-        logging.warning("CalendarTab: refresh_data called")
+        if DIAGNOSTICS:
+            diag_log.debug("CalendarTab: refresh_data called")
         self.calendar.set_data(self.parent_window.unpaid_bills, self.parent_window.paid_bills)
         self.on_date_click(self.calendar.selectedDate())
         
@@ -4781,7 +7674,8 @@ class CalendarTab(QWidget):
         self.details_group.setTitle(title)
         self.details_list.clear()
         
-        bills = self.calendar.daily_bills.get(date_str, [])
+        day = self.calendar.index.day(qdate)
+        bills = day.bills if day is not None else []
         if not bills:
             try:
                 msg = STRINGS.get("label_no_bills_due", "No bills due on {}").format(date_str)
@@ -4798,6 +7692,14 @@ class CalendarTab(QWidget):
             item = QListWidgetItem(f"{icon} {bill['name']} - {symbol}{bill['amount']}")
             self.details_list.addItem(item)
 
+        # Day totals per currency, from the index
+        parts = []
+        for status, icon in (('unpaid', "🔴"), ('paid', "🟢")):
+            for curr, amount in day.totals[status].items():
+                parts.append(f"{icon} {CURRENCY_SYMBOLS.get(curr, curr)}{amount:,.2f}")
+        if len(bills) > 1 and parts:
+            self.details_list.addItem("Σ " + "  ".join(parts))
+
 
 class SearchDialog(QDialog):
 
@@ -4881,12 +7783,14 @@ class SearchDialog(QDialog):
                     results.append((bill, status))
         
         # Display results
+        today_ord = date.today().toordinal()
         self.results_table.setRowCount(len(results))
         for i, (bill, status) in enumerate(results):
             symbol_data = self.currencies.get(bill['currency'], '$')
             symbol = symbol_data.get('symbol', '$') if isinstance(symbol_data, dict) else symbol_data
             
             name_item = QTableWidgetItem(bill['name'])
+            name_item.setData(Qt.ItemDataRole.UserRole, bill.get('id'))
             amount_item = QTableWidgetItem(f"{symbol}{bill['amount']:,.2f}")
             category_item = QTableWidgetItem(bill.get('category', 'Other'))
             date_item = QTableWidgetItem(bill.get('due_date', STRINGS["no_date_label"]))
@@ -4894,13 +7798,10 @@ class SearchDialog(QDialog):
             
             # Highlight overdue unpaid bills
             if status == STRINGS["status_unpaid"]:
-                try:
-                    due_dt = datetime.strptime(bill.get('due_date', ''), '%Y-%m-%d').date()
-                    if due_dt < date.today():
-                        for item in [name_item, amount_item, category_item, date_item, status_item]:
-                            item.setForeground(QColor('#ff4d4d'))
-                except:
-                    pass
+                due_ord = bill.due_ordinal
+                if due_ord is not None and due_ord < today_ord:
+                    for item in [name_item, amount_item, category_item, date_item, status_item]:
+                        item.setForeground(QColor('#ff4d4d'))
             
             self.results_table.setItem(i, 0, name_item)
             self.results_table.setItem(i, 1, amount_item)
@@ -4929,15 +7830,13 @@ class SearchDialog(QDialog):
         menu.exec(self.results_table.viewport().mapToGlobal(position))
     
     def get_bill_from_row(self, row):
-        """Get the actual bill object from a table row."""
-        name = self.results_table.item(row, 0).text()
-        status = self.results_table.item(row, 4).text()
-        
-        bills_list = self.unpaid_bills if status == STRINGS["status_unpaid"] else self.paid_bills
-        for bill in bills_list:
-            if bill['name'] == name:
-                return bill, status
-        return None, None
+        """Get the actual bill object from a table row (rows carry the bill id)."""
+        ledger = self.parent_window.ledger
+        bill = ledger.get(self.results_table.item(row, 0).data(Qt.ItemDataRole.UserRole))
+        if bill is None:
+            return None, None
+        status = ledger.status(bill['id'])
+        return bill, STRINGS["status_paid"] if status == BillLedger.PAID else STRINGS["status_unpaid"]
     
     def pay_selected_bill(self, row):
         """Pay the selected bill."""
@@ -4982,6 +7881,7 @@ class PDFReportGenerator:
     def __init__(self, filename):
         self.filename = filename
         self.font_name = 'Helvetica'
+        from reportlab.lib.styles import getSampleStyleSheet
         self.styles = getSampleStyleSheet()
         self.register_fonts()
 
@@ -4991,6 +7891,8 @@ class PDFReportGenerator:
             # Try to register Sylfaen (standard on Windows for Georgian)
             font_path = "C:/Windows/Fonts/sylfaen.ttf"
             if os.path.exists(font_path):
+                from reportlab.pdfbase import pdfmetrics
+                from reportlab.pdfbase.ttfonts import TTFont
                 pdfmetrics.registerFont(TTFont('Sylfaen', font_path))
                 self.font_name = 'Sylfaen'
             else:
@@ -5008,6 +7910,10 @@ class PDFReportGenerator:
         """
         if not REPORTLAB_AVAILABLE:
             return False
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage
 
         doc = SimpleDocTemplate(self.filename, pagesize=A4)
         elements = []
@@ -5116,24 +8022,21 @@ class PDFReportGenerator:
 class BillTrackerWindow(QMainWindow):
     """Main application window."""
     def get_exchange_rate(self, currency_code):
-        """Robustly find exchange rate for a given currency code."""
-        with self.data_lock:
-            rates = self.exchange_rates
-        
-        # 1. Try direct code match
-        if currency_code in rates:
-            return rates[currency_code]
-            
-        # 2. Search by code in metadata
-        for k, v in self.currencies.items():
-            if isinstance(v, dict) and v.get('code') == currency_code:
-                return rates.get(k, 1.0)
-                
-        return 1.0
+        """Exchange rate (units per USD) for a display key, ISO code or legacy label."""
+        return self.converter.rate(currency_code)
+
+    @property
+    def unpaid_bills(self):
+        return self.ledger.unpaid
+
+    @property
+    def paid_bills(self):
+        return self.ledger.paid
 
-    def __init__(self, session_pin=None):
+    def __init__(self, session_pin=None, startup=None):
         super().__init__()
         global STRINGS, CATEGORIES, FREQUENCIES
+        # startup: a StartupPipeline already decrypting config/data for this PIN (see __main__)
         self.session_pin = session_pin
         self.setWindowTitle(f"{STRINGS['app_title']} v{__version__}")
         self.setWindowIcon(QIcon(get_icon_path()))
@@ -5146,14 +8049,19 @@ class BillTrackerWindow(QMainWindow):
         
         # Initialize data
         config_dir = os.path.join(os.path.expanduser('~'), '.bill_tracker')
-        self.data_manager = DataManager(config_dir)
+        self.data_manager = startup.data_manager if startup else DataManager(config_dir)
+        self.save_scheduler = SaveScheduler(self.data_manager, self._snapshot_data, parent=self)
+        self.save_scheduler.save_failed.connect(self.on_save_failed)
+        self.refresh_scheduler = RefreshScheduler(self)
         self.currencies = get_currency_list()
         
-        self.unpaid_bills = []
-        self.paid_bills = []
+        self.ledger = BillLedger()  # unpaid/paid lists + id index
+        self.savings_totals = RunningTotals()  # 'current'/'target' per goal currency
+        self.paid_index = None  # Summaries of cold paid-history years not loaded yet
         self.budget = 0.0
         self.custom_categories = []
         self.savings_goals = []
+        self._tab_currency = {}  # Subscription/savings currency while those tabs are unbuilt
         self.data_lock = threading.Lock() # Hardened: Protects shared data (rates, budget)
         
         # v6.3.6: Preferred currencies for dropdowns
@@ -5175,14 +8083,14 @@ class BillTrackerWindow(QMainWindow):
         self.lock_on_minimize = False   # Default, will be loaded from config
         self.last_activity_time = datetime.now()  # Initialize activity timestamp
         
-        # Initialize exchange rates with safe defaults (1.0)
-        self.exchange_rates = {curr: 1.0 for curr in self.currencies}
-        
-        self.load_data()
+        # Rate table indexed by currency id; every rate is 1.0 until loaded
+        self.converter = CurrencyConverter(self.currencies)
         
         # Load User Preferences (Theme, Language, etc.)
-        # Pass session_pin to decrypt config now that we have it
-        config = self.data_manager.load_config(session_pin)
+        # Pass session_pin to decrypt config now that we have it.
+        # Loaded before the data so a custom data path / storage backend is honoured.
+        config = startup.result('config') if startup else self.data_manager.load_config(session_pin)
+        
         self.is_dark_mode = config.get('dark_mode', True)
         self.accent_color = config.get('accent_color', '#6200ea')
         
@@ -5220,6 +8128,10 @@ class BillTrackerWindow(QMainWindow):
         # UI Setup
 
         # UI Setup
+        ui_t0 = time.perf_counter()
+        self._deferred_tabs = {}  # tab index -> (placeholder, builder)
+        data = None
+        data_loaded = False
         # Suppress updates while building the UI to avoid repeated repaints
         self.setUpdatesEnabled(False)
         try:
@@ -5246,13 +8158,15 @@ class BillTrackerWindow(QMainWindow):
             
             self.tray_icon.show()
             
-            # Background Timer for Reminders (Every 30 minutes for higher precision on daily time)
-            self.bg_timer = QTimer(self)
-            self.bg_timer.timeout.connect(self.check_due_bills)
-            self.bg_timer.start(1800000) # 30 minutes in ms
+            # Webhook delivery runs off the GUI thread; reminders queued before a restart resume
+            self.webhooks = WebhookQueue(os.path.join(self.data_manager.config_dir, 'webhook_queue.json'), self)
+            if config.get('webhooks_enabled', False):
+                self.webhooks.set_target(config.get('webhook_url'))
             
-            # Check for due bills after a short delay
-            QTimer.singleShot(2000, self.check_due_bills)
+            # Reminders: once shortly after launch, then at the next reminder moment (v6.7.0)
+            self.reminders = ReminderScheduler(self.ledger, lambda: self.data_manager.load_config(self.session_pin),
+                                               self.check_due_bills, self)
+            self.reminders.start()
 
             # Tabs
             self.tabs = QTabWidget()
@@ -5261,9 +8175,6 @@ class BillTrackerWindow(QMainWindow):
             # Connect tab change for lazy loading
             self.tabs.currentChanged.connect(self._on_tab_changed)
             
-            # Chart cache for performance
-            self._chart_cache_hash = None
-            
             # Tab 1: Dashboard
             self.dashboard_tab = QWidget()
             self.setup_dashboard_tab()
@@ -5279,52 +8190,62 @@ class BillTrackerWindow(QMainWindow):
             self.setup_paid_tab()
             self.tabs.addTab(self.paid_tab, get_icon("clipboard"), STRINGS["tab_paid"])
 
+            # v6.7.0: Tabs 4-8 get a placeholder now and are built on first activation
             # Tab 4: Charts
-            self.chart_tab = QWidget()
-            self.setup_chart_tab()
-            self.tabs.addTab(self.chart_tab, get_icon("chart-bar"), STRINGS["tab_trends"])
+            self.add_deferred_tab(self.build_chart_tab, "chart-bar", STRINGS["tab_trends"])
 
             # Tab 5: Calendar
-            self.calendar_tab = CalendarTab(self)
-            self.tabs.addTab(self.calendar_tab, get_icon("calendar"), STRINGS["tab_calendar"])
-            self.calendar_tab.refresh_data()
+            self.add_deferred_tab(self.build_calendar_tab, "calendar", STRINGS["tab_calendar"])
 
             # Tab 6: Subscriptions
-            self.subscription_tab = SubscriptionTab(self)
-            self.tabs.addTab(self.subscription_tab, get_icon("credit-card"), STRINGS["tab_subscriptions"])
+            self.add_deferred_tab(self.build_subscription_tab, "credit-card", STRINGS["tab_subscriptions"])
 
             # Tab 7: Savings Goals (v6.7.0)
-            self.savings_tab = SavingsTab(self)
-            self.tabs.addTab(self.savings_tab, get_icon("target"), STRINGS["tab_savings"])
+            self.add_deferred_tab(self.build_savings_tab, "target", STRINGS["tab_savings"])
 
             # Tab 8: About
             ma_about_text = STRINGS.get("tab_about", "ℹ️ About")
-            self.about_tab = QWidget()
-            self.setup_about_tab()
-            self.tabs.addTab(self.about_tab, get_icon("info-circle"), ma_about_text)
+            self.add_deferred_tab(self.build_about_tab, "info-circle", ma_about_text)
             
             # Initialize about tab lazy loading flag
             self.about_loaded = False
 
-            # Final Initialization
-            # Load cached rates and schedule fetching new ones shortly after startup
-            cached = self.data_manager.load_rates_cache()
-            if cached and isinstance(cached, dict) and 'conversion_rates' in cached:
-                self.handle_api_result({'status': 'success', 'data': cached})
+            # v6.7.0: Views refreshed by the dirty-flag scheduler (see update_display);
+            # deferred tabs register theirs when built
+            refresh = self.refresh_scheduler
+            refresh.register(RefreshScheduler.TOTALS, self.update_totals)
+            refresh.register(RefreshScheduler.UNPAID, self.update_unpaid_table_view, self.tab_visible(self.unpaid_tab))
+            refresh.register(RefreshScheduler.PAID, self.update_paid_table_view, self.tab_visible(self.paid_tab))
 
-            # Delay the live refresh slightly so the UI becomes responsive first
-            QTimer.singleShot(300, self.refresh_rates)
-            QTimer.singleShot(50, self.update_display)
-            
-            # Timer for periodic rate refresh
+            # Final Initialization
+            # v6.7.0: Rate refreshes follow the cache's age: none while it is
+            # younger than the TTL, a conditional request once it expires
+            self.rates_cache = None
+            self.rates_error = None
+            self.api_thread = None
             self.rate_timer = QTimer()
+            self.rate_timer.setSingleShot(True)
             self.rate_timer.timeout.connect(self.refresh_rates)
+            self.rates_age_timer = QTimer()
+            self.rates_age_timer.timeout.connect(self.update_rates_label)
+            self.rates_age_timer.start(60000)
+
+            cached = startup.result('rates') if startup else self.data_manager.load_rates_cache()
+            if cached and isinstance(cached, dict) and 'conversion_rates' in cached:
+                self.apply_rates(cached)
+            self.schedule_rate_refresh()
+            QTimer.singleShot(50, self.update_display)
             
             # Performance: Debounce timer for filtering
             self.filter_timer = QTimer()
             self.filter_timer.setSingleShot(True)
             self.filter_timer.timeout.connect(self.update_unpaid_table_view)
-            self.rate_timer.start(3600000)  # Every hour
+
+            # v6.7.0: Data is loaded once the widgets exist; with a startup pipeline
+            # it has been decrypting on a worker thread while they were built
+            data = startup.result('data') if startup else None
+            self.load_data(data)
+            data_loaded = True
             
             # Security: Idle timer for auto-lock
             self.idle_timer = QTimer()
@@ -5332,7 +8253,6 @@ class BillTrackerWindow(QMainWindow):
             self.idle_timer.start(60000)  # Check every minute
             
             # Load auto-lock settings from config
-            config = self.data_manager.load_config(self.session_pin)
             self.auto_lock_enabled = bool(config.get('auto_lock_enabled', False))
             try:
                 self.idle_timeout_minutes = int(config.get('idle_timeout_minutes', 5))
@@ -5344,7 +8264,7 @@ class BillTrackerWindow(QMainWindow):
             self.summary_currency_combo.currentTextChanged.connect(self.on_currency_changed)
 
             # Restore last used currencies
-            self.restore_currency_preferences()
+            self.restore_currency_preferences(data)
 
             # Keyboard Shortcuts
             search_shortcut = QShortcut(QKeySequence("Ctrl+F"), self)
@@ -5355,11 +8275,19 @@ class BillTrackerWindow(QMainWindow):
 
             # Install event filter for activity tracking (auto-lock)
             QApplication.instance().installEventFilter(self)
+
+            startup_log.info(f"UI built in {(time.perf_counter() - ui_t0) * 1000:.0f} ms "
+                             f"({len(self._deferred_tabs)} tabs deferred)")
+            QTimer.singleShot(0, lambda: startup_log.info(
+                f"Interactive {(time.perf_counter() - STARTUP_T0) * 1000:.0f} ms after launch"))
         except Exception as e:
             logging.error(f"UI initialization error: {e}")
             # Fallback: create at least a basic layout if everything fails
             if not self.centralWidget():
                 self.setCentralWidget(QWidget())
+            if not data_loaded:
+                # Never carry on without the data; a later save would overwrite it
+                self.load_data(data)
         finally:
             # CRITICAL: Always re-enable updates to prevent blank window 🛡️
             self.setUpdatesEnabled(True)
@@ -5698,23 +8626,30 @@ class BillTrackerWindow(QMainWindow):
         layout.addLayout(filter_layout)
         
         # Table
-        self.unpaid_table = QTableWidget()
-        self.unpaid_table.setColumnCount(5)
-        self.unpaid_table.setHorizontalHeaderLabels([
+        # v6.7.0: Model/view; cells are formatted lazily for visible rows only
+        self.unpaid_model = BillTableModel(self.ledger, BillLedger.UNPAID, self.currencies, [
             STRINGS["header_name"], 
             STRINGS["header_amount"], 
             STRINGS["header_category"], 
             STRINGS["header_due_date"], 
             STRINGS["header_frequency"]
-        ])
+        ], self.converter, self)
+        self.unpaid_proxy = BillSortFilterProxy(self)
+        self.unpaid_proxy.setSourceModel(self.unpaid_model)
+        self.unpaid_table = QTableView()
+        self.unpaid_table.setModel(self.unpaid_proxy)
         self.unpaid_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Header clicks sort the view only; start in stored (insertion) order
+        self.unpaid_table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.unpaid_table.horizontalHeader().setSortIndicatorClearable(True)
+        self.unpaid_table.setSortingEnabled(True)
         self.unpaid_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.unpaid_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
 
         self.unpaid_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.unpaid_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.unpaid_table.customContextMenuRequested.connect(self.show_unpaid_context_menu)
-        self.unpaid_table.itemClicked.connect(lambda item: self.show_bill_details(item, is_paid=False))
+        self.unpaid_table.clicked.connect(lambda index: self.show_bill_details(index, is_paid=False))
         layout.addWidget(self.unpaid_table)
 
     def setup_paid_tab(self):
@@ -5732,15 +8667,15 @@ class BillTrackerWindow(QMainWindow):
         layout.addWidget(self.paid_summary_label)
         
         # Table
-        self.paid_table = QTableWidget()
-        self.paid_table.setColumnCount(5)
-        self.paid_table.setHorizontalHeaderLabels([
+        self.paid_model = BillTableModel(self.ledger, BillLedger.PAID, self.currencies, [
             STRINGS["header_name"], 
             STRINGS["header_amount"], 
             STRINGS["header_category"], 
             STRINGS["header_paid_date"], 
             STRINGS["header_frequency"]
-        ])
+        ], parent=self)
+        self.paid_table = QTableView()
+        self.paid_table.setModel(self.paid_model)
         self.paid_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.paid_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.paid_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
@@ -5748,11 +8683,11 @@ class BillTrackerWindow(QMainWindow):
         self.paid_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.paid_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.paid_table.customContextMenuRequested.connect(self.show_paid_context_menu)
-        self.paid_table.itemClicked.connect(lambda item: self.show_bill_details(item, is_paid=True))
+        self.paid_table.clicked.connect(lambda index: self.show_bill_details(index, is_paid=True))
         layout.addWidget(self.paid_table)
     
-    def restore_currency_preferences(self):
-        """Restore last used currency selections from saved data."""
+    def restore_currency_preferences(self, data=None):
+        """Restore last used currency selections from saved data (or the dict just loaded)."""
         try:
             # Block signals to prevent "on_currency_changed" from triggering saves 
             # while we are still restoring the state. This prevents partial data overwrites.
@@ -5761,7 +8696,9 @@ class BillTrackerWindow(QMainWindow):
             self.summary_currency_combo.blockSignals(True)
             
             # CRITICAL FIX: Pass session_pin to decrypt data correctly!
-            data = self.data_manager.load_data(self.session_pin)
+            if data is None:
+                self.flush_saves()
+                data = self.data_manager.load_data(self.session_pin)
             budget_curr = data.get('budget_currency')
             bill_curr = data.get('bill_currency')
             summary_curr = data.get('summary_currency')
@@ -5826,10 +8763,14 @@ class BillTrackerWindow(QMainWindow):
             sav_curr = data.get('savings_currency')
             
             sub_key = find_display_key(sub_curr)
+            if sub_key:
+                 self._tab_currency['subscription_currency'] = sub_key  # Tab may not be built yet
             if sub_key and hasattr(self, 'subscription_tab'):
                  self.subscription_tab.sub_currency_combo.setCurrentText(sub_key)
                  
             sav_key = find_display_key(sav_curr)
+            if sav_key:
+                 self._tab_currency['savings_currency'] = sav_key
             if sav_key and hasattr(self, 'savings_tab'):
                  self.savings_tab.savings_currency_combo.setCurrentText(sav_key)
             
@@ -5856,9 +8797,15 @@ class BillTrackerWindow(QMainWindow):
     
 
     
-    def load_data(self):
-        data = self.data_manager.load_data(self.session_pin)
+    def load_data(self, data=None):
+        # In-memory state is about to be replaced; queued snapshots are obsolete
+        self.save_scheduler.cancel()
+        if data is None:
+            data = self.data_manager.load_data(self.session_pin)
         self.custom_categories = data.get('custom_categories', [])
+        if hasattr(self, 'bill_category_combo'):
+            self.update_category_combos()
+        self._tab_currency = {key: data.get(key) for key in ('subscription_currency', 'savings_currency')}
         
         if data.get('__tampered__'):
             reply = QMessageBox.critical(self, STRINGS["title_security_alert"], 
@@ -5868,46 +8815,51 @@ class BillTrackerWindow(QMainWindow):
                 self.restore_backup()
                 return
         
-        self.unpaid_bills = data.get('unpaid_bills', [])
-        self.paid_bills = data.get('paid_bills', [])
+        # MIGRATION: Bills from older versions get their stable id here
+        assigned = self.ledger.reset(data.get('unpaid_bills', []), data.get('paid_bills', []))
+        self.set_paid_index(data.get('paid_index'))
         self.budget = float(data.get('budget', 0.0))
         self.savings_goals = data.get('savings_goals', [])
+        self.savings_totals.clear()
+        for goal in self.savings_goals:
+            self.count_goal(goal)
+        retired = bool(self.paid_index) and self.retire_cold_history()
+        if retired or assigned or (not self.paid_index and self.data_manager.needs_segmenting(self.paid_bills)):
+            # MIGRATION: Persist new ids / move old paid history into per-year segments
+            self.save_data()
         
-        # Update Tabs
-        if hasattr(self, 'calendar_tab'):
-           self.calendar_tab.refresh_data()
-        if hasattr(self, 'savings_tab'):
-           self.savings_tab.refresh_data()
-        if hasattr(self, 'subscription_tab'):
-           self.subscription_tab.refresh_data()
-        if hasattr(self, 'savings_tab'):
-            self.savings_tab.refresh_data()
+        # Update Tabs (once, in the next refresh batch)
+        self.refresh_scheduler.mark()
         
         self.setUpdatesEnabled(True)
     
     def restore_backup(self):
         """Attempt to restore from backup folder."""
-        backup_dir = os.path.join(self.data_manager.config_dir, 'backups')
-        if not os.path.exists(backup_dir):
-            QMessageBox.warning(self, STRINGS["title_restore_failed"], STRINGS["msg_no_backups"])
-            return
-
-        backups = sorted([f for f in os.listdir(backup_dir) if f.startswith('bill_data_')], reverse=True)
+        backups = self.data_manager.list_backups()
         if not backups:
             QMessageBox.warning(self, STRINGS["title_restore_failed"], STRINGS["msg_no_backups"])
             return
             
-        latest = os.path.join(backup_dir, backups[0])
+        latest = self.data_manager.legacy_backup_path(backups[-1])
         try:
             # Hardened: Verify integrity BEFORE restoring 🛡️
-            with open(latest, 'r', encoding='utf-8') as f:
-                test_load = json.load(f)
-            if not isinstance(test_load, dict) or 'unpaid_bills' not in test_load:
-                raise ValueError("Backup file is corrupt or invalid format")
+            # (store points are verified against their digest while being reassembled)
+            if latest is None:
+                pass
+            elif latest.endswith('.db'):
+                with sqlite3.connect(latest) as test_db:
+                    if test_db.execute("PRAGMA integrity_check").fetchone()[0] != 'ok':
+                        raise ValueError("Backup file is corrupt or invalid format")
+            else:
+                with open(latest, 'r', encoding='utf-8') as f:
+                    test_load = json.load(f)
+                if not isinstance(test_load, dict) or 'unpaid_bills' not in test_load:
+                    raise ValueError("Backup file is corrupt or invalid format")
 
             # Copy backup to main data file
-            import shutil
-            shutil.copy2(latest, self.data_manager.data_file)
+            self.flush_saves()
+            if not self.data_manager.restore_backup(backups[-1], self.session_pin):
+                raise IOError("Backup could not be copied")
             QMessageBox.information(self, STRINGS["title_restored"], STRINGS["msg_restored"])
             self.load_data()
             self.update_display()
@@ -5929,6 +8881,17 @@ class BillTrackerWindow(QMainWindow):
         self.current_toast.show_toast(duration)
 
     def save_data(self):
+        """Queue a save; bursts are coalesced and written off the GUI thread."""
+        self.save_scheduler.schedule()
+
+    def flush_saves(self):
+        """Write queued changes synchronously (exit, backup, restore)."""
+        self.save_scheduler.flush()
+
+    def on_save_failed(self):
+        QMessageBox.warning(self, STRINGS["title_save_failed"], STRINGS["msg_save_failed"])
+
+    def _snapshot_data(self):
         data = {
             'budget': self.budget,
             'unpaid_bills': self.unpaid_bills,
@@ -5936,11 +8899,52 @@ class BillTrackerWindow(QMainWindow):
             'budget_currency': self.budget_currency_combo.currentText(),
             'bill_currency': self.bill_currency_combo.currentText(),
             'summary_currency': self.summary_currency_combo.currentText(),
-            'subscription_currency': self.subscription_tab.sub_currency_combo.currentText() if hasattr(self, 'subscription_tab') else None,
-            'savings_currency': self.savings_tab.savings_currency_combo.currentText() if hasattr(self, 'savings_tab') else None,
-            'custom_categories': self.custom_categories
+            # Unbuilt tabs keep the loaded preference
+            'subscription_currency': self.subscription_tab.sub_currency_combo.currentText() if hasattr(self, 'subscription_tab') else self._tab_currency.get('subscription_currency'),
+            'savings_currency': self.savings_tab.savings_currency_combo.currentText() if hasattr(self, 'savings_tab') else self._tab_currency.get('savings_currency'),
+            'custom_categories': self.custom_categories,
+            'savings_goals': self.savings_goals
         }
-        self.data_manager.save_data(data, self.session_pin)
+        if self.paid_index:
+            data['paid_index'] = self.paid_index  # Cold history not loaded; keep its segments
+        return data, self.session_pin
+
+    def count_goal(self, goal, sign=1):
+        """Add (sign=1) or remove (sign=-1) a savings goal from the running totals."""
+        try:
+            current, target = float(goal['current']) * 100, float(goal['target']) * 100
+        except (KeyError, TypeError, ValueError):
+            return
+        self.savings_totals.add('current', goal.get('currency', 'USD'), current, sign)
+        self.savings_totals.add('target', goal.get('currency', 'USD'), target, sign)
+
+    def set_paid_index(self, index):
+        """Summaries of the cold paid-history years not loaded (None once all are)."""
+        self.paid_index = index or None
+        self.ledger.paid_series.set_cold((index or {}).values())
+
+    def retire_cold_history(self):
+        """Segment paid years that left the hot window (e.g. after New Year)
+        without loading the cold years already segmented. Returns True if any moved."""
+        if not self.data_manager.needs_segmenting(self.paid_bills):
+            return False
+        index, moved = self.data_manager.retire_history(self.paid_index, self.paid_bills, self.session_pin)
+        if not moved:
+            return False
+        self.ledger.remove([bill['id'] for bill in moved])
+        self.set_paid_index(index)
+        return True
+
+    def ensure_paid_history(self):
+        """Load cold paid-history segments into paid_bills (Paid tab, search, export)."""
+        if not self.paid_index:
+            return
+        records, tampered = self.data_manager.load_paid_history(self.session_pin)
+        if self.ledger.extend(records, BillLedger.PAID):
+            self.save_data()  # Segments written before bill ids existed
+        self.set_paid_index(None)
+        if tampered:
+            QMessageBox.warning(self, STRINGS["title_security_alert"], STRINGS["msg_history_tampered"])
     
     def set_budget(self):
         try:
@@ -5949,7 +8953,7 @@ class BillTrackerWindow(QMainWindow):
             curr = self.budget_currency_combo.currentText()
             
             with self.data_lock:
-                rate = self.exchange_rates.get(curr, 1)
+                rate = self.converter.rate(curr)
                 if rate <= 0:
                     raise ValueError
                 self.budget = amount / rate
@@ -6001,7 +9005,7 @@ class BillTrackerWindow(QMainWindow):
             'is_subscription': self.bill_is_subscription_chk.isChecked(),
             'created_at': datetime.now().isoformat()
         }
-        self.unpaid_bills.append(bill)
+        self.ledger.add(bill)
         
         # Reset inputs
         self.bill_name_input.clear()
@@ -6013,48 +9017,52 @@ class BillTrackerWindow(QMainWindow):
         QMessageBox.information(self, STRINGS["title_success"], STRINGS["msg_bill_added"].format(name))
 
     def pay_bill(self, bill, silent=False):
-        """Pay a bill and move to paid list. Handle recurrence."""
+        """Pay a bill and move to paid list. Handle recurrence.
+
+        silent=True skips the confirmation and the save/refresh, for batch
+        payments that save once at the end.
+        """
+        if bill.get('id') not in self.ledger or self.ledger.status(bill['id']) != BillLedger.UNPAID:
+            return
         if not silent:
             reply = QMessageBox.question(self, STRINGS["dialog_confirm_payment"],
                                        STRINGS["confirm_payment_msg"].format(bill['name']),
                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             if reply != QMessageBox.StandardButton.Yes:
                 return
-            rate = self.exchange_rates.get(bill['currency'], 1)
-            # Find closest rate or default
             
-            # Handle Recurrence
-            # Use canonical frequency for logic (always English)
-            freq = get_canonical_frequency(bill.get('repeat_freq', 'No Repeat'))
-            
-            if freq != 'No Repeat':
-                try:
-                    # Use QDate for robust date math
-                    qd = QDate.fromString(bill['due_date'], 'yyyy-MM-dd')
-                    if not qd.isValid():
-                        qd = QDate.currentDate()
-                    
-                    if freq == 'Weekly': qd = qd.addDays(7)
-                    elif freq == 'Monthly': qd = qd.addMonths(1)
-                    elif freq == 'Yearly': qd = qd.addYears(1)
-                    
-                    new_bill = bill.copy()  # Use copy to create new recurring bill
-                    new_bill['due_date'] = qd.toString('yyyy-MM-dd')
-                    new_bill['created_at'] = datetime.now().isoformat()
-                    
-                    # Auto-create next bill
-                    self.unpaid_bills.append(new_bill)
-                    
-                    # Notify user
-                    self.show_toast(
-                        f"{STRINGS['title_recurring_created']}\n{STRINGS['msg_recurring_created'].format(bill['name'], new_bill['due_date'])}"
-                    )
-                except Exception as e:
-                    logging.error(f"Recurrence error: {e}")
+        # Handle Recurrence
+        # Use canonical frequency for logic (always English)
+        freq = get_canonical_frequency(bill.get('repeat_freq', 'No Repeat'))
+        
+        if freq != 'No Repeat':
+            try:
+                # Use QDate for robust date math
+                qd = QDate.fromString(bill['due_date'], 'yyyy-MM-dd')
+                if not qd.isValid():
+                    qd = QDate.currentDate()
+                
+                if freq == 'Weekly': qd = qd.addDays(7)
+                elif freq == 'Monthly': qd = qd.addMonths(1)
+                elif freq == 'Yearly': qd = qd.addYears(1)
+                
+                new_bill = bill.copy()  # Use copy to create new recurring bill
+                new_bill['due_date'] = qd.toString('yyyy-MM-dd')
+                new_bill['created_at'] = datetime.now().isoformat()
+                
+                # Auto-create next bill (the ledger gives the copy its own id)
+                self.ledger.add(new_bill)
+                
+                # Notify user
+                self.show_toast(
+                    f"{STRINGS['title_recurring_created']}\n{STRINGS['msg_recurring_created'].format(bill['name'], new_bill['due_date'])}"
+                )
+            except Exception as e:
+                logging.error(f"Recurrence error: {e}")
 
-            if bill in self.unpaid_bills:
-                self.unpaid_bills.remove(bill)
-            self.paid_bills.insert(0, bill) # Add to top
+        self.ledger.update(bill['id'], {'paid_date': date.today().isoformat()})
+        self.ledger.move([bill['id']], BillLedger.PAID, front=True) # Add to top
+        if not silent:
             self.save_data()
             self.update_display()
 
@@ -6069,6 +9077,7 @@ class BillTrackerWindow(QMainWindow):
         file_path, _ = QFileDialog.getSaveFileName(self, STRINGS["title_export_data"], "bill_history.csv", STRINGS["filter_csv"])
         if not file_path:
             return
+        self.ensure_paid_history()
             
         try:
             with open(file_path, 'w', newline='', encoding='utf-8') as f:
@@ -6093,6 +9102,7 @@ class BillTrackerWindow(QMainWindow):
         
         if not file_path:
             return
+        self.ensure_paid_history()
 
         # Prepare Data
         # 1. Capture Charts
@@ -6100,46 +9110,37 @@ class BillTrackerWindow(QMainWindow):
         import tempfile
         temp_dir = tempfile.gettempdir()
         
+        # The Trends tab may never have been opened, or be stale while hidden
+        self.ensure_tab(3)
+        self.refresh_scheduler.show(RefreshScheduler.CHARTS)
         try:
             # Budget Chart
             p1 = os.path.join(temp_dir, f"budget_{timestamp}.png")
-            self.budget_chart.grab().save(p1)
+            self.budget_chart.export_image(p1)
             chart_images.append(p1)
             
             # Category Chart
             p2 = os.path.join(temp_dir, f"category_{timestamp}.png")
-            self.category_chart.grab().save(p2)
+            self.category_chart.export_image(p2)
             chart_images.append(p2)
             
             # Trends Chart
             p3 = os.path.join(temp_dir, f"trends_{timestamp}.png")
-            self.trends_chart.grab().save(p3)
+            self.trends_chart.export_image(p3)
             chart_images.append(p3)
         except Exception as e:
             logging.warning(f"Failed to capture charts: {e}")
 
         # 2. Summary Data
         # Recalculate summary totals
-        with self.data_lock:
-             rates = self.exchange_rates.copy()
-             
         curr = self.summary_currency_combo.currentText()
-        summary_rate = rates.get(curr, 1)
+        summary_rate = self.converter.rate(curr)
         
-        total_unpaid = sum(b['amount'] / (rates.get(b['currency'], 1.0) or 1.0) for b in self.unpaid_bills)
+        total_unpaid = self.converter.convert_totals(self.ledger.totals[BillLedger.UNPAID].get())
         
-        # Calculate monthly paid (simple filter for current month)
-        now = datetime.now()
-        current_month_paid = 0
-        for b in self.paid_bills:
-            try:
-                pd_str = b.get('paid_date', '')
-                if pd_str:
-                    pd = datetime.strptime(pd_str, "%Y-%m-%d")
-                    if pd.year == now.year and pd.month == now.month:
-                        current_month_paid += b['amount'] / (rates.get(b['currency'], 1.0) or 1.0)
-            except:
-                pass
+        # Monthly paid: running total for the current paid-date month
+        current_month_paid = self.converter.convert_totals(
+            self.ledger.paid_by_paid_month.get(datetime.now().strftime('%Y-%m')))
 
         # Recalculate strictly
         summary = {
@@ -6167,24 +9168,19 @@ class BillTrackerWindow(QMainWindow):
             QMessageBox.critical(self, STRINGS["title_error"], STRINGS["msg_report_failed"])
 
     def check_due_bills(self):
-        """Check for bills due today or tomorrow."""
+        """Remind about overdue bills and bills due within the reminder window (see ReminderScheduler)."""
         today = date.today()
-        due_bills = []
-        count = 0
         
-        # Load preference once outside the loop
+        # DataManager reuses the parsed config while the file is unchanged
         config = self.data_manager.load_config(self.session_pin)
-        days_advance = config.get('reminder_days', 1)
+        try:
+            days_advance = int(config.get('reminder_days', 1))
+        except (TypeError, ValueError):
+            days_advance = 1
         
-        for bill in self.unpaid_bills:
-            try:
-                due = datetime.strptime(bill['due_date'], '%Y-%m-%d').date()
-                delta = (due - today).days
-                
-                if delta <= days_advance:
-                    due_bills.append(bill)
-                    count += 1
-            except: pass
+        # Overdue plus due within the reminder window, from the due-date index
+        due_bills = self.ledger.due.between(None, today.toordinal() + days_advance)
+        count = len(due_bills)
             
         if count > 0:
             # Actionable Notification (v6.6.0)
@@ -6197,42 +9193,35 @@ class BillTrackerWindow(QMainWindow):
                 5000
             )
             
-            # Webhook Notification (Daily check)
+            # Webhook Notification (Daily, from the reminder time on)
             if config.get('webhooks_enabled', False) and config.get('webhook_url'):
-                current_time = datetime.now().strftime('%H:%M')
-                target_time = config.get('reminder_time', '09:00')
+                reminder_at = ReminderScheduler.reminder_moment(config, today)
                 
                 # Cooldown check: Only once today
-                today_str = date.today().strftime('%Y-%m-%d')
+                today_str = today.strftime('%Y-%m-%d')
                 last_sent = config.get('last_webhook_sent', '')
                 
-                if current_time >= target_time and last_sent != today_str:
+                if datetime.now() >= reminder_at and last_sent != today_str:
                     self.send_webhook_notification(count)
                     config['last_webhook_sent'] = today_str
                     self.data_manager.save_config(config, self.session_pin)
 
     def send_webhook_notification(self, count):
+        """Queue the daily reminder; WebhookQueue delivers (and retries) it in the background."""
         config = self.data_manager.load_config(self.session_pin)
         url = config.get('webhook_url')
         if not url: return
         
-        try:
-            import json
-            import urllib.request
-            msg = STRINGS["notification_msg"].format(count)
-            data = json.dumps({"content": f"📅 **BillTracker**: {msg}"}).encode('utf-8')
-            req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json', 'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req) as response: pass
-        except Exception as e:
-            print(f"Webhook delivery failed: {e}")
+        self.webhooks.set_target(url)
+        msg = STRINGS["notification_msg"].format(count)
+        self.webhooks.send(f"📅 **BillTracker**: {msg}")
 
     def get_budget_remaining(self):
         """Helper for Mini Mode to calculate remaining budget using in-memory data (v6.3.3)."""
         try:
             with self.data_lock:
                 current_budget = self.budget
-                rates = self.exchange_rates.copy()
-                unpaid = list(self.unpaid_bills)
+            unpaid_totals = self.ledger.totals[BillLedger.UNPAID].get()
             
             if current_budget <= 0:
                 return "--"
@@ -6247,14 +9236,13 @@ class BillTrackerWindow(QMainWindow):
             
             metadata = self.currencies.get(summary_curr, {'symbol': '$'})
             summary_symbol = metadata.get('symbol', '$') if isinstance(metadata, dict) else metadata
-            summary_rate = rates.get(summary_curr, 1.0)
+            summary_rate = self.converter.rate(summary_curr)
             
             if summary_rate <= 0:
                 summary_rate = 1.0
 
             # Calculate total unpaid in USD
-            total_unpaid_usd = sum(b['amount'] / (rates.get(b['currency'], 1.0) or 1.0) 
-                                  for b in unpaid)
+            total_unpaid_usd = self.converter.convert_totals(unpaid_totals)
             
             remaining_usd = current_budget - total_unpaid_usd
             remaining_converted = remaining_usd * summary_rate
@@ -6269,37 +9257,143 @@ class BillTrackerWindow(QMainWindow):
         self.mini_mode.show()
         self.hide()
     
+    def rates_age(self):
+        """Seconds since the rates in use were fetched, or None if unknown."""
+        fetched_at = (self.rates_cache or {}).get('fetched_at')
+        if not isinstance(fetched_at, (int, float)):
+            return None
+        return max(time.time() - fetched_at, 0)
+
+    def schedule_rate_refresh(self, retry=False):
+        """Arm rate_timer for when the cached rates expire (soon if they already have)."""
+        if self.is_locked:
+            return  # resume_after_unlock() re-arms it
+        config = self.data_manager.load_config(self.session_pin)
+        try:
+            ttl_minutes = int(config.get('rates_ttl_minutes', RATES_TTL_MINUTES))
+        except (TypeError, ValueError):
+            ttl_minutes = RATES_TTL_MINUTES
+        ttl = max(ttl_minutes, 1) * 60
+        age = self.rates_age()
+        if retry:
+            delay = min(ttl, RATES_RETRY_SECONDS)
+        elif age is None:
+            delay = 0
+        else:
+            delay = max(ttl - age, 0)
+        # Leave the UI a moment to become responsive before any network work
+        self.rate_timer.start(max(int(delay * 1000), 300))
+
     def refresh_rates(self):
-        self.api_thread = APIThread()
+        if self.api_thread is not None and self.api_thread.isRunning():
+            return
+        self.api_thread = APIThread(cached=self.rates_cache)
         self.api_thread.finished.connect(self.handle_api_result)
         self.api_thread.start()
-    
+
+    def apply_rates(self, data):
+        # USD base is pinned to 1.0 by the converter
+        self.converter.set_rates(data.get('conversion_rates', {}))
+        self.rates_cache = data
+        self.rates_error = None
+        self.update_rates_label()
+
+    def update_rates_label(self):
+        age = self.rates_age()
+        if age is None:
+            text = ""
+        elif age < 60:
+            text = STRINGS["rates_age_now"]
+        elif age < 3600:
+            text = STRINGS["rates_age_minutes"].format(int(age // 60))
+        elif age < 86400:
+            text = STRINGS["rates_age_hours"].format(int(age // 3600))
+        else:
+            text = STRINGS["rates_age_days"].format(int(age // 86400))
+        if self.rates_error:
+            text = f"{self.rates_error} ({text})" if text else self.rates_error
+        self.rates_status_label.setText(text)
+
     def handle_api_result(self, result):
         if result['status'] == 'success':
             data = result['data']
-            api_rates = data.get('conversion_rates', {})
-            updated_rates = {}
-            for curr_display in self.currencies:
-                meta = self.currencies.get(curr_display)
-                code = meta['code']
-                if code in api_rates:
-                    updated_rates[curr_display] = api_rates[code]
-            
-            # Ensure USD base exists
-            for k, v in self.currencies.items():
-                if v['code'] == 'USD':
-                    updated_rates[k] = 1.0
-            
-            with self.data_lock: # Thread Safety: Update shared state
-                self.exchange_rates = updated_rates
-                
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.rates_status_label.setText(STRINGS["rates_updated_at"].format(now))
+            data.pop('not_modified', None)
+            self.apply_rates(data)
             self.data_manager.save_rates_cache(data)
+            self.schedule_rate_refresh()
         else:
-            self.rates_status_label.setText(result.get('message', STRINGS["api_error"]))
+            self.rates_error = result.get('message', STRINGS["api_error"])
+            self.update_rates_label()
+            self.schedule_rate_refresh(retry=True)
         self.update_display()
     
+    def tab_visible(self, tab):
+        """Visibility check for the refresh scheduler."""
+        return lambda: self.tabs.currentWidget() is tab
+
+    def add_deferred_tab(self, builder, icon, title):
+        """Add an empty placeholder tab that builder(placeholder) fills on first activation."""
+        placeholder = QWidget()
+        index = self.tabs.addTab(placeholder, get_icon(icon), title)
+        self._deferred_tabs[index] = (placeholder, builder)
+
+    def ensure_tab(self, index):
+        """Build a deferred tab if it is still a placeholder. Returns True if it was built now."""
+        entry = self._deferred_tabs.pop(index, None)
+        if entry is None:
+            return False
+        placeholder, builder = entry
+        t0 = time.perf_counter()
+        builder(placeholder)
+        startup_log.info(f"Tab {index} built on first use in {(time.perf_counter() - t0) * 1000:.0f} ms")
+        return True
+
+    def _host_tab(self, placeholder, widget):
+        layout = QVBoxLayout(placeholder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(widget)
+
+    def build_chart_tab(self, placeholder):
+        self.chart_tab = placeholder
+        self.setup_chart_tab()
+        self.refresh_scheduler.register(RefreshScheduler.CHARTS, self.update_charts, self.tab_visible(placeholder))
+        self.refresh_scheduler.mark(RefreshScheduler.CHARTS)  # First paint
+
+    def build_calendar_tab(self, placeholder):
+        self.calendar_tab = CalendarTab(self)
+        self._host_tab(placeholder, self.calendar_tab)
+        self.refresh_scheduler.register(RefreshScheduler.CALENDAR, self.calendar_tab.refresh_data,
+                                        self.tab_visible(placeholder))
+        self.refresh_scheduler.mark(RefreshScheduler.CALENDAR)
+
+    def build_subscription_tab(self, placeholder):
+        self.subscription_tab = SubscriptionTab(self)
+        self._apply_tab_currency(self.subscription_tab.sub_currency_combo, 'subscription_currency')
+        self._host_tab(placeholder, self.subscription_tab)
+        self.refresh_scheduler.register(RefreshScheduler.SUBSCRIPTIONS, self.subscription_tab.refresh_data,
+                                        self.tab_visible(placeholder))
+        self.refresh_scheduler.mark(RefreshScheduler.SUBSCRIPTIONS)
+
+    def build_savings_tab(self, placeholder):
+        self.savings_tab = SavingsTab(self)
+        self._apply_tab_currency(self.savings_tab.savings_currency_combo, 'savings_currency')
+        self._host_tab(placeholder, self.savings_tab)
+        self.refresh_scheduler.register(RefreshScheduler.SAVINGS, self.savings_tab.refresh_data,
+                                        self.tab_visible(placeholder))
+        self.refresh_scheduler.mark(RefreshScheduler.SAVINGS)
+
+    def build_about_tab(self, placeholder):
+        self.about_tab = placeholder
+        self.setup_about_tab()
+
+    def _apply_tab_currency(self, combo, key):
+        """Select the saved currency on a tab built after restore_currency_preferences."""
+        saved = self._tab_currency.get(key)
+        if saved:
+            combo.blockSignals(True)
+            combo.setCurrentText(saved)
+            combo.blockSignals(False)
+
     def setup_chart_tab(self):
         layout = QVBoxLayout()
         self.chart_tab.setLayout(layout)
@@ -6403,22 +9497,17 @@ class BillTrackerWindow(QMainWindow):
 
     def _on_tab_changed(self, index):
         """Handle tab changes for lazy loading content."""
-        # 3: Trends, 4: Calendar, 5: Subscriptions, 6: About
-        if index == 3:
-            # Refresh Trends
-            self.update_charts()
-        elif index == 4:
-            # Refresh Calendar
-            if hasattr(self, 'calendar_tab'):
-                self.calendar_tab.refresh_data()
-        elif index == 5:
-            # Refresh Subscriptions
-            if hasattr(self, 'subscription_tab'):
-                self.subscription_tab.refresh_data()
-        elif index == 6:
-            # Refresh Savings
-            if hasattr(self, 'savings_tab'):
-                self.savings_tab.refresh_data()
+        # 1: Unpaid, 2: Paid, 3: Trends, 4: Calendar, 5: Subscriptions, 6: Savings, 7: About
+        # Tabs only redraw if something they show changed while hidden
+        views = {1: RefreshScheduler.UNPAID, 2: RefreshScheduler.PAID, 3: RefreshScheduler.CHARTS,
+                 4: RefreshScheduler.CALENDAR, 5: RefreshScheduler.SUBSCRIPTIONS, 6: RefreshScheduler.SAVINGS}
+        self.ensure_tab(index)  # Deferred tabs are built on first activation
+        if index == 2 and self.paid_index:
+            # Paid history: decrypt cold years on first visit
+            self.ensure_paid_history()
+            self.update_display(RefreshScheduler.TOTALS, RefreshScheduler.PAID, RefreshScheduler.CHARTS)
+        if index in views:
+            self.refresh_scheduler.show(views[index])
         elif index == 7:
             # Refresh About
             self._load_readme()
@@ -6449,8 +9538,7 @@ class BillTrackerWindow(QMainWindow):
             return
             
         # Select README based on language
-        # We check if the app title in the current STRINGS matches the Georgian one
-        is_georgian = STRINGS.get("app_title") == TRANSLATIONS["Georgian"].get("app_title")
+        is_georgian = STRINGS.language == 'Georgian'
         readme_filename = 'README_GE.md' if is_georgian else 'README.md'
             
         readme_path = resource_path(readme_filename)
@@ -6481,19 +9569,17 @@ class BillTrackerWindow(QMainWindow):
 
     def handle_calendar_click(self, date):
         dt = date.toString("yyyy-MM-dd")
-        with self.data_lock:
-            rates = self.exchange_rates.copy()
-            summary_curr = self.summary_currency_combo.currentText()
-            metadata = self.currencies.get(summary_curr, {'symbol': '$'})
-            summary_symbol = metadata.get('symbol', '$') if isinstance(metadata, dict) else summary_symbol
-            summary_rate = rates.get(summary_curr, 1)
+        summary_curr = self.summary_currency_combo.currentText()
+        metadata = self.currencies.get(summary_curr, {'symbol': '$'})
+        summary_symbol = metadata.get('symbol', '$') if isinstance(metadata, dict) else metadata
 
-        bills_on_day = [b for b in self.unpaid_bills if b.get('due_date') == dt]
+        bills_on_day = self.ledger.due.on(CalendarIndex.ordinal(date))
         if bills_on_day:
+            converted = self.converter.convert_many([b['amount'] for b in bills_on_day],
+                                                    [self.converter.id_of(b['currency']) for b in bills_on_day],
+                                                    summary_curr)
             info_lines = []
-            for b in bills_on_day:
-                b_rate = rates.get(b['currency'], 1.0) or 1.0
-                amt_converted = (b['amount'] / b_rate) * summary_rate
+            for b, amt_converted in zip(bills_on_day, converted):
                 info_lines.append(f"• {b['name']}: {summary_symbol}{amt_converted:,.2f}")
             
             self.calendar_label.setText(f"<b>Bills due on {dt}:</b><br/>" + "<br/>".join(info_lines))
@@ -6513,63 +9599,47 @@ class BillTrackerWindow(QMainWindow):
             return
             
         with self.data_lock: # Hardened: Read state snapshot for consistent chart rendering
-            rates = self.exchange_rates.copy()
             current_budget = self.budget
             
         # 1. Budget vs Expenses
-        total_unpaid = 0.0
         budget_curr = self.budget_currency_combo.currentText()
-        target_rate = rates.get(budget_curr, 1) or 1
-        
-        for bill in self.unpaid_bills:
-            b_rate = rates.get(bill['currency'], 1.0) or 1.0 # Hardened Fallback
-            total_unpaid += (bill['amount'] / b_rate) * target_rate
+        converter = self.converter
+        total_unpaid = converter.convert_totals(self.ledger.totals[BillLedger.UNPAID].get(), budget_curr)
             
         self.budget_chart.set_data({STRINGS["label_remaining"]: max(0, current_budget), STRINGS["label_unpaid_bills_chart"]: total_unpaid})
         
         # 2. Expenses by Category (Unpaid)
         cat_data = {}
-        for bill in self.unpaid_bills:
-            cat_canonical = bill.get('category', 'Other')
+        for cat_canonical, amt in converter.convert_groups(self.ledger.unpaid_by_category.groups(), budget_curr).items():
             cat_display = get_display_category(cat_canonical)
-            b_rate = rates.get(bill['currency'], 1.0) or 1.0 # Hardened Fallback
-            amt = (bill['amount'] / b_rate) * target_rate
             cat_data[cat_display] = cat_data.get(cat_display, 0) + amt
             
         self.category_chart.set_data(cat_data)
         
-        # 3. Trends (Paid History by Month)
-        trends_data = {}
-        for bill in self.paid_bills:
-            d = bill.get('due_date', '')
-            if len(d) >= 7:
-                key = d[:7] # YYYY-MM
-                b_rate = rates.get(bill['currency'], 1.0) or 1.0 # Hardened Fallback
-                amt = (bill['amount'] / b_rate) * target_rate
-                trends_data[key] = trends_data.get(key, 0) + amt
-        
+        # 3. Trends (Paid History by day/week/month/year)
+        # Cold years are folded in from the segment summaries (set_paid_index)
         if hasattr(self, 'trends_chart'):
-            self.trends_chart.set_data(trends_data)
-        
-        # Update Calendar
-        if hasattr(self, 'calendar_tab'):
-            self.calendar_tab.refresh_data()
+            self.trends_chart.set_series(self.ledger.paid_series,
+                                         lambda groups: converter.convert_groups(groups, budget_curr))
 
 
 
 
 
 
-    def update_display(self):
-        self.update_charts()
-        
+    def update_display(self, *views):
+        """Mark views dirty (all if none given); they redraw once, in the next batch."""
+        self.refresh_scheduler.mark(*views)
+
+    def update_totals(self):
+        """Budget, summary and savings figures on the dashboard and table headers."""
         with self.data_lock: # Hardened: Consistent data read
-            rates = self.exchange_rates.copy()
             current_budget = self.budget
+        converter = self.converter
             
         # Update budget display
         curr = self.budget_currency_combo.currentText()
-        rate = rates.get(curr, 1)
+        rate = converter.rate(curr)
         if rate > 0:
             self.budget_input.setText(f"{current_budget * rate:,.2f}")
         
@@ -6577,13 +9647,11 @@ class BillTrackerWindow(QMainWindow):
         summary_curr = self.summary_currency_combo.currentText()
         meta = self.currencies.get(summary_curr, {'symbol': '$'})
         summary_symbol = meta.get('symbol', '$')
-        summary_rate = rates.get(summary_curr, 1)
+        summary_rate = converter.rate(summary_curr)
         
         if summary_rate > 0:
-            total_unpaid_usd = 0
-            for b in self.unpaid_bills:
-                b_rate = self.get_exchange_rate(b.get('currency', 'USD'))
-                total_unpaid_usd += b['amount'] / (b_rate or 1.0)
+            # Running totals: one conversion per currency, not per bill
+            total_unpaid_usd = converter.convert_totals(self.ledger.totals[BillLedger.UNPAID].get())
 
             remaining_usd = current_budget - total_unpaid_usd
             
@@ -6603,12 +9671,8 @@ class BillTrackerWindow(QMainWindow):
             
             # Update Dashboard Savings Progress (v6.7.0)
             if hasattr(self, 'dash_savings_progress'):
-                total_sav_usd = 0.0
-                total_tar_usd = 0.0
-                for g in self.savings_goals:
-                    g_rate = self.get_exchange_rate(g.get('currency', 'USD'))
-                    total_sav_usd += float(g['current']) / (g_rate or 1.0)
-                    total_tar_usd += float(g['target']) / (g_rate or 1.0)
+                total_sav_usd = converter.convert_totals(self.savings_totals.get('current'))
+                total_tar_usd = converter.convert_totals(self.savings_totals.get('target'))
                 
                 if total_tar_usd > 0:
                     percent = min(100, int((total_sav_usd / total_tar_usd) * 100))
@@ -6624,106 +9688,44 @@ class BillTrackerWindow(QMainWindow):
         self.unpaid_summary_label.setText(f"{STRINGS['total_unpaid_label']}: {summary_symbol}{total_unpaid_usd * summary_rate:,.2f}")
         
         # Calculate Total Paid
-        total_paid_usd = 0
-        for b in self.paid_bills:
-            b_rate = self.get_exchange_rate(b.get('currency', 'USD'))
-            total_paid_usd += b['amount'] / (b_rate or 1.0)
+        total_paid_usd = converter.convert_totals(CurrencyConverter.merge(
+            self.ledger.totals[BillLedger.PAID].get(),
+            *(summary.get('totals', {}) for summary in (self.paid_index or {}).values())))
             
         self.paid_summary_label.setText(f"{STRINGS['label_total_paid']}: {summary_symbol}{total_paid_usd * summary_rate:,.2f}")
-        
-        # Update Tables
-        self.update_unpaid_table_view()
-        self.update_paid_table_view()
-        
-        # v6.3.1: Ensure Subscription Tab stays in sync
-        if hasattr(self, 'subscription_tab'):
-            self.subscription_tab.refresh_data()
 
     def update_unpaid_table_view(self):
-        """Update only the unpaid bills table (optimized)."""
-        self.unpaid_table.setRowCount(0)
-        
-        # Filter Logic
+        """Apply the category filter and re-format the unpaid rows.
+
+        Row inserts/removes reach the view through the ledger, so this no
+        longer rebuilds the table.
+        """
         filter_cat = getattr(self, 'category_filter_combo', None)
         target_cat = filter_cat.currentText() if filter_cat else STRINGS["item_all_categories"]
-        target_canonical = get_canonical_category(target_cat)
-        
-        filtered_bills = []
-        for bill in self.unpaid_bills:
-            if target_cat == STRINGS["item_all_categories"] or bill.get('category') == target_canonical:
-                filtered_bills.append(bill)
-        
-        self.unpaid_table.setRowCount(len(filtered_bills))
-        
-        for i, bill in enumerate(filtered_bills):
-            metadata = self.currencies.get(bill['currency'], {'symbol': '$'})
-            symbol = metadata.get('symbol', '$') if isinstance(metadata, dict) else metadata
-            
-            # Name
-            name_item = QTableWidgetItem(bill['name'])
-            name_item.setData(Qt.ItemDataRole.UserRole, bill)
-            # Amount
-            amount_item = QTableWidgetItem(f"{symbol}{bill['amount']:,.2f}")
-            # Category
-            cat_display = get_display_category(bill.get('category', 'Other'))
-            cat_item = QTableWidgetItem(cat_display)
-            # Due Date
-            due_date = bill.get('due_date', STRINGS["no_date_label"])
-            date_item = QTableWidgetItem(due_date)
-            # Frequency
-            freq_display = get_display_frequency(bill.get('repeat_freq', 'No Repeat'))
-            freq_item = QTableWidgetItem(freq_display)
-            
-            # Check overdue
-            try:
-                due_raw = bill.get('due_date', '')
-                if safe_parse_date(due_raw, None):
-                    due_dt = datetime.strptime(due_raw, '%Y-%m-%d').date()
-                    if due_dt < date.today():
-                        for item in [name_item, amount_item, cat_item, date_item, freq_item]:
-                            item.setForeground(QColor('#ff4d4d')) # Red text
-            except Exception as e:
-                logging.error(f"Error checking overdue status for {bill.get('name')}: {e}")
-                
-            self.unpaid_table.setItem(i, 0, name_item)
-            self.unpaid_table.setItem(i, 1, amount_item)
-            self.unpaid_table.setItem(i, 2, cat_item)
-            self.unpaid_table.setItem(i, 3, date_item)
-            self.unpaid_table.setItem(i, 4, freq_item)
+        if target_cat == STRINGS["item_all_categories"]:
+            self.unpaid_proxy.set_category(None)
+        else:
+            self.unpaid_proxy.set_category(get_canonical_category(target_cat))
+        self.unpaid_model.refresh()
 
     def update_paid_table_view(self):
-        """Update the paid bills history table."""
-        self.paid_table.setRowCount(0)
-        self.paid_table.setRowCount(len(self.paid_bills))
-        
-        for i, bill in enumerate(self.paid_bills):
-            metadata = self.currencies.get(bill['currency'], {'symbol': '$'})
-            symbol = metadata.get('symbol', '$') if isinstance(metadata, dict) else metadata
-            
-            name_item = QTableWidgetItem(bill['name'])
-            name_item.setData(Qt.ItemDataRole.UserRole, bill)
-            self.paid_table.setItem(i, 0, name_item)
-            self.paid_table.setItem(i, 1, QTableWidgetItem(f"{symbol}{bill['amount']:,.2f}"))
-            self.paid_table.setItem(i, 2, QTableWidgetItem(bill.get('category', 'Other')))
-            self.paid_table.setItem(i, 3, QTableWidgetItem(bill.get('due_date', '-')))
-            self.paid_table.setItem(i, 4, QTableWidgetItem(bill.get('repeat_freq', '-')))
+        """Re-format the visible paid history rows."""
+        self.paid_model.refresh()
 
     def show_unpaid_context_menu(self, position):
         """Show context menu for unpaid bills table."""
-        selected_items = self.unpaid_table.selectedItems()
-        selected_rows = sorted(list(set(item.row() for item in selected_items)), reverse=True)
+        selected_rows = sorted(self.unpaid_table.selectionModel().selectedRows(),
+                               key=lambda index: index.row(), reverse=True)
         
         if not selected_rows:
             return
             
         # Get bills for all selected rows
         bills_to_process = []
-        for row_idx in selected_rows:
-            item = self.unpaid_table.item(row_idx, 0)
-            if item:
-                bill_data = item.data(Qt.ItemDataRole.UserRole)
-                if bill_data:
-                    bills_to_process.append(bill_data)
+        for index in selected_rows:
+            bill_data = self.ledger.get(index.data(BillTableModel.IdRole))
+            if bill_data:
+                bills_to_process.append(bill_data)
 
         if not bills_to_process:
             return
@@ -6762,9 +9764,7 @@ class BillTrackerWindow(QMainWindow):
                                             f"Delete {len(bills_to_process)} selected bills?",
                                             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
                 if confirm == QMessageBox.StandardButton.Yes:
-                    for b in bills_to_process:
-                        if b in self.unpaid_bills:
-                            self.unpaid_bills.remove(b)
+                    self.ledger.remove(b['id'] for b in bills_to_process)
                     self.save_data()
                     self.update_display()
             else:
@@ -6772,19 +9772,17 @@ class BillTrackerWindow(QMainWindow):
 
     def show_paid_context_menu(self, position):
         """Show context menu for paid bills table."""
-        selected_items = self.paid_table.selectedItems()
-        selected_rows = sorted(list(set(item.row() for item in selected_items)), reverse=True)
+        selected_rows = sorted(self.paid_table.selectionModel().selectedRows(),
+                               key=lambda index: index.row(), reverse=True)
         
         if not selected_rows:
             return
             
         bills_to_process = []
-        for row_idx in selected_rows:
-            item = self.paid_table.item(row_idx, 0)
-            if item:
-                bill_data = item.data(Qt.ItemDataRole.UserRole)
-                if bill_data:
-                    bills_to_process.append((row_idx, bill_data))
+        for index in selected_rows:
+            bill_data = self.ledger.get(index.data(BillTableModel.IdRole))
+            if bill_data:
+                bills_to_process.append((index.row(), bill_data))
 
         if not bills_to_process:
             return
@@ -6800,12 +9798,8 @@ class BillTrackerWindow(QMainWindow):
         action = menu.exec(self.paid_table.viewport().mapToGlobal(position))
         
         if action == restore_action:
-            for row_idx, bill in bills_to_process:
-                # Need to find the actual index in paid_bills because table might be filtered or sorted differently?
-                # Actually paid_table usually matches paid_bills 1:1 currently.
-                if bill in self.paid_bills:
-                    self.paid_bills.remove(bill)
-                    self.unpaid_bills.append(bill)
+            # Rows carry bill ids, so this is independent of table order
+            self.ledger.move([bill['id'] for row_idx, bill in bills_to_process], BillLedger.UNPAID)
             self.save_data()
             self.update_display()
         elif action == delete_action:
@@ -6814,9 +9808,7 @@ class BillTrackerWindow(QMainWindow):
                                        msg,
                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             if reply == QMessageBox.StandardButton.Yes:
-                for row_idx, bill in bills_to_process:
-                    if bill in self.paid_bills:
-                        self.paid_bills.remove(bill)
+                self.ledger.remove(bill['id'] for row_idx, bill in bills_to_process)
                 self.save_data()
                 self.update_display()
 
@@ -6845,13 +9837,10 @@ class BillTrackerWindow(QMainWindow):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             updated_data = dialog.get_data()
             if updated_data:
-                # Find and update the bill
-                for i, b in enumerate(self.unpaid_bills):
-                    if b == bill:
-                        self.unpaid_bills[i] = updated_data
-                        self.save_data()
-                        self.update_display()
-                        break
+                # Update in place so id, created_at etc. survive the edit
+                if self.ledger.update(bill.get('id'), updated_data) is not None:
+                    self.save_data()
+                    self.update_display()
     
     def delete_bill(self, bill):
         """Delete a bill with confirmation."""
@@ -6859,29 +9848,22 @@ class BillTrackerWindow(QMainWindow):
                                    STRINGS["confirm_delete_msg"].format(bill['name']),
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            if bill in self.unpaid_bills:
-                self.unpaid_bills.remove(bill)
-            elif bill in self.paid_bills:
-                self.paid_bills.remove(bill)
+            self.ledger.remove([bill.get('id')])
             self.save_data()
             self.update_display()
     
+    # v6.7.0: Sorting is view-only (BillSortFilterProxy); the stored order is untouched
     def sort_by_name(self):
-        self.unpaid_bills.sort(key=lambda b: b['name'].lower())
-        self.update_display()
+        self.unpaid_table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
     
     def sort_by_date(self):
-        self.unpaid_bills.sort(key=lambda b: safe_parse_date(b.get('due_date')))
-        self.update_display()
+        self.unpaid_table.sortByColumn(3, Qt.SortOrder.AscendingOrder)
     
     def sort_by_amount(self):
-        with self.data_lock:
-            rates = self.exchange_rates.copy()
-        self.unpaid_bills.sort(key=lambda b: b['amount'] / (rates.get(b['currency'], 1.0) or 1.0), reverse=True)
-        self.update_display()
+        self.unpaid_table.sortByColumn(1, Qt.SortOrder.DescendingOrder)
     
     def open_converter(self):
-        dialog = ConverterWindow(self, self.currencies, self.exchange_rates)
+        dialog = ConverterWindow(self, self.currencies, self.converter)
         dialog.exec()
 
     def import_bank_statement(self):
@@ -6890,7 +9872,7 @@ class BillTrackerWindow(QMainWindow):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             new_bills = dialog.get_imported_bills()
             if new_bills:
-                self.unpaid_bills.extend(new_bills)
+                self.ledger.extend(new_bills)
                 self.save_data()
                 self.update_display()
                 QMessageBox.information(
@@ -6912,6 +9894,15 @@ class BillTrackerWindow(QMainWindow):
                 
                 # Restart auto-lock timer with new settings
                 self.check_idle_timeout()
+                
+                # Reminder days/time may have changed
+                if hasattr(self, 'reminders'):
+                    self.reminders.schedule()
+                # So may the rates TTL
+                if hasattr(self, 'rate_timer'):
+                    self.schedule_rate_refresh()
+                if hasattr(self, 'webhooks'):
+                    self.webhooks.set_target(config.get('webhook_url') if config.get('webhooks_enabled', False) else None)
         except Exception as e:
              logging.exception("Critical error opening settings")
              QMessageBox.critical(self, STRINGS["title_error"], f"Error opening settings: {e}")
@@ -6921,8 +9912,8 @@ class BillTrackerWindow(QMainWindow):
                                    STRINGS["confirm_clear_data_msg"],
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            self.unpaid_bills = []
-            self.paid_bills = []
+            self.ledger.reset([], [])
+            self.set_paid_index(None)
             self.budget = 0.0
             self.save_data()
             self.update_display()
@@ -6972,6 +9963,15 @@ class BillTrackerWindow(QMainWindow):
 
         self.is_locked = True
         self.hide()  # Hide main window
+        # Write queued changes while the key is still cached, stop everything
+        # that could re-derive it, then drop derived keys until unlock
+        if hasattr(self, 'save_scheduler'):
+            self.save_scheduler.hold()
+        if hasattr(self, 'reminders'):
+            self.reminders.pause()
+        if hasattr(self, 'rate_timer'):
+            self.rate_timer.stop()
+        self.data_manager.seal()
         
         if silent:
             return
@@ -7022,10 +10022,14 @@ class BillTrackerWindow(QMainWindow):
                     
                     if is_valid:
                         self.reset_pin_attempts()
-                        
-                        # If in Login Mode, set session pin and reload full config/data
-                        if not self.session_pin:
+                        login_mode = not self.session_pin
+                        if login_mode:
                             self.session_pin = entered_pin
+                        self.is_locked = False
+                        self.resume_after_unlock()  # Releases the key, so it comes before any reload
+                        
+                        # If in Login Mode, reload full config/data with the session pin
+                        if login_mode:
                             # Reload config with PIN
                             config = self.data_manager.load_config(self.session_pin)
                             # Update Data Path if custom
@@ -7035,7 +10039,6 @@ class BillTrackerWindow(QMainWindow):
                             self.load_data()
                             self.update_display()
                         
-                        self.is_locked = False
                         self.show_window() # Correctly restore window state
                         self.last_activity_time = datetime.now()  # Reset idle timer
                         break
@@ -7065,9 +10068,20 @@ class BillTrackerWindow(QMainWindow):
         finally:
             self.is_prompting = False
 
+    def resume_after_unlock(self):
+        """Restart the savers and timers lock_app stopped."""
+        self.data_manager.unseal()
+        if hasattr(self, 'save_scheduler'):
+            self.save_scheduler.release()
+        if hasattr(self, 'reminders'):
+            self.reminders.resume()
+        if hasattr(self, 'rate_timer'):
+            self.schedule_rate_refresh()
+
     def unlock_app(self):
         """Unlock the application."""
         self.is_locked = False
+        self.resume_after_unlock()
         self.show_window()
         self.last_activity_time = datetime.now()
     
@@ -7111,6 +10125,7 @@ class BillTrackerWindow(QMainWindow):
         
         # If already marked for real close (from quit_app), just close
         if self.real_close:
+            self.flush_saves()
             event.accept()
             return
         
@@ -7140,6 +10155,10 @@ class BillTrackerWindow(QMainWindow):
     def quit_app(self):
         """Properly quit the application."""
         self.real_close = True
+        self.flush_saves()
+        self.webhooks.stop()  # Undelivered reminders stay in webhook_queue.json
+        # Fold the journal into bill_data.json so backups and sync copies are current
+        self.data_manager.compact(self.session_pin, wait=True)
         self.tray_icon.hide()  # Hide tray icon before quitting
         QApplication.quit()  # Properly quit the application
 
@@ -7153,12 +10172,12 @@ class BillTrackerWindow(QMainWindow):
         self.setWindowState(self.windowState() & ~Qt.WindowState.WindowMinimized | Qt.WindowState.WindowActive)
         self.activateWindow()
 
-    def show_bill_details(self, item, is_paid=False):
+    def show_bill_details(self, index, is_paid=False):
         """Show details dialog for double-clicked bill."""
-        if not item: return
-        bill = item.data(Qt.ItemDataRole.UserRole)
-        # Verify it's a dict (bill object) and not just a string/int
-        if not isinstance(bill, dict): return
+        # Details open from the name column only, as before
+        if not index.isValid() or index.column() != 0: return
+        bill = self.ledger.get(index.data(BillTableModel.IdRole))
+        if bill is None: return
         
         dialog = BillDetailsDialog(self, bill, self.currencies, is_paid)
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -7179,6 +10198,7 @@ class BillTrackerWindow(QMainWindow):
 
     def open_search(self):
         """Open the global search dialog."""
+        self.ensure_paid_history()
         searchDialog = SearchDialog(self, self.unpaid_bills, self.paid_bills, self.currencies)
         searchDialog.exec()
 
@@ -7212,6 +10232,7 @@ class BillTrackerWindow(QMainWindow):
 
 class SingleInstanceChecker:
     def __init__(self, key):
+        from PyQt6.QtNetwork import QLocalServer, QLocalSocket
         self.key = key
         self.server = QLocalServer()
         self.socket = QLocalSocket()
@@ -7227,7 +10248,7 @@ class SingleInstanceChecker:
 
     def start_server(self, window_callback):
         # Remove any existing server file if it exists
-        QLocalServer.removeServer(self.key)
+        type(self.server).removeServer(self.key)
         self.server.listen(self.key)
         self.server.newConnection.connect(lambda: self._handle_new_connection(window_callback))
 
@@ -7296,6 +10317,8 @@ if __name__ == "__main__":
     security_file = os.path.join(config_dir, 'security.json')
     
     # Use DataManager to load security (handles multiple layers of encryption/obfuscation)
+    # v6.7.0: This instance is reused for the PIN check and handed to the window
+    temp_dm = None
     try:
         temp_dm = DataManager(config_dir)
         # DataManager.init automatically loads security.json (migrating/decrypting if needed)
@@ -7347,7 +10370,8 @@ if __name__ == "__main__":
     if pin_enabled and pin_hash:
         # Load lockout state
         config_dir = os.path.join(os.path.expanduser('~'), '.bill_tracker')
-        temp_dm = DataManager(config_dir)
+        if temp_dm is None:
+            temp_dm = DataManager(config_dir)
         failed_attempts, lockout_until = temp_dm.load_lockout_state()
         
         while True:
@@ -7408,8 +10432,29 @@ if __name__ == "__main__":
 
     app.setWindowIcon(QIcon(resource_path('calc.ico')))
     
+    # v6.7.0: Key derivation, decryption/parsing and the rates cache run on worker
+    # threads from here on; the GUI thread shows the splash and builds the window
+    startup = StartupPipeline(temp_dm or DataManager(config_dir), session_pin).start()
+    
+    splash = None
+    if not start_minimized:
+        splash = SplashScreen(ThemeManager().accent_color)
+        splash.show()
+        app.processEvents()
+        # Report stages as they actually finish; the window needs the config first
+        for value, stage, message in ((25, 'key', "msg_init_security"),
+                                      (40, 'config', "msg_loading_config")):
+            splash.update_progress(value - 15, STRINGS[message])
+            startup.wait(stage, app.processEvents)
+            splash.update_progress(value, f"{STRINGS[message]} {startup.timings[stage]:.0f} ms")
+        splash.update_progress(50, STRINGS["msg_prep_interface"])
+    
     # Initialize Main Window (session_pin might be None if minimized)
-    window = BillTrackerWindow(session_pin)
+    # Widgets are built while the data file is still being decrypted
+    ui_t0 = time.perf_counter()
+    window = BillTrackerWindow(session_pin, startup=startup)
+    ui_ms = (time.perf_counter() - ui_t0) * 1000
+    startup_log.info(f"Startup stages: {startup.summary()}, window {ui_ms:.0f} ms")
     
     if start_minimized:
         # Skip Splash, start server, go to tray
@@ -7429,33 +10474,12 @@ if __name__ == "__main__":
         window.lock_app(silent=True)
         
     else:
-        # Standard Splash Screen Launch
-        splash = SplashScreen(ThemeManager().accent_color)
-        splash.show()
-        app.processEvents()
-        
-        # Simulate initialization with progress updates
-        splash.update_progress(10, STRINGS["msg_loading_config"])
-        QTimer.singleShot(100, lambda: None)  # Small delay for visual effect
-        app.processEvents()
-        
-        splash.update_progress(30, STRINGS["msg_init_security"])
-        QTimer.singleShot(100, lambda: None)
-        app.processEvents()
-        
-        splash.update_progress(50, STRINGS["msg_loading_rates"])
-        QTimer.singleShot(100, lambda: None)
-        app.processEvents()
-        
-        splash.update_progress(70, STRINGS["msg_prep_interface"])
-        checker.start_server(window.show_window)
-        app.processEvents()
-        
         splash.update_progress(90, STRINGS["msg_finalizing"])
-        QTimer.singleShot(100, lambda: None)
-        app.processEvents()
+        checker.start_server(window.show_window)
         
-        splash.update_progress(100, "Ready!")
+        total_ms = (time.perf_counter() - STARTUP_T0) * 1000
+        splash.update_progress(100, STRINGS["msg_startup_timings"].format(
+            total=f"{total_ms:.0f}", stages=f"{startup.summary()}, UI {ui_ms:.0f} ms"))
         
         # Close splash and show main window
         QTimer.singleShot(500, splash.close)
@@ -0,0 +1,93 @@
+"""
+Save-latency benchmark for DataManager.
+
+Compares save_data/load_config with the session key cache and the config
+cache disabled (PBKDF2 for every encryption, backup MAC and config read, the
+pre-v6.7.0 behaviour) against the cached path.
+
+Usage: python benchmark_save.py [--bills N] [--rounds N] [--backend json|sqlite]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import Billtracker_qt as bt
+
+
+def make_data(count):
+    start = date.today()
+    bills = []
+    for i in range(count):
+        bills.append({
+            'name': f'Bill {i}',
+            'amount': float(10 + i % 90),
+            'currency': 'USD',
+            'due_date': (start + timedelta(days=i % 60)).strftime('%Y-%m-%d'),
+            'category': 'Utilities',
+        })
+    return {'unpaid_bills': bills, 'paid_bills': [], 'savings_goals': [],
+            'budget': 1000.0, 'budget_currency': 'USD'}
+
+
+def run(dm, data, pin, rounds, cached):
+    timings = []
+    for i in range(rounds):
+        data['budget'] = 1000.0 + i
+        t0 = time.perf_counter()
+        dm.save_data(data, pin)
+        if not cached:
+            dm._config_cache = None
+        dm.load_config(pin)  # check_due_bills does this on every reminder
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+
+def report(label, timings):
+    timings = sorted(timings)
+    mean = sum(timings) / len(timings)
+    print(f"{label:<10} mean {mean * 1000:8.2f} ms   "
+          f"p50 {timings[len(timings) // 2] * 1000:8.2f} ms   "
+          f"max {timings[-1] * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bills', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--backend', choices=('json', 'sqlite'), default='json')
+    parser.add_argument('--pin', default='1234')
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix='billtracker_bench_')
+    try:
+        dm = bt.DataManager(tmp)
+        dm.storage_backend = args.backend
+        data = make_data(args.bills)
+        dm.save_config({'reminder_days': 1}, args.pin)  # encrypted, so reads need the key
+        dm.save_data(data, args.pin)  # warm-up / initial write
+
+        print(f"{args.bills} bills, {args.rounds} rounds, backend={args.backend}")
+
+        # Before: every key lookup (Fernet and backup MAC) derives again, and
+        # every config read decrypts the file
+        dm._get_key = dm._derive_key
+        report("uncached", run(dm, data, args.pin, args.rounds, cached=False))
+
+        del dm._get_key
+        dm.clear_key_cache()
+        report("cached", run(dm, data, args.pin, args.rounds, cached=True))
+    finally:
+        if dm._sqlite_store is not None:
+            dm._sqlite_store.close()
+        shutil.rmtree(tmp, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
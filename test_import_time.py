@@ -0,0 +1,108 @@
+"""
+Import-time regression test for Billtracker_qt.
+
+Runs `python -X importtime -c "import Billtracker_qt"` in a fresh interpreter
+and fails if the cumulative import time exceeds the budget or if a module
+that is supposed to load lazily (v6.7.0) shows up at import. The fastest of
+a few runs is used, so a single noisy run does not fail it.
+
+Run with pytest, or directly for a report of the slowest modules:
+    python test_import_time.py [--budget MS] [--top N]
+The budget defaults to 350 ms (BILLTRACKER_IMPORT_BUDGET_MS overrides it).
+The script exits non-zero when a check fails.
+"""
+import argparse
+import functools
+import os
+import subprocess
+import sys
+
+BUDGET_MS = float(os.environ.get('BILLTRACKER_IMPORT_BUDGET_MS', 350))
+RUNS = 3
+
+# Imported on first use only (PDF export, single-instance check, key
+# derivation, bulk conversion)
+LAZY_MODULES = (
+    'reportlab',
+    'PyQt6.QtNetwork',
+    'PyQt6.QtPrintSupport',
+    'cryptography.hazmat.primitives.kdf.pbkdf2',
+    'numpy',
+)
+
+
+def measure():
+    """{module: (self us, cumulative us)} for one fresh import."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # Measure a warm start from cached bytecode, as installed copies run
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import Billtracker_qt'],
+        cwd=here, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|', 2)
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def total_ms(modules):
+    return modules.get('Billtracker_qt', (0, 0))[1] / 1000
+
+
+@functools.lru_cache(maxsize=None)
+def fastest(runs=RUNS):
+    return min((measure() for _ in range(runs)), key=total_ms)
+
+
+def eager_modules(modules):
+    return sorted(name for name in modules
+                  if any(name == lazy or name.startswith(lazy + '.') for lazy in LAZY_MODULES))
+
+
+def test_import_within_budget():
+    total = total_ms(fastest())
+    assert total <= BUDGET_MS, f"Billtracker_qt imported in {total:.1f} ms, budget {BUDGET_MS:.0f} ms"
+
+
+def test_lazy_modules_not_imported():
+    eager = eager_modules(fastest())
+    assert not eager, "Imported eagerly: " + ", ".join(eager)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget', type=float, default=BUDGET_MS,
+                        help='maximum cumulative import time in ms')
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    modules = fastest()
+    total = total_ms(modules)
+
+    print(f"Billtracker_qt imported in {total:.1f} ms (budget {args.budget:.0f} ms, best of {RUNS})")
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (self_us, cumulative_us) in slowest[:args.top]:
+        print(f"  {name:<45} self {self_us / 1000:7.1f} ms   "
+              f"cumulative {cumulative_us / 1000:7.1f} ms")
+
+    failed = False
+    eager = eager_modules(modules)
+    if eager:
+        print("Imported eagerly: " + ", ".join(eager))
+        failed = True
+    if total > args.budget:
+        print(f"Over budget by {total - args.budget:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Tests for RateProviderRegistry.race against local stand-in rate providers.
+
+Covers the first valid answer winning, slow and failing providers not
+holding up the result, every provider failing (the error path APIThread
+reports), and the losing requests being cancelled.
+
+Run with: python -m pytest -q test_rate_providers.py
+"""
+import json
+import os
+import select
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+
+import Billtracker_qt as bt
+
+RATES = {'rates': {'EUR': 0.9, 'GBP': 0.8}, 'base': 'USD'}
+
+
+class StubProvider:
+    """Local rate endpoint answering after delay seconds.
+
+    While waiting it watches the connection, so a client that gives up is
+    noticed at once (disconnected is set) instead of after the delay.
+    """
+
+    def __init__(self, delay=0.0, status=200, body=RATES):
+        self.hits = 0
+        self.disconnected = threading.Event()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub.hits += 1
+                readable, _, _ = select.select([self.connection], [], [], delay)
+                if readable and not self.connection.recv(1):
+                    stub.disconnected.set()
+                    return
+                data = json.dumps(body).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except OSError:
+                    stub.disconnected.set()
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/latest"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stubs():
+    started = []
+
+    def start(*args, **kwargs):
+        stub = StubProvider(*args, **kwargs)
+        started.append(stub)
+        return stub
+
+    yield start
+    for stub in started:
+        stub.close()
+
+
+def eventually(predicate, timeout=2.0):
+    """Workers record their outcome just after handing in the answer."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def registry(**providers):
+    reg = bt.RateProviderRegistry()
+    for name, stub in providers.items():
+        reg.register(bt.RateProvider(name, stub.url))
+    return reg
+
+
+def test_first_valid_answer_wins(stubs):
+    fast = stubs(delay=0.05)
+    slower = stubs(delay=0.5, body={'rates': {'EUR': 0.5}, 'base': 'USD'})
+    data, names = registry(slower=slower, fast=fast).race(timeout=5)
+    assert names == ['fast']
+    assert data['conversion_rates'] == RATES['rates']
+    assert data['base_code'] == 'USD'
+
+
+def test_hanging_provider_does_not_block(stubs):
+    hanging = stubs(delay=10)
+    fast = stubs(delay=0.05)
+    start = time.perf_counter()
+    data, names = registry(hanging=hanging, fast=fast).race(timeout=10)
+    assert names == ['fast']
+    assert time.perf_counter() - start < 2
+
+
+def test_failing_providers_do_not_block(stubs):
+    broken = stubs(status=500)
+    empty = stubs(body={'success': False})
+    good = stubs(delay=0.2)
+    reg = registry(broken=broken, empty=empty, good=good)
+    data, names = reg.race(timeout=5)
+    assert names == ['good'] and data['conversion_rates'] == RATES['rates']
+    # the failures count against their providers
+    assert eventually(lambda: sorted(p.name for p in reg.providers() if p.failures) == ['broken', 'empty'])
+
+
+def test_all_failing_returns_nothing(stubs):
+    reg = registry(broken=stubs(status=500), empty=stubs(body={'success': False}))
+    assert reg.race(timeout=2) == (None, [])
+    assert eventually(lambda: all(p.failures == 1 for p in reg.providers()))
+
+
+def test_api_thread_reports_error_when_all_fail(stubs):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    reg = registry(broken=stubs(status=500), hanging=stubs(delay=10))
+    results = []
+    thread = bt.APIThread(reg, timeout=1)
+    thread.finished.connect(results.append)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not results and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    thread.wait()
+    assert results == [{'status': 'error', 'message': bt.STRINGS["network_error"]}]
+
+
+def test_losing_requests_are_cancelled(stubs):
+    hanging = stubs(delay=10)
+    fast = stubs(delay=0.2)
+    reg = registry(hanging=hanging, fast=fast)
+    start = time.perf_counter()
+    data, names = reg.race(timeout=10)
+    elapsed = time.perf_counter() - start
+    assert names == ['fast']
+    assert hanging.disconnected.wait(2)  # the loser's connection was closed
+    assert hanging.hits == 1
+    loser = next(p for p in reg.providers() if p.name == 'hanging')
+    assert eventually(lambda: loser.latency is not None)
+    assert loser.failures == 0  # cancelled, not failed
+    assert loser.latency == pytest.approx(elapsed, abs=0.5)
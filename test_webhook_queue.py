@@ -0,0 +1,171 @@
+"""
+Tests for WebhookQueue delivery against a local stand-in HTTP server.
+
+Covers successful delivery, retries after a 5xx answer or a refused
+connection, giving up after MAX_ATTEMPTS, and the Settings "Test" button,
+which sends through the window's queue.
+
+Run with: python -m pytest -q test_webhook_queue.py
+"""
+import json
+import os
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtWidgets import QApplication, QMessageBox, QWidget
+
+import Billtracker_qt as bt
+
+
+class StubWebhook:
+    """Local webhook endpoint answering with the next status from a script."""
+
+    def __init__(self, statuses=(), port=0):
+        self.statuses = list(statuses)  # consumed per request; 204 once empty
+        self.received = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                stub.received.append(json.loads(body)['content'])
+                status = stub.statuses.pop(0) if stub.statuses else 204
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hook"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def free_port():
+    """A localhost port nothing listens on."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_for(app, predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def queue(app, tmp_path):
+    q = bt.WebhookQueue(str(tmp_path / 'webhook_queue.json'))
+    q.BASE_DELAY = 0.05  # keep retries fast
+    results = []
+    q.delivered.connect(lambda delivery_id, ok, detail: results.append((delivery_id, ok, detail)))
+    q.results = results
+    yield q
+    q.stop()
+
+
+def test_delivers_to_target(app, queue):
+    stub = StubWebhook()
+    try:
+        queue.set_target(stub.url)
+        delivery_id = queue.send("bills due")
+        assert wait_for(app, lambda: queue.results)
+        assert queue.results == [(delivery_id, True, "HTTP 204")]
+        assert stub.received == ["bills due"]
+        assert queue.pending() == 0
+    finally:
+        stub.close()
+
+
+def test_retries_after_server_error(app, queue):
+    stub = StubWebhook([500, 503])
+    try:
+        queue.set_target(stub.url)
+        queue.send("retry me")
+        assert wait_for(app, lambda: queue.results)
+        assert queue.results[0][1] is True
+        assert stub.received == ["retry me"] * 3
+    finally:
+        stub.close()
+
+
+def test_retries_after_refused_connection(app, queue):
+    queue.BASE_DELAY = 0.5
+    port = free_port()
+    queue.set_target(f"http://127.0.0.1:{port}/hook")
+    queue.send("back online")
+    assert wait_for(app, lambda: queue._entries and queue._entries[0]['attempts'] >= 1)
+    assert not queue.results  # refused, still queued for a retry
+    stub = StubWebhook(port=port)
+    try:
+        assert wait_for(app, lambda: queue.results)
+        assert queue.results[0][1] is True
+        assert stub.received == ["back online"]
+    finally:
+        stub.close()
+
+
+def test_gives_up_after_max_attempts(app, queue):
+    queue.MAX_ATTEMPTS = 3
+    stub = StubWebhook([500] * 10)
+    try:
+        queue.set_target(stub.url)
+        queue.send("never accepted")
+        assert wait_for(app, lambda: queue.results)
+        assert queue.results[0][1:] == (False, "HTTP 500")
+        assert len(stub.received) == 3
+        assert queue.pending() == 0
+    finally:
+        stub.close()
+
+
+def test_settings_test_button_uses_queue(app, tmp_path, monkeypatch):
+    shown = []
+    monkeypatch.setattr(QMessageBox, 'information', staticmethod(lambda *a, **k: shown.append(('ok', a[2]))))
+    monkeypatch.setattr(QMessageBox, 'critical', staticmethod(lambda *a, **k: shown.append(('error', a[2]))))
+
+    parent = QWidget()
+    parent.theme_manager = bt.ThemeManager()
+    parent.webhooks = bt.WebhookQueue(str(tmp_path / 'webhook_queue.json'), parent)
+    dialog = bt.SettingsDialog(parent, bt.DataManager(str(tmp_path / 'config')))
+    stub = StubWebhook([404])
+    try:
+        # A rejected test is reported once, without retries
+        dialog.webhook_input.setText(stub.url)
+        dialog.test_webhook()
+        assert not dialog.test_webhook_btn.isEnabled()
+        assert wait_for(app, lambda: shown)
+        assert shown.pop()[0] == 'error'
+        assert dialog.test_webhook_btn.isEnabled()
+
+        dialog.test_webhook()
+        assert wait_for(app, lambda: shown)
+        assert shown == [('ok', bt.STRINGS["msg_webhook_test_sent"])]
+        assert len(stub.received) == 2
+        assert not os.path.exists(tmp_path / 'webhook_queue.json')  # tests are never persisted
+    finally:
+        parent.webhooks.stop()
+        stub.close()